@@ -0,0 +1,101 @@
+"""Exclude 100 zones, one command at a time against the bulk helper.
+
+Compares, for 100 zones of which half are already excluded, the former
+behaviour of the Exclude All Zones button (one command per zone in sequence,
+then a refresh) with `async_set_zones_exclusion` at several concurrency limits.
+The panel is simulated by a client answering every command after `LATENCY`
+seconds, and counting the commands it received.
+
+Needs `homeassistant` and `inim_prime_api` installed.
+
+    python benchmarks/bulk_zones.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from inim_prime_api.models.zone import ZoneExclusionSetRequest
+
+from custom_components.inim_prime.helpers.bulk import async_set_zones_exclusion
+
+ZONES = 100
+LATENCY = 0.05
+CONCURRENCY_LIMITS = (1, 2, 4, 8)
+
+
+class SimulatedClient:
+    def __init__(self):
+        self.commands = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def set_zone_exclusion(self, request: ZoneExclusionSetRequest) -> None:
+        self.commands += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+        finally:
+            self.in_flight -= 1
+
+
+def create_coordinator() -> SimpleNamespace:
+    """Return the part of the zones coordinator used by the bulk helpers."""
+
+    async def async_request_refresh() -> None:
+        coordinator.refreshes += 1
+
+    coordinator = SimpleNamespace(
+        client = SimulatedClient(),
+        data = {
+            zone_id: SimpleNamespace(id = zone_id, excluded = zone_id % 2 == 0)
+            for zone_id in range(1, ZONES + 1)
+        },
+        stale_since = None,
+        refreshes = 0,
+        async_request_refresh = async_request_refresh,
+    )
+    return coordinator
+
+
+async def async_sequential(coordinator: SimpleNamespace) -> None:
+    for zone_id in coordinator.data:
+        await coordinator.client.set_zone_exclusion(ZoneExclusionSetRequest(zone_id = zone_id, exclude = True))
+    await coordinator.async_request_refresh()
+
+
+async def async_main() -> None:
+    print(f"{ZONES} zones, half already excluded, {LATENCY * 1000:.0f} ms per command")
+    print(f"{'run':>14} {'duration':>10} {'commands':>9} {'in flight':>10} {'refreshes':>10}")
+
+    runs = [("sequential", None)] + [(f"bulk, limit {limit}", limit) for limit in CONCURRENCY_LIMITS]
+    for name, limit in runs:
+        coordinator = create_coordinator()
+        start = time.monotonic()
+        if limit is None:
+            await async_sequential(coordinator)
+        else:
+            result = await async_set_zones_exclusion(
+                coordinator = coordinator,
+                zone_ids = list(coordinator.data),
+                exclude = True,
+                max_concurrent = limit,
+            )
+            assert len(result.changed) + len(result.skipped) == ZONES and not result.failed
+        duration = time.monotonic() - start
+
+        print(
+            f"{name:>14} "
+            f"{duration:>9.2f}s "
+            f"{coordinator.client.commands:>9} "
+            f"{coordinator.client.max_in_flight:>10} "
+            f"{coordinator.refreshes:>10}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
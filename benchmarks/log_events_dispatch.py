@@ -0,0 +1,135 @@
+"""Dispatch a burst of 100 log events through the log events entity.
+
+Measures how long the coordinator is held by `handle_events`, how long the
+background dispatch takes to fire every event, and the longest the event loop
+is kept busy meanwhile. Then queues a second burst and removes the entity at
+once, checking that every queued event is still fired.
+
+Only the dispatch of the entity runs: the state writes are counted, not
+written, since the entity is not added to a platform. Needs `homeassistant`
+and `inim_prime_api` installed.
+
+    python benchmarks/log_events_dispatch.py
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant
+from inim_prime_api.models.log_event import LogEvent
+
+from custom_components.inim_prime.const import EVENT_PANEL_LOG_EVENT, EVENT_PANEL_LOG_EVENTS_BATCH
+from custom_components.inim_prime.entities.panel import PanelLogEventsEvent
+
+BURST = 100
+TICK = 0.001
+
+
+def create_log_events(count: int, first_id: int = 1) -> list[LogEvent]:
+    start = datetime.now()
+    return [
+        LogEvent(
+            id = first_id + index,
+            timestamp = start + timedelta(seconds = index),
+            type = "Zone alarm",
+            agent = "Keypad 1",
+            location = f"Zone {index % 8 + 1}",
+            value = None,
+        )
+        for index in range(count)
+    ]
+
+
+def create_entity(hass: HomeAssistant) -> tuple[PanelLogEventsEvent, dict]:
+    """Return the entity, not added to a platform, and the counters of its dispatch."""
+    counters = {"events": 0, "batches": 0, "state_writes": 0}
+
+    entity = PanelLogEventsEvent.__new__(PanelLogEventsEvent)
+    entity.hass = hass
+    entity.entity_id = "event.inim_prime_panel_log_events"
+    entity.coordinator = SimpleNamespace(
+        config_entry = SimpleNamespace(
+            async_create_background_task = lambda hass, target, name: hass.async_create_background_task(target, name),
+        ),
+    )
+    entity._serial_number = "benchmark"
+    entity._dispatch_queue = deque()
+    entity._dispatch_task = None
+    entity._trigger_event = lambda event_type, event_attributes: None
+
+    def async_write_ha_state() -> None:
+        counters["state_writes"] += 1
+
+    entity.async_write_ha_state = async_write_ha_state
+    return entity, counters
+
+
+async def async_measure_loop_stall(stop: asyncio.Event) -> float:
+    """Return the longest delay of a `TICK` sleep until `stop` is set."""
+    longest = 0.0
+    while not stop.is_set():
+        start = time.monotonic()
+        await asyncio.sleep(TICK)
+        longest = max(longest, time.monotonic() - start - TICK)
+    return longest
+
+
+async def async_main() -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entity, counters = create_entity(hass)
+
+        dispatched = asyncio.Event()
+
+        def on_event(event) -> None:
+            counters["events"] += 1
+
+        def on_batch(event) -> None:
+            counters["batches"] += 1
+            dispatched.set()
+
+        hass.bus.async_listen(EVENT_PANEL_LOG_EVENT, on_event)
+        hass.bus.async_listen(EVENT_PANEL_LOG_EVENTS_BATCH, on_batch)
+
+        # A burst dispatched in the background
+        stop = asyncio.Event()
+        stall = asyncio.create_task(async_measure_loop_stall(stop))
+        await asyncio.sleep(TICK)
+
+        start = time.monotonic()
+        await entity.handle_events(create_log_events(BURST))
+        handle_time = time.monotonic() - start
+
+        await dispatched.wait()
+        await hass.async_block_till_done()
+        dispatch_time = time.monotonic() - start
+        stop.set()
+        longest_stall = await stall
+
+        print(f"Burst of {BURST} log events")
+        print(f"  handle_events returned in {handle_time * 1000:.3f} ms")
+        print(f"  dispatched in {dispatch_time * 1000:.3f} ms")
+        print(f"  longest event loop stall {longest_stall * 1000:.3f} ms")
+        print(f"  fired {counters['events']} events, {counters['batches']} batch, {counters['state_writes']} state writes")
+
+        # A burst still queued when the entity is removed
+        counters.update(events = 0, batches = 0, state_writes = 0)
+        await entity.handle_events(create_log_events(BURST, first_id = BURST + 1))
+        await entity.async_will_remove_from_hass()
+        await hass.async_block_till_done()
+
+        print(f"Burst of {BURST} log events, entity removed at once")
+        print(f"  fired {counters['events']} events, {counters['batches']} batch")
+
+        await hass.async_stop(force = True)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,127 @@
+"""Compare the zones coordinator data with a compact array-backed zone store.
+
+Measures, at 50, 200 and 1000 zones, the memory retained by the dict of
+`ZoneStatus` kept by the zones coordinator and by fixed-width arrays indexed by
+zone slot (one byte of state, one byte of flags), the allocations of a poll
+(a new dict from the API against an in-place update of the arrays), and the cost
+of reading a field.
+
+Uses the `inim_prime_api` models when installed, a dataclass with the same
+fields otherwise (reported in the output).
+
+    python benchmarks/zone_store.py
+"""
+import enum
+import timeit
+import tracemalloc
+from array import array
+from dataclasses import dataclass
+
+try:
+    from inim_prime_api.models.zone import ZoneState, ZoneStatus
+
+    MODELS = "inim_prime_api"
+except ImportError:
+    MODELS = "stand-in dataclass"
+
+    class ZoneState(enum.Enum):
+        READY = 0
+        ALARM = 1
+        TAMPER = 2
+        SHORT = 3
+
+    @dataclass(frozen = True)
+    class ZoneStatus:
+        id: int
+        name: str
+        state: ZoneState
+        excluded: bool
+        alarm_memory: bool
+
+ZONE_COUNTS = (50, 200, 1000)
+READS = 200
+
+_STATES = tuple(ZoneState)
+_STATE_INDEXES = {state: index for index, state in enumerate(_STATES)}
+_EXCLUDED = 0x01
+_ALARM_MEMORY = 0x02
+
+
+class ArrayZoneStore:
+    def __init__(self):
+        self.slots = {}
+        self.states = array("B")
+        self.flags = bytearray()
+
+    def update(self, zones):
+        for zone_id, zone in zones.items():
+            slot = self.slots.get(zone_id)
+            if slot is None:
+                slot = self.slots[zone_id] = len(self.states)
+                self.states.append(0)
+                self.flags.append(0)
+            self.states[slot] = _STATE_INDEXES[zone.state]
+            self.flags[slot] = (_EXCLUDED if zone.excluded else 0) | (_ALARM_MEMORY if zone.alarm_memory else 0)
+
+
+def fetch_zones(count: int, shift: int = 0) -> dict:
+    """Return what a poll of the panel returns, a new dict of new statuses."""
+    states = (ZoneState.READY, ZoneState.ALARM)
+    return {
+        zone_id: ZoneStatus(
+            id = zone_id,
+            name = f"Zone {zone_id}",
+            state = states[(zone_id + shift) % 2],
+            excluded = (zone_id + shift) % 3 == 0,
+            alarm_memory = False,
+        )
+        for zone_id in range(1, count + 1)
+    }
+
+
+def traced(function):
+    """Return the result of `function`, the memory it retained and its peak."""
+    tracemalloc.start()
+    result = function()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def main() -> None:
+    print(f"Models: {MODELS}")
+    print(f"{'zones':>6} {'dict':>10} {'arrays':>10} {'poll dict':>10} {'poll arrays':>12} {'read dict':>10} {'read arrays':>12}")
+
+    for count in ZONE_COUNTS:
+        zones, dict_size, _ = traced(lambda: fetch_zones(count))
+
+        store = ArrayZoneStore()
+        _, store_size, _ = traced(lambda: store.update(zones))
+
+        polled = fetch_zones(count, shift = 1)
+        _, _, poll_dict_peak = traced(lambda: fetch_zones(count, shift = 1))
+        _, _, poll_store_peak = traced(lambda: store.update(polled))
+
+        zone_ids = list(zones)
+        slots = [store.slots[zone_id] for zone_id in zone_ids]
+        read_dict = timeit.timeit(lambda: [zones[zone_id].excluded for zone_id in zone_ids], number = READS)
+        read_store = timeit.timeit(lambda: [bool(store.flags[slot] & _EXCLUDED) for slot in slots], number = READS)
+
+        print(
+            f"{count:>6} "
+            f"{dict_size / 1024:>8.1f}kB "
+            f"{store_size / 1024:>8.1f}kB "
+            f"{poll_dict_peak / 1024:>8.1f}kB "
+            f"{poll_store_peak:>11}B "
+            f"{read_dict / READS / count * 1e9:>8.0f}ns "
+            f"{read_store / READS / count * 1e9:>10.0f}ns"
+        )
+
+    print(
+        "The client returns a new dict of statuses at every poll, which the commands, the "
+        "projections and the snapshot need: the arrays can only be kept in addition to it."
+    )
+
+
+if __name__ == "__main__":
+    main()
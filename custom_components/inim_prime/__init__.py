@@ -1,11 +1,14 @@
+import asyncio
+import copy
+import logging
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from inim_prime_api import InimPrimeClient
 from .const import (
     CONF_SERIAL_NUMBER,
     DOMAIN,
@@ -18,19 +21,39 @@ from .const import (
     GSM_COORDINATOR,
     SYSTEM_FAULTS_COORDINATOR,
 
-    # --- Scan interval config keys ---
-    CONF_ZONES_SCAN_INTERVAL,
-    CONF_PARTITIONS_SCAN_INTERVAL,
-    CONF_GSM_SCAN_INTERVAL,
-    CONF_SYSTEM_FAULTS_SCAN_INTERVAL,
-    CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL,
-
-    # --- Defaults (custom per coordinator) ---
-    CONF_ZONES_SCAN_INTERVAL_DEFAULT,
-    CONF_PARTITIONS_SCAN_INTERVAL_DEFAULT,
-    CONF_GSM_SCAN_INTERVAL_DEFAULT,
-    CONF_SYSTEM_FAULTS_SCAN_INTERVAL_DEFAULT,
-    CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL_DEFAULT,
+    # --- Poll scheduler request budget ---
+    CONF_POLL_REQUESTS_PER_SECOND,
+    CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+    CONF_POLL_MAX_IN_FLIGHT,
+    CONF_POLL_MAX_IN_FLIGHT_DEFAULT,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES_DEFAULT,
+
+    # --- Adaptive polling ---
+    CONF_ADAPTIVE_POLLING,
+    CONF_ADAPTIVE_POLLING_DEFAULT,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+    CONF_ADAPTIVE_QUIET_PERIOD,
+    CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+
+    # --- Alarm watch ---
+    CONF_ALARM_WATCH,
+    CONF_ALARM_WATCH_DEFAULT,
+    CONF_ALARM_WATCH_INTERVAL,
+    CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+
+    # --- Event-driven refresh ---
+    CONF_LOG_EVENT_REFRESH,
+    CONF_LOG_EVENT_REFRESH_DEFAULT,
+
+    # --- Log event projection ---
+    CONF_LOG_EVENT_PROJECTION,
+    CONF_LOG_EVENT_PROJECTION_DEFAULT,
+
+    # --- Stale-while-revalidate ---
+    CONF_CIRCUIT_BREAKER_THRESHOLD,
+    CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT,
 )
 from .coordinators import (
     InimPrimeGSMUpdateCoordinator,
@@ -38,7 +61,19 @@ from .coordinators import (
     InimPrimeZonesUpdateCoordinator,
     InimPrimePanelLogEventsCoordinator,
     InimPrimeSystemFaultsUpdateCoordinator,
+    InimPrimePollScheduler,
+    InimPrimeAdaptivePolling,
+    InimPrimeAlarmWatch,
 )
+from .helpers.client import InimPrimeCoalescingClient, PriorityRequestQueue
+from .helpers.connection import ConnectionStats, async_create_client
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
+from .helpers.log_event_projection import InimPrimeLogEventProjector
+from .helpers.options import async_apply_options, get_scan_intervals, requires_reload
+from .helpers.snapshot import InimPrimeSnapshotStore
+from .services import async_setup_services
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [
     "binary_sensor",
@@ -49,12 +84,20 @@ PLATFORMS = [
     "event",
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the INIM Prime services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up INIM Prime integration."""
     hass.data.setdefault(DOMAIN, {})
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_entry))
 
 
     # --- Register the panel device ---
@@ -72,81 +115,182 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api_key = entry.data["api_key"]
     use_https = entry.data.get("use_https", True)
 
-    client = InimPrimeClient(host = host, api_key = api_key, use_https = use_https)
-    await client.connect()
+    # A single client, and so a single pool of kept-alive connections, for the whole
+    # entry. The connection opened by the config flow is reused when available.
+    connection_stats = ConnectionStats()
+    inim_prime_client = await async_create_client(
+        hass,
+        host = host,
+        api_key = api_key,
+        use_https = use_https,
+        stats = connection_stats,
+    )
+
+    polling = entry.options.get("polling", {})
+    resilience = entry.options.get("resilience", {})
+
+    # Shared by every coordinator and entity, collapses concurrent identical reads
+    # and sends the user commands before the background polls.
+    client = InimPrimeCoalescingClient(
+        client = inim_prime_client,
+        request_queue = PriorityRequestQueue(
+            max_in_flight = polling.get(
+                CONF_POLL_MAX_IN_FLIGHT,
+                CONF_POLL_MAX_IN_FLIGHT_DEFAULT,
+            ),
+        ),
+    )
 
     ###
     ### Coordinators
     ###
 
-    scan_intervals = entry.options.get("scan_intervals", {})
+    scan_intervals = get_scan_intervals(entry)
 
-    zones_scan_interval = scan_intervals.get(
-        CONF_ZONES_SCAN_INTERVAL,
-        CONF_ZONES_SCAN_INTERVAL_DEFAULT,
-    )
-    partitions_scan_interval = scan_intervals.get(
-        CONF_PARTITIONS_SCAN_INTERVAL,
-        CONF_PARTITIONS_SCAN_INTERVAL_DEFAULT,
-    )
-    gsm_scan_interval = scan_intervals.get(
-        CONF_GSM_SCAN_INTERVAL,
-        CONF_GSM_SCAN_INTERVAL_DEFAULT,
-    )
-    system_faults_scan_interval = scan_intervals.get(
-        CONF_SYSTEM_FAULTS_SCAN_INTERVAL,
-        CONF_SYSTEM_FAULTS_SCAN_INTERVAL_DEFAULT,
-    )
-    panel_log_events_scan_interval = scan_intervals.get(
-        CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL,
-        CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL_DEFAULT,
+    # The poll scheduler owns the refresh timing of every coordinator, so the
+    # coordinators are created without an update interval and registered below.
+    poll_scheduler = InimPrimePollScheduler(
+        hass = hass,
+        entry = entry,
+        requests_per_second = polling.get(
+            CONF_POLL_REQUESTS_PER_SECOND,
+            CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+        ),
+        breaker_threshold = resilience.get(
+            CONF_CIRCUIT_BREAKER_THRESHOLD,
+            CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT,
+        ),
+        # The smallest answer of the panel
+        probe = client.get_system_faults_status,
     )
 
     inim_prime_coordinators = {
         ZONES_COORDINATOR: InimPrimeZonesUpdateCoordinator(
             hass = hass,
-            update_interval = timedelta(seconds = zones_scan_interval),
+            update_interval = None,
             entry = entry,
             client = client,
         ),
         PARTITIONS_COORDINATOR: InimPrimePartitionsUpdateCoordinator(
             hass = hass,
-            update_interval = timedelta(seconds = partitions_scan_interval),
+            update_interval = None,
             entry = entry,
             client = client,
         ),
         SYSTEM_FAULTS_COORDINATOR: InimPrimeSystemFaultsUpdateCoordinator(
             hass = hass,
-            update_interval = timedelta(seconds = system_faults_scan_interval),
+            update_interval = None,
             entry = entry,
             client = client,
         ),
         GSM_COORDINATOR: InimPrimeGSMUpdateCoordinator(
             hass = hass,
-            update_interval = timedelta(seconds = gsm_scan_interval),
+            update_interval = None,
             entry = entry,
             client = client,
         ),
         PANEL_LOG_EVENTS_COORDINATOR: InimPrimePanelLogEventsCoordinator(
             hass = hass,
-            update_interval = timedelta(seconds = panel_log_events_scan_interval),
+            update_interval = None,
             entry = entry,
             client = client,
         ),
     }
 
-    await inim_prime_coordinators[ZONES_COORDINATOR].async_config_entry_first_refresh()
-    await inim_prime_coordinators[PARTITIONS_COORDINATOR].async_config_entry_first_refresh()
-    await inim_prime_coordinators[SYSTEM_FAULTS_COORDINATOR].async_config_entry_first_refresh()
-    await inim_prime_coordinators[GSM_COORDINATOR].async_config_entry_first_refresh()
+    # Command confirmations share the request budget of the scheduled polls.
+    for coordinator_key in (ZONES_COORDINATOR, PARTITIONS_COORDINATOR):
+        inim_prime_coordinators[coordinator_key].request_budget = poll_scheduler.budget
+
+    if polling.get(CONF_LOG_EVENT_REFRESH, CONF_LOG_EVENT_REFRESH_DEFAULT):
+        inim_prime_coordinators[PANEL_LOG_EVENTS_COORDINATOR].event_refresh_coordinators = {
+            coordinator_key: inim_prime_coordinators[coordinator_key]
+            for coordinator_key in (ZONES_COORDINATOR, PARTITIONS_COORDINATOR, SYSTEM_FAULTS_COORDINATOR)
+        }
+
+    if entry.options.get("experimental", {}).get(CONF_LOG_EVENT_PROJECTION, CONF_LOG_EVENT_PROJECTION_DEFAULT):
+        inim_prime_coordinators[PANEL_LOG_EVENTS_COORDINATOR].log_event_projector = InimPrimeLogEventProjector(
+            zones_coordinator = inim_prime_coordinators[ZONES_COORDINATOR],
+            partitions_coordinator = inim_prime_coordinators[PARTITIONS_COORDINATOR],
+        )
+
+    # Registration order defines the stagger order: zones first, GSM last.
+    for coordinator_key in (
+            ZONES_COORDINATOR,
+            PARTITIONS_COORDINATOR,
+            SYSTEM_FAULTS_COORDINATOR,
+            PANEL_LOG_EVENTS_COORDINATOR,
+            GSM_COORDINATOR,
+    ):
+        poll_scheduler.register(
+            inim_prime_coordinators[coordinator_key],
+            timedelta(seconds = scan_intervals[coordinator_key]),
+        )
+
+    ###
+    ### First refresh
+    ###
+
+    # Restore the last good snapshot: if available, the entities are created from it
+    # right away (marked stale) and the live data is fetched in the background.
+    snapshot_store = InimPrimeSnapshotStore(
+        hass = hass,
+        entry = entry,
+        coordinators = inim_prime_coordinators,
+    )
+    warm_start = await snapshot_store.async_restore()
+
+    setup_stats = {
+        "warm_start": warm_start,
+        "first_refresh_duration": None,
+        "connection": connection_stats.as_dict(),
+    }
+    max_concurrent_refreshes = polling.get(
+        CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+        CONF_SETUP_MAX_CONCURRENT_REFRESHES_DEFAULT,
+    )
 
-    await inim_prime_coordinators[PANEL_LOG_EVENTS_COORDINATOR].async_startup()
-    await inim_prime_coordinators[PANEL_LOG_EVENTS_COORDINATOR].async_config_entry_first_refresh()
+    if warm_start:
+        await inim_prime_coordinators[PANEL_LOG_EVENTS_COORDINATOR].async_startup()
+
+        entry.async_create_background_task(
+            hass,
+            async_first_refresh(
+                entry = entry,
+                coordinators = inim_prime_coordinators,
+                max_concurrent_refreshes = max_concurrent_refreshes,
+                setup_stats = setup_stats,
+                warm_start = True,
+            ),
+            name = f"{entry.title} - first refresh",
+        )
+    else:
+        await async_first_refresh(
+            entry = entry,
+            coordinators = inim_prime_coordinators,
+            max_concurrent_refreshes = max_concurrent_refreshes,
+            setup_stats = setup_stats,
+            warm_start = False,
+        )
 
+    entry.async_on_unload(snapshot_store.async_track_coordinators())
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "coordinators": inim_prime_coordinators,
+        "poll_scheduler": poll_scheduler,
+        "snapshot_store": snapshot_store,
+        "setup_stats": setup_stats,
+        # Compared with the updated entry to tell which changes can be applied in place.
+        "entry_data": dict(entry.data),
+        "options": copy.deepcopy(dict(entry.options)),
+        # Zones and partitions found or removed after the setup, see the platforms.
+        "entity_discovery": InimPrimeEntityDiscovery(
+            hass = hass,
+            entry = entry,
+            poll_scheduler = poll_scheduler,
+            zones_coordinator = inim_prime_coordinators[ZONES_COORDINATOR],
+            partitions_coordinator = inim_prime_coordinators[PARTITIONS_COORDINATOR],
+        ),
     }
 
     await hass.config_entries.async_forward_entry_setups(
@@ -154,9 +298,103 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         platforms = PLATFORMS,
     )
 
+    # Start polling only once all the entities are listening.
+    entry.async_on_unload(hass.data[DOMAIN][entry.entry_id]["entity_discovery"].async_start())
+    poll_scheduler.async_start()
+
+    if polling.get(CONF_ADAPTIVE_POLLING, CONF_ADAPTIVE_POLLING_DEFAULT):
+        adaptive_polling = InimPrimeAdaptivePolling(
+            poll_scheduler = poll_scheduler,
+            zones_coordinator = inim_prime_coordinators[ZONES_COORDINATOR],
+            partitions_coordinator = inim_prime_coordinators[PARTITIONS_COORDINATOR],
+            armed_scan_interval = polling.get(
+                CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+                CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+            ),
+            quiet_period = polling.get(
+                CONF_ADAPTIVE_QUIET_PERIOD,
+                CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+            ),
+        )
+        hass.data[DOMAIN][entry.entry_id]["adaptive_polling"] = adaptive_polling
+        entry.async_on_unload(adaptive_polling.async_start())
+
+    if polling.get(CONF_ALARM_WATCH, CONF_ALARM_WATCH_DEFAULT):
+        alarm_watch = InimPrimeAlarmWatch(
+            hass = hass,
+            entry = entry,
+            poll_scheduler = poll_scheduler,
+            partitions_coordinator = inim_prime_coordinators[PARTITIONS_COORDINATOR],
+            interval = polling.get(
+                CONF_ALARM_WATCH_INTERVAL,
+                CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+            ),
+        )
+        hass.data[DOMAIN][entry.entry_id]["alarm_watch"] = alarm_watch
+        entry.async_on_unload(alarm_watch.async_start())
+
     return True
 
 
+async def async_first_refresh(
+        entry: ConfigEntry,
+        coordinators: dict,
+        max_concurrent_refreshes: int,
+        setup_stats: dict,
+        warm_start: bool,
+) -> None:
+    """Run the first refresh of the coordinators concurrently."""
+    # The first refreshes are independent of each other, so they are run concurrently.
+    # The number of requests sent to the panel at the same time is capped, since some
+    # panels do not cope well with parallel requests.
+    refresh_semaphore = asyncio.Semaphore(max_concurrent_refreshes)
+
+    async def async_limited_refresh(coordinator) -> None:
+        async with refresh_semaphore:
+            if warm_start:
+                # The restored snapshot is already shown: failures are only logged
+                # and the data stays stale until the next scheduled refresh.
+                await coordinator.async_refresh()
+            else:
+                await coordinator.async_config_entry_first_refresh()
+
+    async def async_panel_log_events_first_refresh() -> None:
+        # Loading the Store does not involve the panel, only the refresh is limited.
+        panel_log_events_coordinator = coordinators[PANEL_LOG_EVENTS_COORDINATOR]
+        await panel_log_events_coordinator.async_startup()
+        async with refresh_semaphore:
+            await panel_log_events_coordinator.async_config_entry_first_refresh()
+
+    refreshes = [
+        async_limited_refresh(coordinators[ZONES_COORDINATOR]),
+        async_limited_refresh(coordinators[PARTITIONS_COORDINATOR]),
+        async_limited_refresh(coordinators[SYSTEM_FAULTS_COORDINATOR]),
+        async_limited_refresh(coordinators[GSM_COORDINATOR]),
+    ]
+
+    # On a warm start the log events Store is loaded during setup, and the log events
+    # are not fetched before the event entity exists anyway.
+    if not warm_start:
+        refreshes.append(async_panel_log_events_first_refresh())
+
+    first_refresh_start = time.monotonic()
+
+    results = await asyncio.gather(*refreshes, return_exceptions = True)
+
+    # Wait for every refresh to complete before failing, so that no refresh is left running.
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    setup_stats["first_refresh_duration"] = time.monotonic() - first_refresh_start
+    _LOGGER.debug(
+        "First refresh of %s completed in %.3f seconds (warm start: %s)",
+        entry.title,
+        setup_stats["first_refresh_duration"],
+        warm_start,
+    )
+
+
 async def async_remove_config_entry_device(
         hass: HomeAssistant,
         config_entry: ConfigEntry,
@@ -171,6 +409,30 @@ async def async_remove_config_entry_device(
     return True
 
 
+async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the updated options in place, reload only when required."""
+    data = hass.data[DOMAIN].get(entry.entry_id)
+    start = time.monotonic()
+
+    if data is None or requires_reload(data["entry_data"], data["options"], entry):
+        await async_reload_entry(hass, entry)
+        _LOGGER.debug(
+            "Options of %s applied by reloading in %.3f seconds",
+            entry.title,
+            time.monotonic() - start,
+        )
+        return
+
+    async_apply_options(hass, entry)
+    data["options"] = copy.deepcopy(dict(entry.options))
+
+    _LOGGER.debug(
+        "Options of %s applied in place in %.3f seconds",
+        entry.title,
+        time.monotonic() - start,
+    )
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload INIM Prime config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -186,6 +448,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Stop the poll scheduler before the coordinators
+        data["poll_scheduler"].async_stop()
+
         # Stop coordinators (optional but recommended)
         inim_prime_coordinators = data.get("coordinators", {})
 
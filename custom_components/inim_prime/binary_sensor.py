@@ -3,6 +3,7 @@ from .const import DOMAIN, ZONES_COORDINATOR, PARTITIONS_COORDINATOR, SYSTEM_FAU
 from .entities.panel import SystemFaultBinarySensor
 from .entities.partition import PartitionAlarmMemoryBinarySensor
 from .entities.zone import ZoneStateBinarySensor, ZoneAlarmMemoryBinarySensor
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
 from inim_prime_api.models.system_faults import EXPOSED_SYSTEM_FAULTS
 
 
@@ -12,19 +13,28 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
     zones_coordinator: InimPrimeZonesUpdateCoordinator = coordinators[ZONES_COORDINATOR]
     partitions_coordinator: InimPrimePartitionsUpdateCoordinator = coordinators[PARTITIONS_COORDINATOR]
     system_faults_coordinator: InimPrimeSystemFaultsUpdateCoordinator = coordinators[SYSTEM_FAULTS_COORDINATOR]
+    entity_discovery: InimPrimeEntityDiscovery = hass.data[DOMAIN][entry.entry_id]["entity_discovery"]
 
-    entities = []
-
-    for zone in zones_coordinator.data.values():
-        entities.append(ZoneStateBinarySensor(zones_coordinator, entry, zone))
-        entities.append(ZoneAlarmMemoryBinarySensor(zones_coordinator, entry, zone))
+    # Zone and partition binary sensors, also added for the zones and partitions found later
+    entity_discovery.async_add_platform(
+        ZONES_COORDINATOR,
+        async_add_entities,
+        lambda zone: [
+            ZoneStateBinarySensor(zones_coordinator, entry, zone),
+            ZoneAlarmMemoryBinarySensor(zones_coordinator, entry, zone),
+        ],
+    )
+    entity_discovery.async_add_platform(
+        PARTITIONS_COORDINATOR,
+        async_add_entities,
+        lambda partition: [PartitionAlarmMemoryBinarySensor(partitions_coordinator, entry, partition)],
+    )
 
-    for partition in partitions_coordinator.data.values():
-        entities.append(PartitionAlarmMemoryBinarySensor(partitions_coordinator, entry, partition))
+    entities = []
 
     for exposedSystemFault in EXPOSED_SYSTEM_FAULTS:
         entities.append(
             SystemFaultBinarySensor(system_faults_coordinator, entry, exposedSystemFault)
         )
 
-    async_add_entities(entities, update_before_add = True)
+    async_add_entities(entities)
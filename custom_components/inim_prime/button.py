@@ -2,6 +2,7 @@ from .coordinators import InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUp
 from .const import DOMAIN, ZONES_COORDINATOR, PARTITIONS_COORDINATOR
 from .entities.panel import IncludeAllZonesButton, ClearAllPartitionsAlarmMemoryButton
 from .entities.partition import ClearPartitionAlarmMemoryButton
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -9,13 +10,18 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     partitions_coordinator: InimPrimePartitionsUpdateCoordinator = coordinators[PARTITIONS_COORDINATOR]
     zones_coordinator: InimPrimeZonesUpdateCoordinator = coordinators[ZONES_COORDINATOR]
+    entity_discovery: InimPrimeEntityDiscovery = hass.data[DOMAIN][entry.entry_id]["entity_discovery"]
 
-    entities = []
+    # Also added for the partitions found later
+    entity_discovery.async_add_platform(
+        PARTITIONS_COORDINATOR,
+        async_add_entities,
+        lambda partition: [ClearPartitionAlarmMemoryButton(partitions_coordinator, entry, partition)],
+    )
 
-    for partition in partitions_coordinator.data.values():
-        entities.append(ClearPartitionAlarmMemoryButton(partitions_coordinator, entry, partition))
+    entities = []
 
     entities.append(IncludeAllZonesButton(zones_coordinator, entry))
     entities.append(ClearAllPartitionsAlarmMemoryButton(partitions_coordinator, entry))
 
-    async_add_entities(entities, update_before_add = True)
\ No newline at end of file
+    async_add_entities(entities)
\ No newline at end of file
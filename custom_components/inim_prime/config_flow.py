@@ -5,9 +5,10 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
-from homeassistant.helpers.selector import TextSelector, TextSelectorType, TextSelectorConfig
+from homeassistant.helpers.selector import TextSelector, TextSelectorType, TextSelectorConfig, ObjectSelector
 
-from inim_prime_api import InimPrimeClient
+from .helpers.arming_profiles import ARMING_PROFILES_SCHEMA
+from .helpers.connection import async_create_client, async_hand_over_client
 from .const import (
     CONF_HOST,
     CONF_API_KEY,
@@ -20,6 +21,69 @@ from .const import (
     CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
     CONF_SCAN_INTERVAL_MIN,
     CONF_SCAN_INTERVAL_MAX,
+    CONF_ARMING_PROFILES,
+
+    # --- Poll scheduler request budget ---
+    CONF_POLL_REQUESTS_PER_SECOND,
+    CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+    CONF_POLL_REQUESTS_PER_SECOND_MIN,
+    CONF_POLL_REQUESTS_PER_SECOND_MAX,
+    CONF_POLL_MAX_IN_FLIGHT,
+    CONF_POLL_MAX_IN_FLIGHT_DEFAULT,
+    CONF_POLL_MAX_IN_FLIGHT_MIN,
+    CONF_POLL_MAX_IN_FLIGHT_MAX,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES_DEFAULT,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES_MIN,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES_MAX,
+    CONF_BULK_MAX_CONCURRENT_WRITES,
+    CONF_BULK_MAX_CONCURRENT_WRITES_DEFAULT,
+    CONF_BULK_MAX_CONCURRENT_WRITES_MIN,
+    CONF_BULK_MAX_CONCURRENT_WRITES_MAX,
+
+    # --- Adaptive polling ---
+    CONF_ADAPTIVE_POLLING,
+    CONF_ADAPTIVE_POLLING_DEFAULT,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+    CONF_ADAPTIVE_QUIET_PERIOD,
+    CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+    CONF_ADAPTIVE_QUIET_PERIOD_MIN,
+    CONF_ADAPTIVE_QUIET_PERIOD_MAX,
+
+    # --- Alarm watch ---
+    CONF_ALARM_WATCH,
+    CONF_ALARM_WATCH_DEFAULT,
+    CONF_ALARM_WATCH_INTERVAL,
+    CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+    CONF_ALARM_WATCH_INTERVAL_MIN,
+    CONF_ALARM_WATCH_INTERVAL_MAX,
+
+    # --- Event-driven refresh ---
+    CONF_LOG_EVENT_REFRESH,
+    CONF_LOG_EVENT_REFRESH_DEFAULT,
+    CONF_LOG_EVENT_REFRESH_STRETCH,
+    CONF_LOG_EVENT_REFRESH_STRETCH_DEFAULT,
+    CONF_LOG_EVENT_REFRESH_STRETCH_MIN,
+    CONF_LOG_EVENT_REFRESH_STRETCH_MAX,
+
+    # --- Log event projection ---
+    CONF_LOG_EVENT_PROJECTION,
+    CONF_LOG_EVENT_PROJECTION_DEFAULT,
+
+    # --- Stale-while-revalidate ---
+    CONF_STALE_MAX_FAILURES,
+    CONF_STALE_MAX_FAILURES_DEFAULT,
+    CONF_STALE_MAX_FAILURES_MIN,
+    CONF_STALE_MAX_FAILURES_MAX,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_AGE_DEFAULT,
+    CONF_STALE_MAX_AGE_MIN,
+    CONF_STALE_MAX_AGE_MAX,
+    CONF_CIRCUIT_BREAKER_THRESHOLD,
+    CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT,
+    CONF_CIRCUIT_BREAKER_THRESHOLD_MIN,
+    CONF_CIRCUIT_BREAKER_THRESHOLD_MAX,
 
     # --- Scan interval config keys ---
     CONF_ZONES_SCAN_INTERVAL,
@@ -75,6 +139,22 @@ def build_optional_schema(
         default_gsm_scan_interval: int | None = None,
         default_system_faults_scan_interval: int | None = None,
         default_panel_log_events_scan_interval: int | None = None,
+        default_poll_requests_per_second: float | None = None,
+        default_poll_max_in_flight: int | None = None,
+        default_setup_max_concurrent_refreshes: int | None = None,
+        default_bulk_max_concurrent_writes: int | None = None,
+        default_adaptive_polling: bool | None = None,
+        default_adaptive_armed_scan_interval: int | None = None,
+        default_adaptive_quiet_period: int | None = None,
+        default_alarm_watch: bool | None = None,
+        default_alarm_watch_interval: float | None = None,
+        default_log_event_refresh: bool | None = None,
+        default_log_event_refresh_stretch: int | None = None,
+        default_log_event_projection: bool | None = None,
+        default_stale_max_failures: int | None = None,
+        default_stale_max_age: int | None = None,
+        default_circuit_breaker_threshold: int | None = None,
+        default_arming_profiles: dict | None = None,
 ) -> dict:
     """Build the connection schema with optional defaults."""
     schema: dict = {
@@ -142,11 +222,201 @@ def build_optional_schema(
                 }
             ),
         ),
+        vol.Required("polling"): section(
+            vol.Schema(
+                {
+                    # Requests per second sent by the poll scheduler
+                    vol.Required(
+                        CONF_POLL_REQUESTS_PER_SECOND,
+                        default = default_poll_requests_per_second or CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(
+                            min = CONF_POLL_REQUESTS_PER_SECOND_MIN,
+                            max = CONF_POLL_REQUESTS_PER_SECOND_MAX,
+                        ),
+                    ),
+
+                    # Maximum concurrent requests sent by the poll scheduler
+                    vol.Required(
+                        CONF_POLL_MAX_IN_FLIGHT,
+                        default = default_poll_max_in_flight or CONF_POLL_MAX_IN_FLIGHT_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_POLL_MAX_IN_FLIGHT_MIN,
+                            max = CONF_POLL_MAX_IN_FLIGHT_MAX,
+                        ),
+                    ),
+
+                    # Maximum concurrent first refreshes during setup
+                    vol.Required(
+                        CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+                        default = default_setup_max_concurrent_refreshes or CONF_SETUP_MAX_CONCURRENT_REFRESHES_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_SETUP_MAX_CONCURRENT_REFRESHES_MIN,
+                            max = CONF_SETUP_MAX_CONCURRENT_REFRESHES_MAX,
+                        ),
+                    ),
+
+                    # Adaptive polling of zones and partitions
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default = CONF_ADAPTIVE_POLLING_DEFAULT if default_adaptive_polling is None else default_adaptive_polling,
+                    ): bool,
+
+                    # Zones and partitions scan interval while armed or active
+                    vol.Required(
+                        CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+                        default = default_adaptive_armed_scan_interval or CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(min = CONF_SCAN_INTERVAL_MIN, max = CONF_SCAN_INTERVAL_MAX),
+                    ),
+
+                    # Time without activity before relaxing the scan intervals
+                    vol.Required(
+                        CONF_ADAPTIVE_QUIET_PERIOD,
+                        default = default_adaptive_quiet_period or CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_ADAPTIVE_QUIET_PERIOD_MIN,
+                            max = CONF_ADAPTIVE_QUIET_PERIOD_MAX,
+                        ),
+                    ),
+
+                    # Sub-second polling of the partitions while armed
+                    vol.Required(
+                        CONF_ALARM_WATCH,
+                        default = CONF_ALARM_WATCH_DEFAULT if default_alarm_watch is None else default_alarm_watch,
+                    ): bool,
+
+                    # Partitions poll interval of the alarm watch, in seconds
+                    vol.Required(
+                        CONF_ALARM_WATCH_INTERVAL,
+                        default = default_alarm_watch_interval or CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(
+                            min = CONF_ALARM_WATCH_INTERVAL_MIN,
+                            max = CONF_ALARM_WATCH_INTERVAL_MAX,
+                        ),
+                    ),
+
+                    # Refresh zones, partitions and system faults when log events affect them
+                    vol.Required(
+                        CONF_LOG_EVENT_REFRESH,
+                        default = CONF_LOG_EVENT_REFRESH_DEFAULT if default_log_event_refresh is None else default_log_event_refresh,
+                    ): bool,
+
+                    # Factor applied to their scan intervals when refreshed by log events
+                    vol.Required(
+                        CONF_LOG_EVENT_REFRESH_STRETCH,
+                        default = default_log_event_refresh_stretch or CONF_LOG_EVENT_REFRESH_STRETCH_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_LOG_EVENT_REFRESH_STRETCH_MIN,
+                            max = CONF_LOG_EVENT_REFRESH_STRETCH_MAX,
+                        ),
+                    ),
+                }
+            ),
+        ),
+        vol.Required("resilience"): section(
+            vol.Schema(
+                {
+                    # Consecutive failures served from the last good data
+                    vol.Required(
+                        CONF_STALE_MAX_FAILURES,
+                        default = CONF_STALE_MAX_FAILURES_DEFAULT if default_stale_max_failures is None else default_stale_max_failures,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_STALE_MAX_FAILURES_MIN,
+                            max = CONF_STALE_MAX_FAILURES_MAX,
+                        ),
+                    ),
+
+                    # Maximum duration of the failures served from the last good data
+                    vol.Required(
+                        CONF_STALE_MAX_AGE,
+                        default = CONF_STALE_MAX_AGE_DEFAULT if default_stale_max_age is None else default_stale_max_age,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_STALE_MAX_AGE_MIN,
+                            max = CONF_STALE_MAX_AGE_MAX,
+                        ),
+                    ),
+
+                    # Consecutive failed refreshes pausing the polling, 0 to never pause
+                    vol.Required(
+                        CONF_CIRCUIT_BREAKER_THRESHOLD,
+                        default = CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT if default_circuit_breaker_threshold is None else default_circuit_breaker_threshold,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_CIRCUIT_BREAKER_THRESHOLD_MIN,
+                            max = CONF_CIRCUIT_BREAKER_THRESHOLD_MAX,
+                        ),
+                    ),
+                }
+            ),
+        ),
+        vol.Required("commands"): section(
+            vol.Schema(
+                {
+                    # Maximum concurrent writes of the bulk services
+                    vol.Required(
+                        CONF_BULK_MAX_CONCURRENT_WRITES,
+                        default = default_bulk_max_concurrent_writes or CONF_BULK_MAX_CONCURRENT_WRITES_DEFAULT,
+                    ): vol.All(
+                        int,
+                        vol.Range(
+                            min = CONF_BULK_MAX_CONCURRENT_WRITES_MIN,
+                            max = CONF_BULK_MAX_CONCURRENT_WRITES_MAX,
+                        ),
+                    ),
+                }
+            ),
+        ),
+        vol.Required("experimental"): section(
+            vol.Schema(
+                {
+                    # Apply the zone and partition changes of the log events between polls
+                    vol.Required(
+                        CONF_LOG_EVENT_PROJECTION,
+                        default = CONF_LOG_EVENT_PROJECTION_DEFAULT if default_log_event_projection is None else default_log_event_projection,
+                    ): bool,
+                }
+            ),
+        ),
+        # Arming profiles, by name
+        vol.Optional(
+            CONF_ARMING_PROFILES,
+            default = default_arming_profiles or {},
+        ): ObjectSelector(),
     }
 
     return schema
 
 
+def validate_optional_input(user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate the fields that the schema cannot validate, return the form errors."""
+    errors = {}
+
+    try:
+        ARMING_PROFILES_SCHEMA(user_input.get(CONF_ARMING_PROFILES) or {})
+    except vol.Invalid:
+        errors[CONF_ARMING_PROFILES] = "invalid_arming_profiles"
+
+    return errors
+
+
 class InimPrimeOptionsFlowHandler(OptionsFlow):
     """Handle options for the INIM Prime integration."""
 
@@ -155,8 +425,12 @@ class InimPrimeOptionsFlowHandler(OptionsFlow):
             user_input: dict[str, Any] | None = None,
     ):
         """Manage options."""
+        errors = {}
+
         if user_input is not None:
-            return self.async_create_entry(title = "", data = user_input)
+            errors = validate_optional_input(user_input)
+            if not errors:
+                return self.async_create_entry(title = "", data = user_input)
 
         schema = vol.Schema(
             {
@@ -185,6 +459,70 @@ class InimPrimeOptionsFlowHandler(OptionsFlow):
                         CONF_PANEL_LOG_EVENTS_FETCH_LIMIT,
                         None,
                     ),
+                    default_poll_requests_per_second = self.config_entry.options.get("polling", {}).get(
+                        CONF_POLL_REQUESTS_PER_SECOND,
+                        None,
+                    ),
+                    default_poll_max_in_flight = self.config_entry.options.get("polling", {}).get(
+                        CONF_POLL_MAX_IN_FLIGHT,
+                        None,
+                    ),
+                    default_setup_max_concurrent_refreshes = self.config_entry.options.get("polling", {}).get(
+                        CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+                        None,
+                    ),
+                    default_bulk_max_concurrent_writes = self.config_entry.options.get("commands", {}).get(
+                        CONF_BULK_MAX_CONCURRENT_WRITES,
+                        None,
+                    ),
+                    default_adaptive_polling = self.config_entry.options.get("polling", {}).get(
+                        CONF_ADAPTIVE_POLLING,
+                        None,
+                    ),
+                    default_adaptive_armed_scan_interval = self.config_entry.options.get("polling", {}).get(
+                        CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+                        None,
+                    ),
+                    default_adaptive_quiet_period = self.config_entry.options.get("polling", {}).get(
+                        CONF_ADAPTIVE_QUIET_PERIOD,
+                        None,
+                    ),
+                    default_alarm_watch = self.config_entry.options.get("polling", {}).get(
+                        CONF_ALARM_WATCH,
+                        None,
+                    ),
+                    default_alarm_watch_interval = self.config_entry.options.get("polling", {}).get(
+                        CONF_ALARM_WATCH_INTERVAL,
+                        None,
+                    ),
+                    default_log_event_refresh = self.config_entry.options.get("polling", {}).get(
+                        CONF_LOG_EVENT_REFRESH,
+                        None,
+                    ),
+                    default_log_event_refresh_stretch = self.config_entry.options.get("polling", {}).get(
+                        CONF_LOG_EVENT_REFRESH_STRETCH,
+                        None,
+                    ),
+                    default_log_event_projection = self.config_entry.options.get("experimental", {}).get(
+                        CONF_LOG_EVENT_PROJECTION,
+                        None,
+                    ),
+                    default_stale_max_failures = self.config_entry.options.get("resilience", {}).get(
+                        CONF_STALE_MAX_FAILURES,
+                        None,
+                    ),
+                    default_stale_max_age = self.config_entry.options.get("resilience", {}).get(
+                        CONF_STALE_MAX_AGE,
+                        None,
+                    ),
+                    default_circuit_breaker_threshold = self.config_entry.options.get("resilience", {}).get(
+                        CONF_CIRCUIT_BREAKER_THRESHOLD,
+                        None,
+                    ),
+                    default_arming_profiles = self.config_entry.options.get(
+                        CONF_ARMING_PROFILES,
+                        None,
+                    ),
                 ),
             }
         )
@@ -192,6 +530,7 @@ class InimPrimeOptionsFlowHandler(OptionsFlow):
         return self.async_show_form(
             step_id = "init",
             data_schema = schema,
+            errors = errors,
         )
 
 
@@ -218,16 +557,24 @@ class InimPrimeConfigFlow(config_entries.ConfigFlow, domain = DOMAIN):
             self._abort_if_unique_id_configured()
 
             try:
-                client = InimPrimeClient(
+                client = await async_create_client(
+                    self.hass,
                     host = conf_host,
                     api_key = conf_api_key,
                     use_https = conf_use_https,
                 )
-                await client.connect()
-                await client.close()
             except Exception:
                 errors["base"] = "cannot_connect"
             else:
+                # Keep the connection open for the setup of the entry
+                async_hand_over_client(
+                    self.hass,
+                    client,
+                    host = conf_host,
+                    api_key = conf_api_key,
+                    use_https = conf_use_https,
+                )
+
                 # Save step1 results temporarily
                 self._connection_data = {
                     CONF_SERIAL_NUMBER: conf_serial_number,
@@ -253,7 +600,12 @@ class InimPrimeConfigFlow(config_entries.ConfigFlow, domain = DOMAIN):
 
     async def async_step_options(self, user_input: dict[str, Any] | None = None):
         """Step 2: Options / scan intervals."""
+        errors = {}
+
         if user_input is not None:
+            errors = validate_optional_input(user_input)
+
+        if user_input is not None and not errors:
             scan_intervals = user_input["scan_intervals"]
 
             return self.async_create_entry(
@@ -266,6 +618,11 @@ class InimPrimeConfigFlow(config_entries.ConfigFlow, domain = DOMAIN):
                     CONF_GSM_SCAN_INTERVAL: scan_intervals[CONF_GSM_SCAN_INTERVAL],
                     CONF_SYSTEM_FAULTS_SCAN_INTERVAL: scan_intervals[CONF_SYSTEM_FAULTS_SCAN_INTERVAL],
                     CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL: scan_intervals[CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL],
+                    "polling": user_input["polling"],
+                    "resilience": user_input["resilience"],
+                    "commands": user_input["commands"],
+                    "experimental": user_input["experimental"],
+                    CONF_ARMING_PROFILES: user_input.get(CONF_ARMING_PROFILES) or {},
                 },
             )
 
@@ -278,6 +635,7 @@ class InimPrimeConfigFlow(config_entries.ConfigFlow, domain = DOMAIN):
         return self.async_show_form(
             step_id = "options",
             data_schema = schema,
+            errors = errors,
         )
 
     async def async_step_reconfigure(
@@ -293,16 +651,24 @@ class InimPrimeConfigFlow(config_entries.ConfigFlow, domain = DOMAIN):
             conf_use_https = user_input[CONF_USE_HTTPS]
 
             try:
-                client = InimPrimeClient(
+                client = await async_create_client(
+                    self.hass,
                     host = conf_host,
                     api_key = conf_api_key or entry.data[CONF_API_KEY],
                     use_https = conf_use_https,
                 )
-                await client.connect()
-                await client.close()
             except Exception:
                 errors["base"] = "cannot_connect"
             else:
+                # Keep the connection open for the reload of the entry
+                async_hand_over_client(
+                    self.hass,
+                    client,
+                    host = conf_host,
+                    api_key = conf_api_key or entry.data[CONF_API_KEY],
+                    use_https = conf_use_https,
+                )
+
                 # IMPORTANT: update data, reload, abort flow
                 data_updates = {
                     CONF_HOST: conf_host,
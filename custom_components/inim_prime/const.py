@@ -34,7 +34,86 @@ CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL_DEFAULT = 15
 CONF_SCAN_INTERVAL_MIN = 1
 CONF_SCAN_INTERVAL_MAX = 300
 
+# --- Poll scheduler request budget ---
+CONF_POLL_REQUESTS_PER_SECOND = "poll_requests_per_second"
+CONF_POLL_REQUESTS_PER_SECOND_DEFAULT = 2.0
+CONF_POLL_REQUESTS_PER_SECOND_MIN = 0.1
+CONF_POLL_REQUESTS_PER_SECOND_MAX = 20.0
+CONF_POLL_MAX_IN_FLIGHT = "poll_max_in_flight"
+CONF_POLL_MAX_IN_FLIGHT_DEFAULT = 2
+CONF_POLL_MAX_IN_FLIGHT_MIN = 1
+CONF_POLL_MAX_IN_FLIGHT_MAX = 5
+CONF_SETUP_MAX_CONCURRENT_REFRESHES = "setup_max_concurrent_refreshes"
+CONF_SETUP_MAX_CONCURRENT_REFRESHES_DEFAULT = 3
+CONF_SETUP_MAX_CONCURRENT_REFRESHES_MIN = 1
+CONF_SETUP_MAX_CONCURRENT_REFRESHES_MAX = 5
+CONF_BULK_MAX_CONCURRENT_WRITES = "bulk_max_concurrent_writes"
+CONF_BULK_MAX_CONCURRENT_WRITES_DEFAULT = 2
+CONF_BULK_MAX_CONCURRENT_WRITES_MIN = 1
+CONF_BULK_MAX_CONCURRENT_WRITES_MAX = 5
+
+# --- Adaptive polling ---
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_ADAPTIVE_POLLING_DEFAULT = False
+CONF_ADAPTIVE_ARMED_SCAN_INTERVAL = "adaptive_armed_scan_interval"
+CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT = 2
+CONF_ADAPTIVE_QUIET_PERIOD = "adaptive_quiet_period"
+CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT = 300
+CONF_ADAPTIVE_QUIET_PERIOD_MIN = 30
+CONF_ADAPTIVE_QUIET_PERIOD_MAX = 3600
+
+# --- Alarm watch ---
+CONF_ALARM_WATCH = "alarm_watch"
+CONF_ALARM_WATCH_DEFAULT = False
+CONF_ALARM_WATCH_INTERVAL = "alarm_watch_interval"
+CONF_ALARM_WATCH_INTERVAL_DEFAULT = 1.0
+CONF_ALARM_WATCH_INTERVAL_MIN = 0.2
+CONF_ALARM_WATCH_INTERVAL_MAX = 5.0
+
+# --- Event-driven refresh ---
+CONF_LOG_EVENT_REFRESH = "log_event_refresh"
+CONF_LOG_EVENT_REFRESH_DEFAULT = False
+CONF_LOG_EVENT_REFRESH_STRETCH = "log_event_refresh_stretch"
+CONF_LOG_EVENT_REFRESH_STRETCH_DEFAULT = 6
+CONF_LOG_EVENT_REFRESH_STRETCH_MIN = 1
+CONF_LOG_EVENT_REFRESH_STRETCH_MAX = 20
+
+# --- Log event projection ---
+CONF_LOG_EVENT_PROJECTION = "log_event_projection"
+CONF_LOG_EVENT_PROJECTION_DEFAULT = False
+
+# --- Stale-while-revalidate ---
+CONF_STALE_MAX_FAILURES = "stale_max_failures"
+CONF_STALE_MAX_FAILURES_DEFAULT = 3
+CONF_STALE_MAX_FAILURES_MIN = 0
+CONF_STALE_MAX_FAILURES_MAX = 10
+CONF_STALE_MAX_AGE = "stale_max_age"
+CONF_STALE_MAX_AGE_DEFAULT = 120
+CONF_STALE_MAX_AGE_MIN = 0
+CONF_STALE_MAX_AGE_MAX = 3600
+CONF_CIRCUIT_BREAKER_THRESHOLD = "circuit_breaker_threshold"
+CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT = 5
+CONF_CIRCUIT_BREAKER_THRESHOLD_MIN = 0
+CONF_CIRCUIT_BREAKER_THRESHOLD_MAX = 50
+
+# --- Arming profiles ---
+CONF_ARMING_PROFILES = "arming_profiles"
+
+# --- Services ---
+SERVICE_SET_ZONES_EXCLUSION = "set_zones_exclusion"
+SERVICE_SET_PARTITIONS_MODE = "set_partitions_mode"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_ZONE_IDS = "zone_ids"
+ATTR_PARTITION_IDS = "partition_ids"
+ATTR_EXCLUDE = "exclude"
+ATTR_MODE = "mode"
+
+# --- Events fired on the HA bus ---
+EVENT_PANEL_LOG_EVENT = f"{DOMAIN}_log_event"
+EVENT_PANEL_LOG_EVENTS_BATCH = f"{DOMAIN}_log_events_batch"
+
 STORAGE_KEY_LAST_PANEL_EVENT_LOGS = "last_panel_event_logs"
+STORAGE_KEY_PANEL_SNAPSHOT = "panel_snapshot"
 
 INIM_PRIME_DEVICE_MANUFACTURER = "Inim"
 INIM_PRIME_MODEL_ZONE = "Prime Zone"
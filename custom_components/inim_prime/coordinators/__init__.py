@@ -2,4 +2,7 @@ from .zones_coordinator import InimPrimeZonesUpdateCoordinator
 from .partitions_coordinator import InimPrimePartitionsUpdateCoordinator
 from .system_faults_coordinator import InimPrimeSystemFaultsUpdateCoordinator
 from .gsm_coordinator import InimPrimeGSMUpdateCoordinator
-from .panel_log_events_coordinator import InimPrimePanelLogEventsCoordinator
\ No newline at end of file
+from .panel_log_events_coordinator import InimPrimePanelLogEventsCoordinator
+from .poll_scheduler import InimPrimePollScheduler
+from .adaptive_polling import InimPrimeAdaptivePolling
+from .alarm_watch import InimPrimeAlarmWatch
@@ -0,0 +1,122 @@
+import logging
+import time
+from datetime import timedelta
+from functools import partial
+
+from homeassistant.core import callback, CALLBACK_TYPE
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from ..const import CONF_SCAN_INTERVAL_MAX
+from .partitions_coordinator import InimPrimePartitionsUpdateCoordinator
+from .poll_scheduler import InimPrimePollScheduler
+from .zones_coordinator import InimPrimeZonesUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InimPrimeAdaptivePolling:
+    """Adapt the zones and partitions refresh intervals to the panel activity.
+
+    - While any partition is armed, any alarm memory is set, or zones and partitions
+      changed within the quiet period, the armed scan interval is used.
+    - Once the quiet period has elapsed, the configured scan intervals are restored.
+    - On consecutive failures, the interval is doubled at every failure.
+    """
+
+    def __init__(
+            self,
+            poll_scheduler: InimPrimePollScheduler,
+            zones_coordinator: InimPrimeZonesUpdateCoordinator,
+            partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
+            armed_scan_interval: int,
+            quiet_period: int,
+    ):
+        self.poll_scheduler = poll_scheduler
+        self.zones_coordinator = zones_coordinator
+        self.partitions_coordinator = partitions_coordinator
+        self.armed_scan_interval = armed_scan_interval
+        self.quiet_period = quiet_period
+
+        # Configured intervals, used whenever the panel is quiet.
+        self.scan_intervals: dict[DataUpdateCoordinator, float] = {
+            coordinator: poll_scheduler.get_interval(coordinator).total_seconds()
+            for coordinator in (zones_coordinator, partitions_coordinator)
+        }
+
+        self._last_activity: float | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start adapting the intervals, return a callback to stop."""
+        unsubs = [
+            # Aggregate listeners: only called when some zone or partition changed.
+            self.zones_coordinator.async_add_listener(
+                partial(self._handle_activity, self.zones_coordinator)
+            ),
+            self.partitions_coordinator.async_add_listener(
+                partial(self._handle_activity, self.partitions_coordinator)
+            ),
+            self.poll_scheduler.async_add_tick_listener(self._handle_tick),
+        ]
+
+        self.async_evaluate()
+
+        @callback
+        def async_stop() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return async_stop
+
+    @property
+    def is_alert(self) -> bool:
+        """Return True if any partition is armed or any alarm memory is set."""
+        # Read from the aggregates kept by the coordinators, not by scanning the statuses.
+        return any(
+            coordinator.get_aggregate(key)
+            for coordinator, key in (
+                (self.partitions_coordinator, "armed"),
+                (self.partitions_coordinator, "alarm_memory"),
+                (self.zones_coordinator, "alarm_memory"),
+            )
+        )
+
+    @callback
+    def _handle_activity(self, coordinator: DataUpdateCoordinator) -> None:
+        # Listeners are also called when the coordinator becomes unavailable, that is not activity.
+        if coordinator.last_update_success:
+            self._last_activity = time.monotonic()
+        self.async_evaluate()
+
+    @callback
+    def _handle_tick(self, coordinator: DataUpdateCoordinator) -> None:
+        if coordinator in self.scan_intervals:
+            self.async_evaluate()
+
+    @callback
+    def async_evaluate(self) -> None:
+        """Apply the intervals matching the current activity."""
+        now = time.monotonic()
+
+        if self.is_alert:
+            self._last_activity = now
+
+        active = (
+                self._last_activity is not None and
+                now - self._last_activity < self.quiet_period
+        )
+
+        for coordinator, scan_interval in self.scan_intervals.items():
+            interval = min(self.armed_scan_interval, scan_interval) if active else scan_interval
+
+            # Exponential backoff while the panel does not answer.
+            if coordinator.consecutive_failures:
+                interval = min(
+                    interval * 2 ** coordinator.consecutive_failures,
+                    max(CONF_SCAN_INTERVAL_MAX, scan_interval),
+                )
+
+            self.poll_scheduler.async_set_interval(
+                coordinator,
+                timedelta(seconds = interval),
+            )
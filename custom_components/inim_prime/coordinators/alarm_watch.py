@@ -0,0 +1,260 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+
+from inim_prime_api.models.partition import PartitionMode, PartitionStatus
+from .partitions_coordinator import InimPrimePartitionsUpdateCoordinator
+from .poll_scheduler import InimPrimePollScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every poll is moved by up to this fraction of the interval, so the watch never
+# locks into phase with the other periodic requests sent to the panel.
+ALARM_WATCH_JITTER = 0.1
+
+# While the panel does not answer, the interval is doubled at every failure, up to this many seconds.
+ALARM_WATCH_MAX_BACKOFF = 10.0
+
+
+@dataclass
+class AlarmWatchStats:
+    """Statistics of the alarm watch."""
+    activations: int = 0
+    polls: int = 0
+    failures: int = 0
+    skipped_polls: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
+    max_poll_gap: float = 0.0
+    alarms_detected: int = 0
+    last_detection_poll_gap: float = 0.0
+    max_detection_poll_gap: float = 0.0
+
+    @property
+    def average_lag(self) -> float:
+        if self.polls:
+            return self.total_lag / self.polls
+        return 0.0
+
+
+class InimPrimeAlarmWatch:
+    """Poll only the partitions at a sub-second cadence while any partition is armed.
+
+    While active, the scheduled refresh of the partitions coordinator is suspended and
+    the watch feeds the fetched statuses into it instead, so the panel is never asked
+    twice for the same partitions. The cadence is drift-free, with jitter, and a poll
+    is skipped if the previous one is still running. While active, the watch reserves
+    its rate in the request budget of the scheduler, at most half of it, so the other
+    coordinators keep the rest: the interval is stretched when the reserved share is
+    not enough. The watch stops by itself, and gives the partitions and the reserved
+    share back to the scheduler, once every partition is disarmed.
+
+    The gap between the start of the poll that reported an alarm and the start of the
+    previous poll is recorded: the alarm happened within it, plus the panel answer time.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            poll_scheduler: InimPrimePollScheduler,
+            partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
+            interval: float,
+    ):
+        self.hass = hass
+        self.entry = entry
+        self.poll_scheduler = poll_scheduler
+        self.partitions_coordinator = partitions_coordinator
+        self.interval = interval
+        self.stats = AlarmWatchStats()
+
+        self._due = 0.0
+        # Interval allowed by the share of the request budget reserved by the watch.
+        self._effective_interval = interval
+        self._unsub_poll: Optional[CALLBACK_TYPE] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._last_poll_start: Optional[float] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._unsub_poll is not None
+
+    @property
+    def is_armed(self) -> bool:
+        """Return True if any partition is armed."""
+        return any(
+            partition.mode != PartitionMode.DISARMED
+            for partition in (self.partitions_coordinator.data or {}).values()
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start watching the partitions, return a callback to stop."""
+        # Aggregate listener: called when any partition changed, by the scheduler or by the watch.
+        unsub = self.partitions_coordinator.async_add_listener(self._async_evaluate)
+
+        self._async_evaluate()
+
+        @callback
+        def async_stop() -> None:
+            unsub()
+            self._async_deactivate()
+
+        return async_stop
+
+    @callback
+    def _async_evaluate(self) -> None:
+        if self.is_armed:
+            self._async_activate()
+        else:
+            self._async_deactivate()
+
+    @callback
+    def _async_activate(self) -> None:
+        if self.is_active or self.hass.is_stopping:
+            return
+
+        self.stats.activations += 1
+        self._last_poll_start = None
+        self.poll_scheduler.async_suspend(self.partitions_coordinator)
+
+        self._due = self.hass.loop.time()
+        self._reserve_interval()
+        self._schedule()
+
+        _LOGGER.debug("Alarm watch started, polling partitions every %.2f seconds", self._effective_interval)
+
+    @callback
+    def _async_deactivate(self) -> None:
+        if not self.is_active:
+            return
+
+        self._unsub_poll()
+        self._unsub_poll = None
+        self.poll_scheduler.budget.release()
+        self.poll_scheduler.async_resume(self.partitions_coordinator)
+
+        _LOGGER.debug("Alarm watch stopped, every partition is disarmed")
+
+    def _reserve_interval(self) -> float:
+        """Reserve the rate of the configured interval, return the interval the reserved share allows."""
+        self._effective_interval = 1 / self.poll_scheduler.budget.reserve(1 / self.interval)
+        return self._effective_interval
+
+    @callback
+    def _schedule(self) -> None:
+        # The jitter only moves the call, not the target time, so it never accumulates.
+        jitter = random.uniform(-ALARM_WATCH_JITTER, ALARM_WATCH_JITTER) * self._effective_interval
+        self._unsub_poll = self.hass.loop.call_at(
+            max(self.hass.loop.time(), self._due + jitter),
+            self._handle_poll,
+        ).cancel
+
+    @callback
+    def _handle_poll(self) -> None:
+        if self.hass.is_stopping:
+            self._unsub_poll = None
+            return
+
+        if self.poll_scheduler.breaker_open:
+            # The panel is not answering, the scheduler probes it.
+            self.stats.skipped_polls += 1
+        elif self._poll_task and not self._poll_task.done():
+            # The previous poll is still waiting for the panel, do not pile up requests.
+            self.stats.skipped_polls += 1
+        else:
+            self._poll_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_poll(self._due),
+                name = f"{self.partitions_coordinator.name} - alarm watch",
+            )
+
+        # Drift-free, as the scheduler: the next poll is computed from the target time.
+        interval = self._reserve_interval()
+        if self.partitions_coordinator.consecutive_failures:
+            interval = min(
+                interval * 2 ** self.partitions_coordinator.consecutive_failures,
+                ALARM_WATCH_MAX_BACKOFF,
+            )
+
+        now = self.hass.loop.time()
+        self._due += interval
+        if self._due <= now:
+            missed = math.ceil((now - self._due) / interval)
+            self._due += missed * interval
+            self.stats.skipped_polls += missed
+
+        self._schedule()
+
+    async def _async_poll(self, due: float) -> None:
+        start = self.hass.loop.time()
+        lag = max(0.0, start - due)
+
+        self.stats.polls += 1
+        self.stats.last_lag = lag
+        self.stats.total_lag += lag
+        self.stats.max_lag = max(self.stats.max_lag, lag)
+
+        previous_start = self._last_poll_start
+        self._last_poll_start = start
+        if previous_start is not None:
+            self.stats.max_poll_gap = max(self.stats.max_poll_gap, start - previous_start)
+
+        coordinator = self.partitions_coordinator
+        previous: Dict[int, PartitionStatus] = coordinator.data or {}
+        fetch_started = time.monotonic()
+
+        try:
+            # Paced by the watch itself within its reserved share of the request budget.
+            # Fresher than the client cache, identical reads in flight are still shared.
+            partitions = await coordinator.client.get_partitions_status(max_age = self._effective_interval / 2)
+        except Exception as err:
+            self.stats.failures += 1
+            coordinator.async_set_fetch_error(err)
+            return
+
+        if previous_start is not None:
+            alarms = [
+                partition_id
+                for partition_id, partition in partitions.items()
+                if partition.alarm_memory and not getattr(previous.get(partition_id), "alarm_memory", False)
+            ]
+            if alarms:
+                poll_gap = start - previous_start
+                self.stats.alarms_detected += len(alarms)
+                self.stats.last_detection_poll_gap = poll_gap
+                self.stats.max_detection_poll_gap = max(self.stats.max_detection_poll_gap, poll_gap)
+                _LOGGER.debug(
+                    "Alarm watch detected an alarm on partitions %s, %.3f seconds after the previous poll",
+                    alarms,
+                    poll_gap,
+                )
+
+        coordinator.async_set_fetched_data(partitions, fetch_started)
+
+    def get_stats(self) -> dict:
+        """Return the alarm watch statistics."""
+        return {
+            "active": self.is_active,
+            "interval": self.interval,
+            "effective_interval": round(self._effective_interval, 3),
+            "activations": self.stats.activations,
+            "polls": self.stats.polls,
+            "failures": self.stats.failures,
+            "skipped_polls": self.stats.skipped_polls,
+            "last_lag": round(self.stats.last_lag, 3),
+            "average_lag": round(self.stats.average_lag, 3),
+            "max_lag": round(self.stats.max_lag, 3),
+            "max_poll_gap": round(self.stats.max_poll_gap, 3),
+            "alarms_detected": self.stats.alarms_detected,
+            "last_detection_poll_gap": round(self.stats.last_detection_poll_gap, 3),
+            "max_detection_poll_gap": round(self.stats.max_detection_poll_gap, 3),
+        }
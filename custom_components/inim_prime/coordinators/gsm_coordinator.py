@@ -1,25 +1,54 @@
 import logging
-from datetime import timedelta
-from typing import Dict
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from inim_prime_api import InimPrimeClient
 from inim_prime_api.models.gsm import GSMSStatus
+from .stale import StaleWhileRevalidateMixin
+from ..helpers.client import InimPrimeCoalescingClient
 
 _LOGGER = logging.getLogger(__name__)
 
-class InimPrimeGSMUpdateCoordinator(DataUpdateCoordinator[GSMSStatus]):
-    """Coordinator to fetch GSM from the panel."""
+# How old each field may get before the GSM status is fetched again, in seconds.
+# The whole status is fetched at once, so the shortest TTL of the listened fields
+# sets the request rate: the longer ones only matter once the shorter are disabled.
+# A scan interval longer than a TTL makes the field due at every scheduled refresh.
+GSM_FIELD_TTLS: Dict[str, float] = {
+    "signal_strength": 120,
+    "supply_voltage": 300,
+    "credit": 3600,
+    "operator": 6 * 3600,
+    "firmware_version": 24 * 3600,
+}
+
+# A field is due a bit before its TTL, so that a refresh scheduled right at the TTL
+# does not find it a few milliseconds too fresh and leave it for the next one.
+GSM_TTL_TOLERANCE = 0.1
+
+# Fields without an entity, always kept fresh within their TTL (shown on the GSM device).
+GSM_DEVICE_FIELDS = {"firmware_version"}
+
+class InimPrimeGSMUpdateCoordinator(StaleWhileRevalidateMixin, DataUpdateCoordinator[GSMSStatus]):
+    """Coordinator to fetch GSM from the panel.
+
+    The whole status is returned by a single, slow, request, so a scheduled refresh
+    only sends it when a field is due: older than its TTL in `GSM_FIELD_TTLS`, and
+    listened to by an entity. With the default entities the signal strength sets the
+    rate, every 2 minutes whatever the scan interval. The entities listen with their field as context, and
+    disabled entities do not listen at all, so with every GSM entity disabled the
+    status is only fetched once a day.
+    """
 
     def __init__(
             self,
             hass: HomeAssistant,
-            update_interval: timedelta,
+            update_interval: timedelta | None,
             entry: ConfigEntry,
-            client: InimPrimeClient,
+            client: InimPrimeCoalescingClient,
     ):
         super().__init__(
             hass = hass,
@@ -38,13 +67,78 @@ class InimPrimeGSMUpdateCoordinator(DataUpdateCoordinator[GSMSStatus]):
         )
         self.entry = entry
 
+        # Set when the data has been restored from the snapshot, until the first successful refresh.
+        self.stale_since: datetime | None = None
+
+        # Monotonic start time of the last successful fetch, None until the first one.
+        self._fetched_at: Optional[float] = None
+        self._skipped = False
+        # Availability and staleness the listeners were last updated with.
+        self._last_notified = (True, None)
+        self.fetches = 0
+        self.skipped_refreshes = 0
+
+    def _listened_fields(self) -> Set[str]:
+        return {context for _, context in self._listeners.values() if context is not None}
+
+    def _due_fields(self) -> Set[str]:
+        """Return the fields that need a fetch, all of them before the first one."""
+        fields = self._listened_fields() | GSM_DEVICE_FIELDS
+
+        if self._fetched_at is None:
+            return fields
+
+        age = time.monotonic() - self._fetched_at
+        return {
+            field
+            for field in fields
+            if age >= GSM_FIELD_TTLS[field] * (1 - GSM_TTL_TOLERANCE)
+        }
+
     async def _async_update_data(self) -> GSMSStatus:
-        """Fetch data from API."""
+        """Fetch data from API, if any field is due."""
+        self._skipped = False
+
+        if not self._due_fields():
+            self._skipped = True
+            self.skipped_refreshes += 1
+            return self.data
+
+        fetch_started = time.monotonic()
         try:
             gsm = await self.client.get_gsm_status()
 
             self.data = gsm
+            self._fetched_at = fetch_started
+            self.fetches += 1
+            self._mark_fresh()
 
             return self.data
         except Exception as err:
-            raise UpdateFailed(err) from err
+            return self._stale_or_raise(err)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, unless the refresh was skipped and nothing visible changed.
+
+        A skipped refresh after a failure makes the data available again, since every
+        listened field is still within its TTL: the entities must then be updated.
+        """
+        skipped = self._skipped
+        self._skipped = False
+
+        notified = (self.last_update_success, self.stale_since)
+        if skipped and notified == self._last_notified:
+            return
+
+        self._last_notified = notified
+        super().async_update_listeners()
+
+    def get_stats(self) -> dict:
+        """Return how often the GSM status was fetched or skipped."""
+        return {
+            "fetches": self.fetches,
+            "skipped_refreshes": self.skipped_refreshes,
+            "listened_fields": sorted(self._listened_fields()),
+            "age": round(time.monotonic() - self._fetched_at, 1) if self._fetched_at is not None else None,
+        }
@@ -0,0 +1,420 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple, TypeVar
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .poll_scheduler import RequestBudget
+from .stale import StaleWhileRevalidateMixin
+
+_LOGGER = logging.getLogger(__name__)
+
+_StatusT = TypeVar("_StatusT")
+
+# After a command, the status is polled every `COMMAND_CONFIRM_INTERVAL` seconds
+# until the panel reports it, for at most `COMMAND_CONFIRM_TIMEOUT` seconds.
+COMMAND_CONFIRM_INTERVAL = 0.5
+COMMAND_CONFIRM_TIMEOUT = 10
+
+
+@dataclass
+class CommandStats:
+    """Statistics of the commands of a single kind."""
+    commands: int = 0
+    suppressed: int = 0
+    confirmed: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        if self.confirmed:
+            return self.total_latency / self.confirmed
+        return 0.0
+
+
+@dataclass
+class ProjectionStats:
+    """Reconciliation statistics of the statuses projected from log events."""
+    projected: int = 0
+    confirmed: int = 0
+    mismatches: int = 0
+
+
+class InimPrimeKeyedUpdateCoordinator(StaleWhileRevalidateMixin, DataUpdateCoordinator[Dict[int, _StatusT]], ABC):
+    """Coordinator holding statuses by ID that only wakes the listeners of the changed IDs.
+
+    Listeners registered with an ID as context (entities of a single zone or partition)
+    are called only when that ID changed. Listeners registered without context (aggregate
+    entities) are called once when anything changed. All the listeners are called when
+    the availability or the staleness of the data changes.
+
+    Commands are applied optimistically with `async_command` and confirmed by polling.
+    Changes derived from log events are applied with `async_project` and reconciled
+    by the next fetch started after them.
+
+    Counters over the statuses (excluded zones, armed partitions...) are kept up to
+    date from the changed IDs only, see `_aggregate_keys` and `get_aggregate`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # IDs changed by the last refresh, None when every listener must be called.
+        self._changed_ids: Optional[Set[int]] = None
+        self._last_notified_success = True
+
+        # Optimistic statuses of the commands waiting for confirmation, by ID, with the
+        # token of the command: a newer command on the same ID replaces the older one.
+        self._pending: Dict[int, Tuple[_StatusT, object]] = {}
+        self.command_stats: Dict[str, CommandStats] = {}
+
+        # Set when the next fetch must reach the panel, not the client cache.
+        self._fetch_fresh = False
+
+        # Shared with the poll scheduler, limits the confirmation fetches as well.
+        self.request_budget: RequestBudget | None = None
+
+        # Statuses last reported by the panel, without the projected and optimistic ones.
+        self.fetched_data: Optional[Dict[int, _StatusT]] = None
+
+        # Fields projected from log events, by ID, with the time of the projection.
+        self._projections: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self.projection_stats = ProjectionStats()
+
+        # Number of statuses by aggregate key, and the data they have been counted from.
+        self.aggregates: Counter = Counter()
+        self._aggregated_data: Dict[int, _StatusT] = {}
+
+    @abstractmethod
+    async def _async_fetch_statuses(self, max_age: float | None = None) -> Dict[int, _StatusT]:
+        """Fetch the statuses from the panel, served from the client cache up to `max_age`."""
+
+    async def _async_fetch_fresh_statuses(self) -> Dict[int, _StatusT]:
+        """Fetch the statuses from the panel and not from the client cache, within the request budget."""
+        if self.request_budget is None:
+            return await self._async_fetch_statuses(max_age = 0)
+
+        await self.request_budget.async_wait_slot()
+        return await self._async_fetch_statuses(max_age = 0)
+
+    async def _async_fetch_data(self) -> Dict[int, _StatusT]:
+        """Fetch the statuses, reconcile the projections and apply the pending commands."""
+        fetch_started = time.monotonic()
+        max_age = 0 if self._fetch_fresh else None
+        self._fetch_fresh = False
+
+        data = await self._async_fetch_statuses(max_age = max_age)
+        self.fetched_data = data
+        self._reconcile_projections(data, fetch_started)
+        return self._apply_pending(data)
+
+    async def async_request_fresh_refresh(self) -> None:
+        """Request a refresh whose fetch skips the client cache."""
+        self._fetch_fresh = True
+        await self.async_request_refresh()
+
+    def _apply_pending(self, data: Dict[int, _StatusT]) -> Dict[int, _StatusT]:
+        """Keep the projected and optimistic statuses over the fetched data."""
+        if self._projections:
+            data = {
+                **data,
+                **{
+                    status_id: replace(data[status_id], **changes)
+                    for status_id, (_, changes) in self._projections.items()
+                    if status_id in data
+                },
+            }
+        if not self._pending:
+            return data
+        return {
+            **data,
+            **{
+                status_id: status
+                for status_id, (status, _) in self._pending.items()
+                if status_id in data
+            },
+        }
+
+    @callback
+    def _async_set_data(self, data: Dict[int, _StatusT], fetched: bool = False) -> None:
+        """Replace the data outside a refresh and update the affected listeners.
+
+        `fetched` data has just been reported by the panel, as a successful refresh would.
+        """
+        if fetched:
+            self.fetched_data = data
+
+        data = self._apply_pending(data)
+        self._async_track_changes(data)
+
+        if fetched:
+            self._mark_fresh()
+            self.last_update_success = True
+
+        self.data = data
+        self.async_update_listeners()
+
+    async def async_command(
+            self,
+            kind: str,
+            status_id: int,
+            optimistic_status: Optional[_StatusT],
+            is_confirmed: Callable[[Optional[_StatusT]], bool],
+            send: Callable[[], Awaitable],
+    ) -> None:
+        """Send a command, showing `optimistic_status` until the panel confirms it.
+
+        The command is not sent when the current status already satisfies
+        `is_confirmed`. Otherwise the optimistic status is shown at once, and the
+        status is polled in the background until it is confirmed, or rolled back to
+        the status reported by the panel after `COMMAND_CONFIRM_TIMEOUT` seconds.
+        """
+        stats = self.command_stats.setdefault(kind, CommandStats())
+        current = self.data.get(status_id) if self.data else None
+
+        if getattr(self, "stale_since", None) is None and is_confirmed(current):
+            stats.suppressed += 1
+            _LOGGER.debug("%s %s command suppressed, already in the requested state", kind, status_id)
+            return
+
+        stats.commands += 1
+
+        if optimistic_status is None:
+            # Unknown ID, nothing to show until the next refresh.
+            await send()
+            await self.async_request_refresh()
+            return
+
+        token = object()
+        start = time.monotonic()
+
+        self._pending[status_id] = (optimistic_status, token)
+        self._async_set_data(self.data)
+
+        try:
+            await send()
+        except Exception:
+            stats.failed += 1
+            self._async_drop_pending(status_id, token)
+            if current is not None:
+                self._async_set_data({**self.data, status_id: current})
+            raise
+
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_confirm(stats, status_id, token, is_confirmed, start),
+            name = f"{self.name} - confirm {kind} {status_id}",
+        )
+
+    async def _async_confirm(
+            self,
+            stats: CommandStats,
+            status_id: int,
+            token: object,
+            is_confirmed: Callable[[Optional[_StatusT]], bool],
+            start: float,
+    ) -> None:
+        statuses: Optional[Dict[int, _StatusT]] = None
+
+        while time.monotonic() - start < COMMAND_CONFIRM_TIMEOUT:
+            await asyncio.sleep(COMMAND_CONFIRM_INTERVAL)
+
+            if self._pending.get(status_id, (None, None))[1] is not token:
+                # Replaced by a newer command, which confirms on its own.
+                return
+
+            # The confirmation must come from the panel, not from the client cache.
+            fetch_started = time.monotonic()
+            try:
+                statuses = await self._async_fetch_fresh_statuses()
+            except Exception:
+                continue
+
+            # Projections older than this fetch must not be shown over the statuses it returned.
+            self._reconcile_projections(statuses, fetch_started)
+
+            if is_confirmed(statuses.get(status_id)):
+                latency = time.monotonic() - start
+                stats.confirmed += 1
+                stats.last_latency = latency
+                stats.total_latency += latency
+                stats.max_latency = max(stats.max_latency, latency)
+
+                self._async_drop_pending(status_id, token)
+                self._async_set_data(statuses, fetched = True)
+                return
+
+        if not self._async_drop_pending(status_id, token):
+            return
+
+        stats.timed_out += 1
+        _LOGGER.warning(
+            "%s %s command not confirmed by the panel after %d seconds, rolling back",
+            self.name,
+            status_id,
+            COMMAND_CONFIRM_TIMEOUT,
+        )
+
+        # Roll back to the last status reported by the panel.
+        if statuses is not None:
+            self._async_set_data(statuses, fetched = True)
+        else:
+            await self.async_request_refresh()
+
+    @callback
+    def async_project(self, status_id: int, changes: Dict[str, Any]) -> bool:
+        """Apply fields derived from a log event until the panel reports the status again.
+
+        Return False if the status is unknown or already has those fields.
+        """
+        status = self.data.get(status_id) if self.data else None
+        if status is None or all(getattr(status, name) == value for name, value in changes.items()):
+            return False
+
+        _, projected_changes = self._projections.get(status_id, (None, {}))
+        self._projections[status_id] = (time.monotonic(), {**projected_changes, **changes})
+        self.projection_stats.projected += 1
+
+        # The fetch reconciling the projection must not be served from the client cache.
+        self._fetch_fresh = True
+
+        self._async_set_data(self.data)
+        return True
+
+    def _reconcile_projections(self, data: Dict[int, _StatusT], fetch_started: float) -> None:
+        """Compare the projections older than the fetch with the statuses it returned."""
+        for status_id, (projected_at, changes) in list(self._projections.items()):
+            if projected_at > fetch_started:
+                # The fetch may have been answered before the event, keep waiting.
+                continue
+
+            del self._projections[status_id]
+            status = data.get(status_id)
+
+            if status is not None and all(getattr(status, name) == value for name, value in changes.items()):
+                self.projection_stats.confirmed += 1
+            else:
+                self.projection_stats.mismatches += 1
+                _LOGGER.debug(
+                    "%s %s projected from log events as %s, reported by the panel as %s",
+                    self.name,
+                    status_id,
+                    changes,
+                    status,
+                )
+
+    def get_projection_stats(self) -> Dict[str, int]:
+        """Return the reconciliation statistics of the projected statuses."""
+        return {
+            "projected": self.projection_stats.projected,
+            "confirmed": self.projection_stats.confirmed,
+            "mismatches": self.projection_stats.mismatches,
+            "pending": len(self._projections),
+        }
+
+    @callback
+    def _async_drop_pending(self, status_id: int, token: object) -> bool:
+        """Drop the optimistic status of a command, if not replaced by a newer one."""
+        if self._pending.get(status_id, (None, None))[1] is token:
+            del self._pending[status_id]
+            return True
+        return False
+
+    def get_command_stats(self) -> Dict[str, dict]:
+        """Return the command statistics by kind."""
+        return {
+            kind: {
+                "commands": stats.commands,
+                "suppressed": stats.suppressed,
+                "confirmed": stats.confirmed,
+                "timed_out": stats.timed_out,
+                "failed": stats.failed,
+                "last_latency": round(stats.last_latency, 3),
+                "average_latency": round(stats.average_latency, 3),
+                "max_latency": round(stats.max_latency, 3),
+            }
+            for kind, stats in self.command_stats.items()
+        }
+
+    def _async_track_changes(self, data: Dict[int, _StatusT]) -> Set[int]:
+        """Compute the IDs changed by `data` against the current data, call before replacing it."""
+        previous = self.data or {}
+
+        changed_ids = {
+            status_id
+            for status_id, status in data.items()
+            if previous.get(status_id) != status
+        }
+        changed_ids.update(previous.keys() - data.keys())
+
+        # Data restored from the snapshot is replaced entirely, every entity must drop its stale flag.
+        self._changed_ids = None if getattr(self, "stale_since", None) else changed_ids
+
+        # The aggregates only need the changed IDs if they have been counted from the current data.
+        self._update_aggregates(data, changed_ids if self._aggregated_data is previous else None)
+
+        return changed_ids
+
+    def _aggregate_keys(self, status: _StatusT) -> Iterable[Hashable]:
+        """Return the aggregate keys the status is counted in."""
+        return ()
+
+    def _update_aggregates(self, data: Dict[int, _StatusT], changed_ids: Optional[Set[int]] = None) -> None:
+        """Count the changed statuses of `data` in the aggregates, all of them without `changed_ids`."""
+        previous = self._aggregated_data
+
+        if changed_ids is None:
+            changed_ids = previous.keys() | data.keys()
+
+        for status_id in changed_ids:
+            if (status := previous.get(status_id)) is not None:
+                self.aggregates.subtract(self._aggregate_keys(status))
+            if (status := data.get(status_id)) is not None:
+                self.aggregates.update(self._aggregate_keys(status))
+
+        self._aggregated_data = data
+
+    def get_aggregate(self, key: Hashable) -> int | None:
+        """Return the number of statuses counted in the aggregate, None without data."""
+        if not self.data:
+            return None
+
+        if self._aggregated_data is not self.data:
+            # Data replaced without tracking the changes, as when restored from the snapshot.
+            self._update_aggregates(self.data)
+
+        return self.aggregates[key]
+
+    def _stale_or_raise(self, err: Exception) -> Dict[int, _StatusT]:
+        was_stale = self.stale_since is not None
+        data = super()._stale_or_raise(err)
+        # Only the first tolerated failure changes the entities, which then show `stale_since`.
+        self._changed_ids = set() if was_stale else None
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners affected by the last refresh."""
+        changed_ids = self._changed_ids
+        self._changed_ids = None
+
+        if changed_ids is None or self.last_update_success != self._last_notified_success:
+            self._last_notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        if not changed_ids:
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_ids:
+                update_callback()
@@ -1,10 +1,9 @@
 import logging
 from datetime import timedelta
-from typing import List
+from typing import Dict, List
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..const import (
@@ -13,15 +12,20 @@ from ..const import (
     STORAGE_KEY_LAST_PANEL_EVENT_LOGS,
     CONF_PANEL_LOG_EVENTS_FETCH_LIMIT,
     CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_DEFAULT,
-    CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_TRIGGER,
     CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
 )
+from ..helpers.client import InimPrimeCoalescingClient
 from ..helpers.panel_log_events import (
-    deserialize_panel_log_events,
-    serialize_panel_log_events,
     async_fetch_panel_log_events,
+    async_backfill_panel_log_events,
+    classify_panel_log_event,
+    PanelLogEventsStore,
+    PanelLogEventsWatermark,
+    PanelLogEventsWindowEstimator,
+    PanelLogEventsFetchStats,
+    PANEL_LOG_EVENTS_SAVE_DELAY,
+    PANEL_LOG_EVENTS_REPLAY_BATCH_SIZE,
 )
-from inim_prime_api import InimPrimeClient
 from inim_prime_api.models.log_event import LogEvent
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,16 +33,15 @@ _LOGGER = logging.getLogger(__name__)
 
 class InimPrimePanelLogEventsCoordinator(DataUpdateCoordinator[List[LogEvent]]):
     # Coordinator to fetch panel log events independently.
-    STORAGE_VERSION = 1
+    STORAGE_VERSION = 2
     panel_log_events_entity = None
-    last_panel_log_events: list[LogEvent] = []
 
     def __init__(
             self,
             hass: HomeAssistant,
-            update_interval: timedelta,
+            update_interval: timedelta | None,
             entry: ConfigEntry,
-            client: InimPrimeClient,
+            client: InimPrimeCoalescingClient,
     ):
         super().__init__(
             hass = hass,
@@ -50,7 +53,26 @@ class InimPrimePanelLogEventsCoordinator(DataUpdateCoordinator[List[LogEvent]]):
         self.client = client
         self.entry = entry
 
-        self.last_panel_log_events_store = Store(
+        # High-water mark of the ingested events, only the watermark is persisted.
+        self.watermark = PanelLogEventsWatermark()
+
+        self.window_estimator = PanelLogEventsWindowEstimator()
+        self.fetch_stats = PanelLogEventsFetchStats()
+
+        # Set at startup when the events added while HA was down must be recovered.
+        self._backfill_pending = False
+
+        # Set while a delayed watermark write is pending.
+        self._watermark_dirty = False
+
+        # Coordinators refreshed at once when new events affect them, by coordinator key.
+        # Empty when the event-driven refresh is disabled.
+        self.event_refresh_coordinators: Dict[str, DataUpdateCoordinator] = {}
+
+        # Projects the zone and partition changes of the new events, None when disabled.
+        self.log_event_projector = None
+
+        self.last_panel_log_events_store = PanelLogEventsStore(
             hass,
             self.STORAGE_VERSION,
             f"{DOMAIN}_{entry.data[CONF_SERIAL_NUMBER]}_{STORAGE_KEY_LAST_PANEL_EVENT_LOGS}",
@@ -68,85 +90,225 @@ class InimPrimePanelLogEventsCoordinator(DataUpdateCoordinator[List[LogEvent]]):
         try:
             # Do not consume panel log events until panel_log_events_entity is ready,
             # otherwise events could be lost before HA can fire them.
-            if self.panel_log_events_entity:
+            if self.panel_log_events_entity and self._backfill_pending:
+                await self._async_backfill()
 
-                # Phase 1: lightweight "trigger" fetch.
-                # Fetch only a small number of the most recent log events to quickly check
-                # whether any new events appeared since the last poll.
+            elif self.panel_log_events_entity:
+
+                self.fetch_stats.polls += 1
+
+                # Single sized fetch.
+                # The window is sized from the recently observed event rate, so that a single
+                # request is likely to cover every new event: on a quiet panel it is as small as
+                # the trigger fetch, during a burst it grows up to the configured fetch limit.
                 #
-                # - `self.last_panel_log_events` is used to filter out already known events
-                # - The fetched list is not stored; we only check if there are any new events
-                # - If no new events are detected here, the heavier full fetch is skipped
-                _, trigger_new_events = await async_fetch_panel_log_events(
-                    last_panel_log_events = self.last_panel_log_events,
+                # - `self.watermark` is used to filter out already known events
+                # - The fetched list is not stored; only the new events are ingested
+                window = self.window_estimator.window(self.panel_log_events_fetch_limit)
+                self.fetch_stats.last_window = window
+                self.fetch_stats.requests += 1
+
+                current_panel_log_events, current_panel_log_events_filtered = await async_fetch_panel_log_events(
+                    watermark = self.watermark,
                     client = self.client,
-                    limit = CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_TRIGGER,
+                    limit = window,
                 )
 
-                # If at least one new event is detected, perform a full fetch to ensure
-                # we do not miss any events that occurred between polling intervals.
-                if trigger_new_events:
+                # Defensive max-limit fetch:
+                # If the fetched window is fully saturated with new events, it may mean
+                # more events occurred than the window. Perform a single refetch using the
+                # maximum allowed window to reduce the risk of missing events.
+                if (
+                        current_panel_log_events_filtered and
+                        window < CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX and
+                        window == len(current_panel_log_events_filtered)
+                ):
+                    self.fetch_stats.saturations += 1
+                    self.fetch_stats.requests += 1
 
-                    # Phase 2: authoritative fetch.
-                    # Fetch a larger window of recent log events and re-filter them against
-                    # the last known state to obtain the complete and correctly ordered list of new events.
-                    current_panel_log_events, current_panel_log_events_filtered = await async_fetch_panel_log_events(
-                        last_panel_log_events = self.last_panel_log_events,
+                    _LOGGER.debug(
+                        "Log events window of %d saturated, refetching %d events",
+                        window,
+                        CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
+                    )
+
+                    max_panel_log_events, max_panel_log_events_filtered = await async_fetch_panel_log_events(
+                        watermark = self.watermark,
                         client = self.client,
-                        limit = self.panel_log_events_fetch_limit,
+                        limit = CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
+                    )
+
+                    # Keep the smaller window if the refetch failed
+                    if max_panel_log_events is not None:
+                        current_panel_log_events = max_panel_log_events
+                        current_panel_log_events_filtered = max_panel_log_events_filtered
+
+                # A failed fetch says nothing about the event rate
+                if current_panel_log_events is not None:
+                    self.window_estimator.observe(len(current_panel_log_events_filtered))
+
+                # If there are any new events after filtering
+                if current_panel_log_events_filtered:
+                    # Pass the new events to the panel_log_events_entity to trigger HA events.
+                    # This will fire each event in PanelLogEventsEvent.
+                    await self.panel_log_events_entity.handle_events(
+                        current_panel_log_events_filtered,
                     )
 
-                    # Defensive max-limit fetch:
-                    # If the fetched window is fully saturated with new events, it may mean
-                    # more events occurred than the configured fetch limit. Perform a single
-                    # refetch using the maximum allowed window to reduce the risk of missing events.
-                    if (
-                            self.panel_log_events_fetch_limit < CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX and
-                            self.panel_log_events_fetch_limit == len(current_panel_log_events_filtered)
-                    ):
-                        current_panel_log_events, current_panel_log_events_filtered = await async_fetch_panel_log_events(
-                            last_panel_log_events = self.last_panel_log_events,
-                            client = self.client,
-                            limit = CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
-                        )
-
-                    # If there are any new events after filtering
-                    if current_panel_log_events_filtered:
-                        # Pass the new events to the panel_log_events_entity to trigger HA events.
-                        # This will fire each event in PanelLogEventsEvent.
-                        await self.panel_log_events_entity.handle_events(
-                            current_panel_log_events_filtered,
-                        )
-
-                        # Update the stored full list of panel events and persist it.
-                        # Since there are new events, we are sure `current_panel_log_events` contains valid data.
-                        self.last_panel_log_events = current_panel_log_events
-                        await self.async_save_current_panel_log_events(
-                            self.last_panel_log_events,
-                        )
+                    # Move the watermark past the new events and persist it.
+                    self.watermark.add(current_panel_log_events_filtered)
+                    self.async_schedule_save_watermark()
+
+                    self._async_project(current_panel_log_events_filtered)
+                    self._async_refresh_affected(current_panel_log_events_filtered)
         except Exception as err:
             raise UpdateFailed(err) from err
 
         return
 
-    async def async_load_last_panel_log_events(self):
-        """Load logs from HA storage."""
-        stored_data = await self.last_panel_log_events_store.async_load()
-        if stored_data and "logs" in stored_data:
-            last_panel_log_events = deserialize_panel_log_events(stored_data["logs"])
-        else:
-            last_panel_log_events = []
-        return last_panel_log_events
+    @callback
+    def _async_project(self, events: List[LogEvent]) -> None:
+        """Show the zone and partition changes of the new events until the next poll."""
+        if self.log_event_projector is None:
+            return
 
-    async def async_save_current_panel_log_events(
-            self,
-            current_panel_log_events: List[LogEvent]
-    ):
-        if current_panel_log_events:
-            await self.last_panel_log_events_store.async_save(
-                {"logs": serialize_panel_log_events(current_panel_log_events)}
+        # The coordinators fetch the projected statuses from the panel at their next refresh.
+        self.log_event_projector.project(events)
+
+    @callback
+    def _async_refresh_affected(self, events: List[LogEvent]) -> None:
+        """Refresh at once the coordinators affected by the new events."""
+        if not self.event_refresh_coordinators:
+            return
+
+        coordinator_keys = set()
+        for event in events:
+            event_coordinator_keys = classify_panel_log_event(event)
+            if not event_coordinator_keys:
+                # Unknown type: something changed, but not known where.
+                self.fetch_stats.unclassified_events += 1
+                event_coordinator_keys = self.event_refresh_coordinators.keys()
+            coordinator_keys.update(event_coordinator_keys)
+
+        for coordinator_key in coordinator_keys:
+            coordinator = self.event_refresh_coordinators.get(coordinator_key)
+            if coordinator is None:
+                continue
+
+            self.fetch_stats.event_refreshes[coordinator_key] = (
+                    self.fetch_stats.event_refreshes.get(coordinator_key, 0) + 1
+            )
+            # A status read before the events happened must not be served from the client cache.
+            self.entry.async_create_background_task(
+                self.hass,
+                coordinator.async_request_fresh_refresh(),
+                name = f"{coordinator.name} - log event refresh",
             )
 
+        _LOGGER.debug(
+            "%d new log events, refreshing %s",
+            len(events),
+            sorted(coordinator_keys),
+        )
+
+    async def _async_backfill(self) -> None:
+        """Recover and replay the events added while HA was down."""
+        self.fetch_stats.polls += 1
+
+        self.fetch_stats.requests += 1
+        new_events, unrecovered = await async_backfill_panel_log_events(
+            watermark = self.watermark,
+            client = self.client,
+        )
+
+        # Only a completed backfill is not retried at the next poll
+        self._backfill_pending = False
+        self.fetch_stats.backfill_recovered = len(new_events)
+        self.fetch_stats.backfill_unrecovered = unrecovered
+
+        if unrecovered != 0:
+            _LOGGER.warning(
+                "Recovered %d panel log events added while Home Assistant was down, %s older events could not be recovered",
+                len(new_events),
+                "some" if unrecovered is None else unrecovered,
+            )
+        elif new_events:
+            _LOGGER.debug(
+                "Recovered %d panel log events added while Home Assistant was down",
+                len(new_events),
+            )
+
+        # Replay the recovered events oldest first, in bounded batches. The batches are
+        # dispatched in the background by the entity, so this refresh is not stalled.
+        for index in range(0, len(new_events), PANEL_LOG_EVENTS_REPLAY_BATCH_SIZE):
+            await self.panel_log_events_entity.handle_events(
+                new_events[index:index + PANEL_LOG_EVENTS_REPLAY_BATCH_SIZE],
+                replayed = True,
+            )
+
+        if new_events:
+            self.watermark.add(new_events)
+            self.async_schedule_save_watermark()
+
+    async def async_load_watermark(self) -> PanelLogEventsWatermark:
+        """Load the watermark from HA storage, older layouts are migrated by the store."""
+        stored_data = await self.last_panel_log_events_store.async_load()
+        if stored_data:
+            return PanelLogEventsWatermark.from_storage(stored_data)
+        return PanelLogEventsWatermark()
+
+    @callback
+    def async_schedule_save_watermark(self) -> None:
+        """Save the watermark after a delay, coalescing the writes of consecutive polls.
+
+        A pending write is not delayed again, so the watermark is written at least every
+        `PANEL_LOG_EVENTS_SAVE_DELAY` seconds under constant activity. The store flushes
+        a pending write when HA stops.
+        """
+        if self._watermark_dirty:
+            # The pending write saves the watermark as it is then.
+            return
+
+        self._watermark_dirty = True
+        self.last_panel_log_events_store.async_delay_save(
+            self._watermark_to_save,
+            PANEL_LOG_EVENTS_SAVE_DELAY,
+        )
+
+    @callback
+    def _watermark_to_save(self) -> dict:
+        self._watermark_dirty = False
+        return self.watermark.as_storage()
+
+    async def async_save_watermark(self):
+        """Save the watermark now, replacing any pending delayed write."""
+        await self.last_panel_log_events_store.async_save(self._watermark_to_save())
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+
+        # Flush the pending watermark write, the entry is unloaded.
+        if self._watermark_dirty:
+            await self.async_save_watermark()
+
+    def get_fetch_stats(self) -> dict:
+        """Return the fetch statistics and the current event rate estimate."""
+        return {
+            "polls": self.fetch_stats.polls,
+            "requests": self.fetch_stats.requests,
+            "requests_per_poll": round(self.fetch_stats.requests_per_poll, 3),
+            "saturations": self.fetch_stats.saturations,
+            "last_window": self.fetch_stats.last_window,
+            "events_per_poll": round(self.window_estimator.events_per_poll, 3),
+            "backfill_recovered": self.fetch_stats.backfill_recovered,
+            "backfill_unrecovered": self.fetch_stats.backfill_unrecovered,
+            "event_refreshes": dict(self.fetch_stats.event_refreshes),
+            "unclassified_events": self.fetch_stats.unclassified_events,
+        }
+
     async def async_startup(self) -> None:
         """Load persisted data before first refresh."""
-        self.last_panel_log_events = await self.async_load_last_panel_log_events()
+        self.watermark = await self.async_load_watermark()
+
+        # Without a watermark (first start) there is nothing to recover.
+        self._backfill_pending = self.watermark.last_id is not None
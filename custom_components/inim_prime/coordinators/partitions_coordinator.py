@@ -1,25 +1,26 @@
 import logging
-from datetime import timedelta
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterable
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from inim_prime_api import InimPrimeClient
-from inim_prime_api.models.partition import PartitionStatus
+from inim_prime_api.models.partition import PartitionMode, PartitionStatus
+from .keyed_coordinator import InimPrimeKeyedUpdateCoordinator
+from ..helpers.client import InimPrimeCoalescingClient
 
 _LOGGER = logging.getLogger(__name__)
 
-class InimPrimePartitionsUpdateCoordinator(DataUpdateCoordinator[Dict[int, PartitionStatus]]):
+class InimPrimePartitionsUpdateCoordinator(InimPrimeKeyedUpdateCoordinator[PartitionStatus]):
     """Coordinator to fetch partitions from the panel."""
 
     def __init__(
             self,
             hass: HomeAssistant,
-            update_interval: timedelta,
+            update_interval: timedelta | None,
             entry: ConfigEntry,
-            client: InimPrimeClient,
+            client: InimPrimeCoalescingClient,
     ):
         super().__init__(
             hass = hass,
@@ -32,13 +33,55 @@ class InimPrimePartitionsUpdateCoordinator(DataUpdateCoordinator[Dict[int, Parti
         self.data: Dict[int, PartitionStatus] = {}  # just an empty dict
         self.entry = entry
 
+        # Set when the data has been restored from the snapshot, until the first successful refresh.
+        self.stale_since: datetime | None = None
+
+    @callback
+    def async_set_fetched_data(
+            self,
+            partitions: Dict[int, PartitionStatus],
+            fetch_started: float,
+    ) -> None:
+        """Apply statuses fetched outside a refresh, as a successful refresh would."""
+        self.fetched_data = partitions
+        self._reconcile_projections(partitions, fetch_started)
+        partitions = self._apply_pending(partitions)
+
+        self._async_track_changes(partitions)
+        self._mark_fresh()
+
+        self.async_set_updated_data(partitions)
+
+    @callback
+    def async_set_fetch_error(self, err: Exception) -> None:
+        """Record a fetch failed outside a refresh, as a failed refresh would."""
+        try:
+            self._stale_or_raise(err)
+        except UpdateFailed as update_failed:
+            self.async_set_update_error(update_failed)
+        else:
+            self.async_update_listeners()
+
+    def _aggregate_keys(self, partition: PartitionStatus) -> Iterable[Hashable]:
+        yield ("state", partition.state)
+        yield ("mode", partition.mode)
+        if partition.mode != PartitionMode.DISARMED:
+            yield "armed"
+        if partition.alarm_memory:
+            yield "alarm_memory"
+
+    async def _async_fetch_statuses(self, max_age: float | None = None) -> Dict[int, PartitionStatus]:
+        return await self.client.get_partitions_status(max_age = max_age)
+
     async def _async_update_data(self) -> Dict[int, PartitionStatus]:
         """Fetch data from API."""
         try:
-            partitions = await self.client.get_partitions_status()
+            partitions = await self._async_fetch_data()
 
+            self._async_track_changes(partitions)
             self.data = partitions
+            self._mark_fresh()
 
             return self.data
         except Exception as err:
-            raise UpdateFailed(err) from err
+            return self._stale_or_raise(err)
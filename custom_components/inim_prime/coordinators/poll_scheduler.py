@@ -0,0 +1,457 @@
+import asyncio
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+_LOGGER = logging.getLogger(__name__)
+
+# While the circuit breaker is open, the panel is probed after this many seconds,
+# doubled after every failed probe up to the maximum.
+CIRCUIT_BREAKER_PROBE_DELAY = 30
+CIRCUIT_BREAKER_PROBE_DELAY_MAX = 300
+
+# At most this fraction of the request rate can be reserved, the rest is always
+# left to the requests spaced by `RequestBudget.async_wait_slot`.
+REQUEST_BUDGET_MAX_RESERVED_SHARE = 0.5
+
+
+class RequestBudget:
+    """Limit the request rate against the panel.
+
+    The budget only spaces the requests: the number of requests in flight is
+    bounded by the request queue of the client, which every request goes through.
+
+    A share of the rate can be reserved with `reserve` by a caller pacing its own
+    requests at a fixed cadence: the requests waiting in `async_wait_slot` are then
+    spaced according to the rest of the rate.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self._requests_per_second = requests_per_second
+        self._reserved = 0.0
+        self._next_slot = 0.0
+
+    @property
+    def _min_spacing(self) -> float:
+        return 1 / (self._requests_per_second - self._reserved)
+
+    def reserve(self, requests_per_second: float) -> float:
+        """Reserve a share of the rate, replacing the previous one, return the share granted.
+
+        The share is capped at `REQUEST_BUDGET_MAX_RESERVED_SHARE` of the rate.
+        """
+        self._reserved = min(
+            requests_per_second,
+            self._requests_per_second * REQUEST_BUDGET_MAX_RESERVED_SHARE,
+        )
+        return self._reserved
+
+    def release(self) -> None:
+        """Give the reserved share back to the requests waiting in `async_wait_slot`."""
+        self._reserved = 0.0
+
+    def configure(self, requests_per_second: float) -> None:
+        """Change the rate, effective for the next requests."""
+        self._requests_per_second = requests_per_second
+        # The reserving caller asks again for its share at its next request.
+        self._reserved = min(self._reserved, requests_per_second * REQUEST_BUDGET_MAX_RESERVED_SHARE)
+
+    async def async_wait_slot(self) -> None:
+        """Wait for the next free slot, nothing is held once it returns."""
+        # Reserve the next free slot and wait for it, so that consecutive
+        # requests are spaced by at least `1 / requests_per_second`.
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._min_spacing
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class PollStats:
+    """Scheduling statistics of a single coordinator."""
+    ticks: int = 0
+    skipped_ticks: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
+
+    @property
+    def average_lag(self) -> float:
+        if self.ticks:
+            return self.total_lag / self.ticks
+        return 0.0
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Statistics of the circuit breaker of the poll scheduler."""
+    opened: int = 0
+    probes: int = 0
+    failed_probes: int = 0
+    open_since: Optional[float] = None
+    total_open_duration: float = 0.0
+
+
+@dataclass
+class _PollSlot:
+    coordinator: DataUpdateCoordinator
+    interval: float
+    offset: float = 0.0
+    due: float = 0.0
+    unsub: Optional[CALLBACK_TYPE] = None
+    refresh_task: Optional[asyncio.Task] = None
+    # Set while another loop refreshes the coordinator, the ticks are then idle.
+    suspended: bool = False
+    stats: PollStats = field(default_factory = PollStats)
+
+
+class InimPrimePollScheduler:
+    """Drive the refresh of all coordinators of a config entry against a single panel.
+
+    Coordinators are registered without an HA update interval: the scheduler owns
+    the timing, spreads the ticks of the coordinators across the shortest interval
+    so they never hit the panel at the same moment, runs every tick through a shared
+    request budget and skips a tick if the previous one for the same coordinator
+    is still running.
+
+    After `breaker_threshold` consecutive failed refreshes the circuit breaker opens:
+    polling is paused and the panel is probed with the single `probe` request, less
+    and less often, until it answers. Every coordinator is then refreshed at once.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            requests_per_second: float,
+            breaker_threshold: int = 0,
+            probe: Optional[Callable[[], Awaitable]] = None,
+    ):
+        self.hass = hass
+        self.entry = entry
+        self.breaker_threshold = breaker_threshold
+        self.probe = probe
+        self.budget = RequestBudget(requests_per_second = requests_per_second)
+        self._slots: Dict[str, _PollSlot] = {}
+        self._started = False
+        self._listeners: List[CALLBACK_TYPE] = []
+        self._tick_listeners: List[Callable[[DataUpdateCoordinator], None]] = []
+
+        self.breaker_open = False
+        self.breaker_stats = CircuitBreakerStats()
+        self._failed_ticks = 0
+        self._probe_delay = CIRCUIT_BREAKER_PROBE_DELAY
+        self._unsub_probe: Optional[CALLBACK_TYPE] = None
+
+    def register(
+            self,
+            coordinator: DataUpdateCoordinator,
+            update_interval: timedelta,
+    ) -> None:
+        """Register a coordinator to be refreshed every `update_interval`."""
+        self._slots[coordinator.name] = _PollSlot(
+            coordinator = coordinator,
+            interval = update_interval.total_seconds(),
+        )
+
+    def get_interval(self, coordinator: DataUpdateCoordinator) -> timedelta:
+        """Return the current refresh interval of a coordinator."""
+        return timedelta(seconds = self._slots[coordinator.name].interval)
+
+    @callback
+    def async_set_interval(
+            self,
+            coordinator: DataUpdateCoordinator,
+            update_interval: timedelta,
+    ) -> None:
+        """Change the refresh interval of a coordinator, effective from its next tick."""
+        slot = self._slots[coordinator.name]
+        interval = update_interval.total_seconds()
+
+        if interval == slot.interval:
+            return
+
+        previous_interval = slot.interval
+        slot.interval = interval
+
+        if slot.unsub:
+            # Move the pending tick as if the last one had been scheduled with the new interval.
+            slot.unsub()
+            slot.due = max(
+                self.hass.loop.time(),
+                slot.due - previous_interval + interval,
+            )
+            self._schedule(slot)
+
+        _LOGGER.debug(
+            "%s refresh interval changed from %.1f to %.1f seconds",
+            coordinator.name,
+            previous_interval,
+            interval,
+        )
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_suspend(self, coordinator: DataUpdateCoordinator) -> None:
+        """Stop refreshing a coordinator, its ticks keep their phase until resumed."""
+        self._slots[coordinator.name].suspended = True
+
+    @callback
+    def async_resume(self, coordinator: DataUpdateCoordinator) -> None:
+        """Refresh a suspended coordinator again from its next tick."""
+        self._slots[coordinator.name].suspended = False
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for refresh interval changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_tick_listener(
+            self,
+            tick_callback: Callable[[DataUpdateCoordinator], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for completed scheduled refreshes, the refreshed coordinator is passed to the callback."""
+        self._tick_listeners.append(tick_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._tick_listeners.remove(tick_callback)
+
+        return remove_listener
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling all the registered coordinators."""
+        if self._started or self.entry.pref_disable_polling or not self._slots:
+            return
+
+        self._started = True
+
+        # Stagger the coordinators across the shortest interval: with intervals that
+        # are multiples of each other, every coordinator then keeps its own phase.
+        spacing = min(slot.interval for slot in self._slots.values()) / len(self._slots)
+        now = self.hass.loop.time()
+
+        for index, slot in enumerate(self._slots.values()):
+            slot.offset = index * spacing
+            slot.due = now + slot.offset + slot.interval
+            self._schedule(slot)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling, running refreshes are left to complete."""
+        self._started = False
+
+        for slot in self._slots.values():
+            if slot.unsub:
+                slot.unsub()
+                slot.unsub = None
+
+        if self._unsub_probe:
+            self._unsub_probe()
+            self._unsub_probe = None
+
+    @callback
+    def _schedule(self, slot: _PollSlot) -> None:
+        slot.unsub = self.hass.loop.call_at(
+            slot.due,
+            partial(self._handle_tick, slot),
+        ).cancel
+
+    @callback
+    def _handle_tick(self, slot: _PollSlot) -> None:
+        slot.unsub = None
+
+        if not self._started or self.hass.is_stopping:
+            return
+
+        if slot.suspended or self.breaker_open:
+            pass
+        elif slot.refresh_task and not slot.refresh_task.done():
+            # The previous tick is still waiting for the panel, do not pile up requests.
+            slot.stats.skipped_ticks += 1
+            _LOGGER.debug(
+                "Skipping %s tick, previous refresh still running",
+                slot.coordinator.name,
+            )
+        else:
+            slot.refresh_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_tick(slot, slot.due),
+                name = f"{slot.coordinator.name} - scheduled refresh",
+            )
+
+        # Drift-free: the next tick is computed from the target time, not from now.
+        # If the loop fell behind by more than one interval, the missed ticks are dropped.
+        now = self.hass.loop.time()
+        slot.due += slot.interval
+        if slot.due <= now:
+            missed = math.ceil((now - slot.due) / slot.interval)
+            slot.due += missed * slot.interval
+            slot.stats.skipped_ticks += missed
+
+        self._schedule(slot)
+
+    async def _async_tick(self, slot: _PollSlot, due: float) -> None:
+        # Only the start of the refresh is spaced, its requests are bounded by the
+        # request queue of the client while they are in flight.
+        await self.budget.async_wait_slot()
+        lag = max(0.0, self.hass.loop.time() - due)
+
+        slot.stats.ticks += 1
+        slot.stats.last_lag = lag
+        slot.stats.total_lag += lag
+        slot.stats.max_lag = max(slot.stats.max_lag, lag)
+
+        await slot.coordinator.async_refresh()
+
+        self._async_record_tick(slot.coordinator)
+
+        for tick_callback in list(self._tick_listeners):
+            tick_callback(slot.coordinator)
+
+    @callback
+    def _async_record_tick(self, coordinator: DataUpdateCoordinator) -> None:
+        # Failures tolerated by the coordinators (stale data) do not count.
+        if coordinator.last_update_success:
+            self._failed_ticks = 0
+            return
+
+        self._failed_ticks += 1
+        if (
+                self.probe is not None and
+                self.breaker_threshold and
+                not self.breaker_open and
+                self._failed_ticks >= self.breaker_threshold
+        ):
+            self._async_open_breaker()
+
+    @callback
+    def _async_open_breaker(self) -> None:
+        self.breaker_open = True
+        self.breaker_stats.opened += 1
+        self.breaker_stats.open_since = self.hass.loop.time()
+        self._probe_delay = CIRCUIT_BREAKER_PROBE_DELAY
+
+        _LOGGER.warning(
+            "The panel failed %d refreshes in a row, polling paused until it answers again",
+            self._failed_ticks,
+        )
+
+        # No coordinator keeps serving stale data while polling is paused.
+        for slot in self._slots.values():
+            if slot.coordinator.last_update_success:
+                slot.coordinator.async_set_update_error(
+                    UpdateFailed("Polling paused, the panel is not answering")
+                )
+
+        self._schedule_probe()
+
+    @callback
+    def _schedule_probe(self) -> None:
+        self._unsub_probe = self.hass.loop.call_later(
+            self._probe_delay,
+            self._handle_probe,
+        ).cancel
+
+    @callback
+    def _handle_probe(self) -> None:
+        self._unsub_probe = None
+
+        if not self._started or self.hass.is_stopping:
+            return
+
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_probe(),
+            name = f"{self.entry.title} - panel probe",
+        )
+
+    async def _async_probe(self) -> None:
+        self.breaker_stats.probes += 1
+
+        try:
+            await self.budget.async_wait_slot()
+            await self.probe()
+        except Exception as err:
+            self.breaker_stats.failed_probes += 1
+            self._probe_delay = min(self._probe_delay * 2, CIRCUIT_BREAKER_PROBE_DELAY_MAX)
+            _LOGGER.debug("Panel probe failed, next one in %d seconds: %s", self._probe_delay, err)
+
+            if self._started:
+                self._schedule_probe()
+            return
+
+        self._async_close_breaker()
+
+    @callback
+    def _async_close_breaker(self) -> None:
+        self.breaker_open = False
+        self._failed_ticks = 0
+        self.breaker_stats.total_open_duration += self.hass.loop.time() - self.breaker_stats.open_since
+        self.breaker_stats.open_since = None
+
+        _LOGGER.info("The panel answers again, polling resumed")
+
+        # Refresh everything now instead of waiting for the next ticks.
+        now = self.hass.loop.time()
+        for slot in self._slots.values():
+            if slot.suspended or (slot.refresh_task and not slot.refresh_task.done()):
+                continue
+            slot.refresh_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_tick(slot, now),
+                name = f"{slot.coordinator.name} - resumed refresh",
+            )
+
+    def get_breaker_stats(self) -> dict:
+        """Return the circuit breaker statistics."""
+        open_duration = self.breaker_stats.total_open_duration
+        if self.breaker_stats.open_since is not None:
+            open_duration += self.hass.loop.time() - self.breaker_stats.open_since
+
+        return {
+            "open": self.breaker_open,
+            "threshold": self.breaker_threshold,
+            "failed_refreshes": self._failed_ticks,
+            "opened": self.breaker_stats.opened,
+            "probes": self.breaker_stats.probes,
+            "failed_probes": self.breaker_stats.failed_probes,
+            "open_duration": round(open_duration, 3),
+        }
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Return the scheduling statistics of every coordinator."""
+        return {
+            name: {
+                "interval": slot.interval,
+                "offset": round(slot.offset, 3),
+                "ticks": slot.stats.ticks,
+                "skipped_ticks": slot.stats.skipped_ticks,
+                "last_lag": round(slot.stats.last_lag, 3),
+                "average_lag": round(slot.stats.average_lag, 3),
+                "max_lag": round(slot.stats.max_lag, 3),
+                "suspended": slot.suspended,
+                "consecutive_failures": getattr(slot.coordinator, "consecutive_failures", None),
+                "tolerated_failures": getattr(slot.coordinator, "tolerated_failures", None),
+            }
+            for name, slot in self._slots.items()
+        }
@@ -0,0 +1,95 @@
+import logging
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from ..const import (
+    CONF_STALE_MAX_FAILURES,
+    CONF_STALE_MAX_FAILURES_DEFAULT,
+    CONF_STALE_MAX_AGE,
+    CONF_STALE_MAX_AGE_DEFAULT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StaleWhileRevalidateMixin:
+    """Keep serving the last good data while the panel briefly fails to answer.
+
+    A failed refresh is tolerated, flagging the data with `stale_since`, until
+    `stale_max_failures` consecutive failures or `stale_max_age` seconds since the
+    first one, so a single dropped request does not make the entities unavailable.
+    Data restored from the snapshot counts as good data.
+
+    Must be placed before `DataUpdateCoordinator` in the bases of the coordinator,
+    which must define `stale_since`.
+    """
+
+    stale_since: datetime | None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Consecutive failed fetches, tolerated or not.
+        self.consecutive_failures = 0
+        self.tolerated_failures = 0
+        # Successful fetches, tells the fresh data apart from data changed in between.
+        self.fresh_fetches = 0
+
+        self._last_success: datetime | None = None
+        self._first_failure: Optional[float] = None
+
+    @property
+    def stale_max_failures(self) -> int:
+        # Return the number of consecutive failures served from the last good data, from options.
+        return self.config_entry.options.get("resilience", {}).get(
+            CONF_STALE_MAX_FAILURES,
+            CONF_STALE_MAX_FAILURES_DEFAULT,
+        )
+
+    @property
+    def stale_max_age(self) -> int:
+        # Return for how long failures are served from the last good data, from options.
+        return self.config_entry.options.get("resilience", {}).get(
+            CONF_STALE_MAX_AGE,
+            CONF_STALE_MAX_AGE_DEFAULT,
+        )
+
+    def _mark_fresh(self) -> None:
+        """Record a successful fetch, call when the fetched data is stored."""
+        self.stale_since = None
+        self.fresh_fetches += 1
+        self.consecutive_failures = 0
+        self._first_failure = None
+        self._last_success = dt_util.utcnow()
+
+    def _stale_or_raise(self, err: Exception) -> Any:
+        """Record a failed fetch, return the last good data if tolerated, raise otherwise."""
+        self.consecutive_failures += 1
+        if self._first_failure is None:
+            self._first_failure = time.monotonic()
+
+        tolerated = (
+                (self._last_success is not None or self.stale_since is not None) and
+                self.consecutive_failures <= self.stale_max_failures and
+                time.monotonic() - self._first_failure < self.stale_max_age
+        )
+        if not tolerated:
+            raise UpdateFailed(err) from err
+
+        self.tolerated_failures += 1
+        if self.stale_since is None:
+            # The data is as old as the last successful fetch.
+            self.stale_since = self._last_success
+
+        _LOGGER.debug(
+            "%s fetch failed (%d in a row), serving the data of %s: %s",
+            self.name,
+            self.consecutive_failures,
+            self.stale_since.isoformat(),
+            err,
+        )
+        return self.data
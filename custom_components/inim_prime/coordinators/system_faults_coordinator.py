@@ -1,25 +1,26 @@
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Dict
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from inim_prime_api import InimPrimeClient
 from inim_prime_api.models.system_faults import SystemFaultsStatus
+from .stale import StaleWhileRevalidateMixin
+from ..helpers.client import InimPrimeCoalescingClient
 
 _LOGGER = logging.getLogger(__name__)
 
-class InimPrimeSystemFaultsUpdateCoordinator(DataUpdateCoordinator[SystemFaultsStatus]):
+class InimPrimeSystemFaultsUpdateCoordinator(StaleWhileRevalidateMixin, DataUpdateCoordinator[SystemFaultsStatus]):
     """Coordinator to fetch system faults from the panel."""
 
     def __init__(
             self,
             hass: HomeAssistant,
-            update_interval: timedelta,
+            update_interval: timedelta | None,
             entry: ConfigEntry,
-            client: InimPrimeClient,
+            client: InimPrimeCoalescingClient,
     ):
         super().__init__(
             hass = hass,
@@ -35,13 +36,28 @@ class InimPrimeSystemFaultsUpdateCoordinator(DataUpdateCoordinator[SystemFaultsS
         )
         self.entry = entry
 
+        # Set when the data has been restored from the snapshot, until the first successful refresh.
+        self.stale_since: datetime | None = None
+
+        # Set when the next fetch must reach the panel, not the client cache.
+        self._fetch_fresh = False
+
+    async def async_request_fresh_refresh(self) -> None:
+        """Request a refresh whose fetch skips the client cache."""
+        self._fetch_fresh = True
+        await self.async_request_refresh()
+
     async def _async_update_data(self) -> SystemFaultsStatus:
         """Fetch data from API."""
+        max_age = 0 if self._fetch_fresh else None
+        self._fetch_fresh = False
+
         try:
-            system_faults = await self.client.get_system_faults_status()
+            system_faults = await self.client.get_system_faults_status(max_age = max_age)
 
             self.data = system_faults
+            self._mark_fresh()
 
             return self.data
         except Exception as err:
-            raise UpdateFailed(err) from err
+            return self._stale_or_raise(err)
@@ -1,30 +1,30 @@
 import logging
 from dataclasses import dataclass, field
-from datetime import timedelta
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from inim_prime_api import InimPrimeClient
 from inim_prime_api.models.partition import PartitionStatus
 from inim_prime_api.models.zone import ZoneStatus
 from inim_prime_api.models.system_faults import SystemFaultsStatus
 from inim_prime_api.models.gsm import GSMSStatus
 from inim_prime_api.models.output import OutputStatus
+from .keyed_coordinator import InimPrimeKeyedUpdateCoordinator
+from ..helpers.client import InimPrimeCoalescingClient
 
 _LOGGER = logging.getLogger(__name__)
 
-class InimPrimeZonesUpdateCoordinator(DataUpdateCoordinator[Dict[int, ZoneStatus]]):
+class InimPrimeZonesUpdateCoordinator(InimPrimeKeyedUpdateCoordinator[ZoneStatus]):
     """Coordinator to fetch zones from the panel."""
 
     def __init__(
             self,
             hass: HomeAssistant,
-            update_interval: timedelta,
+            update_interval: timedelta | None,
             entry: ConfigEntry,
-            client: InimPrimeClient,
+            client: InimPrimeCoalescingClient,
     ):
         super().__init__(
             hass = hass,
@@ -37,13 +37,28 @@ class InimPrimeZonesUpdateCoordinator(DataUpdateCoordinator[Dict[int, ZoneStatus
         self.data: Dict[int, ZoneStatus] = {}  # just an empty dict
         self.entry = entry
 
+        # Set when the data has been restored from the snapshot, until the first successful refresh.
+        self.stale_since: datetime | None = None
+
+    def _aggregate_keys(self, zone: ZoneStatus) -> Iterable[Hashable]:
+        yield ("state", zone.state)
+        if zone.excluded:
+            yield "excluded"
+        if zone.alarm_memory:
+            yield "alarm_memory"
+
+    async def _async_fetch_statuses(self, max_age: float | None = None) -> Dict[int, ZoneStatus]:
+        return await self.client.get_zones_status(max_age = max_age)
+
     async def _async_update_data(self) -> Dict[int, ZoneStatus]:
         """Fetch data from API."""
         try:
-            zones = await self.client.get_zones_status()
+            zones = await self._async_fetch_data()
 
+            self._async_track_changes(zones)
             self.data = zones
+            self._mark_fresh()
 
             return self.data
         except Exception as err:
-            raise UpdateFailed(err) from err
+            return self._stale_or_raise(err)
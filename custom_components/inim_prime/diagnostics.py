@@ -22,6 +22,7 @@ from .coordinators import (
     InimPrimeSystemFaultsUpdateCoordinator,
     InimPrimeGSMUpdateCoordinator,
     InimPrimePanelLogEventsCoordinator,
+    InimPrimePollScheduler,
 )
 
 async def async_get_config_entry_diagnostics(
@@ -36,6 +37,7 @@ async def async_get_config_entry_diagnostics(
     system_faults_coordinator: InimPrimeSystemFaultsUpdateCoordinator = coordinators[SYSTEM_FAULTS_COORDINATOR]
     gsm_coordinator: InimPrimeGSMUpdateCoordinator = coordinators[GSM_COORDINATOR]
     panel_log_events_coordinator: InimPrimePanelLogEventsCoordinator = coordinators[PANEL_LOG_EVENTS_COORDINATOR]
+    poll_scheduler: InimPrimePollScheduler = hass.data[DOMAIN][config_entry.entry_id]["poll_scheduler"]
 
     return {
         "panel": {
@@ -73,7 +75,28 @@ async def async_get_config_entry_diagnostics(
             "operator": gsm_coordinator.data.operator,
             "signal_strength": gsm_coordinator.data.signal_strength,
             "credit": gsm_coordinator.data.credit,
+            "polling": gsm_coordinator.get_stats(),
         },
+        "polling": poll_scheduler.get_stats(),
+        "circuit_breaker": poll_scheduler.get_breaker_stats(),
+        "alarm_watch": (
+            alarm_watch.get_stats()
+            if (alarm_watch := hass.data[DOMAIN][config_entry.entry_id].get("alarm_watch"))
+            else None
+        ),
+        "log_event_projection": (
+            panel_log_events_coordinator.log_event_projector.get_stats()
+            if panel_log_events_coordinator.log_event_projector
+            else None
+        ),
+        "log_events_fetch": panel_log_events_coordinator.get_fetch_stats(),
+        "entity_discovery": hass.data[DOMAIN][config_entry.entry_id]["entity_discovery"].get_stats(),
+        "client": hass.data[DOMAIN][config_entry.entry_id]["client"].get_stats(),
+        "commands": {
+            **zones_coordinator.get_command_stats(),
+            **partitions_coordinator.get_command_stats(),
+        },
+        "setup": hass.data[DOMAIN][config_entry.entry_id]["setup_stats"],
     }
 
 
@@ -155,7 +178,7 @@ async def async_get_device_diagnostics(
                     "active_faults": [
                         fault.name for fault in system_faults_coordinator.data.faults
                     ],
-                    "log_events": panel_log_events_coordinator.last_panel_log_events,
+                    "log_events_watermark": panel_log_events_coordinator.watermark.as_dict(),
                 }
 
     return device_info
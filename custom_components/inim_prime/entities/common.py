@@ -0,0 +1,27 @@
+from typing import Any
+
+
+class StaleAttributesMixin:
+    """Expose the `stale_since` attribute while the coordinator serves stale data.
+
+    Must be placed before `CoordinatorEntity` in the bases of the entity.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        stale_since = getattr(self.coordinator, "stale_since", None)
+        if stale_since:
+            return {"stale_since": stale_since.isoformat()}
+        return None
+
+
+class ReportedStatusMixin:
+    """Make the entity of a zone or partition unavailable while the panel does not report it.
+
+    Must be placed before `CoordinatorEntity` in the bases of the entity, created with
+    the ID of its zone or partition as context.
+    """
+
+    @property
+    def available(self) -> bool:
+        return super().available and self.coordinator_context in (self.coordinator.data or {})
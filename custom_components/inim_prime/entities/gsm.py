@@ -6,6 +6,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..coordinators import InimPrimeGSMUpdateCoordinator
 from ..const import DOMAIN, INIM_PRIME_DEVICE_MANUFACTURER, CONF_SERIAL_NUMBER
+from .common import StaleAttributesMixin
 
 
 def create_gsm_device_info(
@@ -24,6 +25,7 @@ def create_gsm_device_info(
 
 
 class GSMSupplyVoltageSensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeGSMUpdateCoordinator],
     SensorEntity,
 ):
@@ -38,7 +40,7 @@ class GSMSupplyVoltageSensor(
             coordinator: InimPrimeGSMUpdateCoordinator,
             entry: ConfigEntry,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = "supply_voltage")
 
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_gsm_supply_voltage"
 
@@ -54,6 +56,7 @@ class GSMSupplyVoltageSensor(
 
 
 class GSMOperatorSensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeGSMUpdateCoordinator],
     SensorEntity,
 ):
@@ -66,7 +69,7 @@ class GSMOperatorSensor(
             coordinator: InimPrimeGSMUpdateCoordinator,
             entry: ConfigEntry,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = "operator")
 
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_gsm_operator"
 
@@ -82,6 +85,7 @@ class GSMOperatorSensor(
 
 
 class GSMSignalStrengthSensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeGSMUpdateCoordinator],
     SensorEntity,
 ):
@@ -96,7 +100,7 @@ class GSMSignalStrengthSensor(
             coordinator: InimPrimeGSMUpdateCoordinator,
             entry: ConfigEntry,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = "signal_strength")
 
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_gsm_signal_strength"
 
@@ -112,6 +116,7 @@ class GSMSignalStrengthSensor(
 
 
 class GSMCreditSensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeGSMUpdateCoordinator],
     SensorEntity,
 ):
@@ -124,7 +129,7 @@ class GSMCreditSensor(
             coordinator: InimPrimeGSMUpdateCoordinator,
             entry: ConfigEntry,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = "credit")
 
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_gsm_credit"
 
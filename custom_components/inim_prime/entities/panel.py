@@ -1,21 +1,31 @@
 import asyncio
+import logging
+import time
+from collections import deque
+from typing import Hashable
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.event import EventEntity
+from homeassistant.components.select import SelectEntity
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
-from inim_prime_api.helpers.partitions import clear_all_partitions_alarm_memory
-from inim_prime_api.helpers.zones import include_all_zones
 from inim_prime_api.models.log_event import LogEvent
 from inim_prime_api.models.system_faults import SystemFault
-from ..const import INIM_PRIME_DEVICE_MANUFACTURER, CONF_SERIAL_NUMBER, DOMAIN
+from inim_prime_api.models.zone import ZoneState
+from ..const import INIM_PRIME_DEVICE_MANUFACTURER, CONF_SERIAL_NUMBER, DOMAIN, EVENT_PANEL_LOG_EVENT, \
+    EVENT_PANEL_LOG_EVENTS_BATCH
+from .common import StaleAttributesMixin
+from ..helpers.bulk import async_set_zones_exclusion, async_clear_partitions_alarm_memory, get_max_concurrent_writes
+from ..helpers.arming_profiles import async_apply_arming_profile
 from ..coordinators import InimPrimePanelLogEventsCoordinator, InimPrimeSystemFaultsUpdateCoordinator, \
-    InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator
+    InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator, InimPrimePollScheduler
+
+_LOGGER = logging.getLogger(__name__)
 
 
 def create_panel_device_info(
@@ -67,6 +77,7 @@ SYSTEM_FAULT_ICONS: dict[SystemFault, str] = {
 
 
 class SystemFaultBinarySensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeSystemFaultsUpdateCoordinator],
     BinarySensorEntity,
 ):
@@ -104,6 +115,7 @@ class SystemFaultBinarySensor(
 
 
 class PanelSupplyVoltageSensor(
+    StaleAttributesMixin,
     CoordinatorEntity[InimPrimeSystemFaultsUpdateCoordinator],
     SensorEntity,
 ):
@@ -146,43 +158,119 @@ class PanelLogEventsEvent(
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_panel_log_events"
         self._attr_device_info = create_panel_device_info(entry)
 
-    async def handle_events(self, log_events: list[LogEvent]) -> None:
-        for log_event in log_events:
-            self._trigger_event(
-                event_type = "generic",
+        self._serial_number = entry.data[CONF_SERIAL_NUMBER]
+        self._dispatch_queue: deque[tuple[list[LogEvent], bool]] = deque()
+        self._dispatch_task: asyncio.Task | None = None
+
+    async def handle_events(self, log_events: list[LogEvent], replayed: bool = False) -> None:
+        """Queue new log events, they are dispatched in order in the background.
+
+        Events recovered at startup are flagged as `replayed`.
+        """
+        self._dispatch_queue.append((log_events, replayed))
+
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = self.coordinator.config_entry.async_create_background_task(
+                self.hass,
+                self._async_dispatch_events(),
+                name = f"{self.entity_id} - dispatch log events",
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Dispatch the queued log events before the entity is removed.
+
+        The watermark already moved past them, they would never be fetched again.
+        """
+        await super().async_will_remove_from_hass()
+
+        while self._dispatch_task is not None and not self._dispatch_task.done():
+            if self._dispatch_queue:
+                _LOGGER.debug("Dispatching %d queued log event groups before removal", len(self._dispatch_queue))
+            # Events queued meanwhile start a new task, awaited in turn.
+            await asyncio.shield(self._dispatch_task)
+
+    async def _async_dispatch_events(self) -> None:
+        while self._dispatch_queue:
+            log_events, replayed = self._dispatch_queue.popleft()
+            dispatch_start = time.monotonic()
+
+            events_data = []
+            for log_event in log_events:
                 event_attributes = {
                     "timestamp": log_event.timestamp.isoformat(),
                     "type": log_event.type,
                     "agent": log_event.agent,
                     "location": log_event.location,
+                    "replayed": replayed,
+                }
+
+                self._trigger_event(
+                    event_type = "generic",
+                    event_attributes = event_attributes,
+                )
+                self.async_write_ha_state()
+
+                event_data = {
+                    "serial_number": self._serial_number,
+                    "id": log_event.id,
+                    "value": log_event.value,
+                    **event_attributes,
                 }
+                self.hass.bus.async_fire(EVENT_PANEL_LOG_EVENT, event_data)
+                events_data.append(event_data)
+
+                # Yield to the event loop, so that every state write is processed on its own.
+                await asyncio.sleep(0)
+
+            # A single event with the whole burst, for automations consuming bursts at once.
+            self.hass.bus.async_fire(
+                EVENT_PANEL_LOG_EVENTS_BATCH,
+                {
+                    "serial_number": self._serial_number,
+                    "replayed": replayed,
+                    "events": events_data,
+                },
             )
-            # Multiple events fired at the same time are only visible if self.async_write_ha_state() is triggered each time after waiting some time.
-            self.async_write_ha_state()
-            await asyncio.sleep(0.01)
 
+            _LOGGER.debug(
+                "Dispatched %d log events in %.3f seconds",
+                len(log_events),
+                time.monotonic() - dispatch_start,
+            )
 
-class ExcludedZonesCountSensor(
-    CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
+
+class AggregateCountSensor(
+    StaleAttributesMixin,
+    CoordinatorEntity[InimPrimeZonesUpdateCoordinator | InimPrimePartitionsUpdateCoordinator],
     SensorEntity,
 ):
-    _attr_name = "Excluded Zones"
-    _attr_icon = "mdi:cancel"
+    """Number of zones or partitions counted in an aggregate of their coordinator.
+
+    The coordinator keeps the aggregates up to date as the statuses change, so
+    reading the state does not go through every zone or partition.
+    """
+    _aggregate_key: Hashable
+    _unique_id_suffix: str
 
     def __init__(
             self,
-            coordinator: InimPrimeZonesUpdateCoordinator,
+            coordinator: InimPrimeZonesUpdateCoordinator | InimPrimePartitionsUpdateCoordinator,
             entry: ConfigEntry,
     ):
         super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_excluded_zones_count"
+        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_{self._unique_id_suffix}"
         self._attr_device_info = create_panel_device_info(entry)
 
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data:
-            return sum(zone.excluded for zone in self.coordinator.data.values())
-        return None
+        return self.coordinator.get_aggregate(self._aggregate_key)
+
+
+class ExcludedZonesCountSensor(AggregateCountSensor):
+    _attr_name = "Excluded Zones"
+    _attr_icon = "mdi:cancel"
+    _aggregate_key = "excluded"
+    _unique_id_suffix = "excluded_zones_count"
 
 
 class IncludeAllZonesButton(
@@ -207,15 +295,14 @@ class IncludeAllZonesButton(
         )
 
     async def async_press(self) -> None:
-        zones = await self.coordinator.client.get_zones_status()
-
-        await include_all_zones(
-            zones = zones,
-            client = self.coordinator.client,
+        # Only the excluded zones are sent to the panel, followed by a single refresh.
+        await async_set_zones_exclusion(
+            coordinator = self.coordinator,
+            zone_ids = list(self.coordinator.data),
+            exclude = False,
+            max_concurrent = get_max_concurrent_writes(self.coordinator.config_entry),
         )
 
-        await self.coordinator.async_request_refresh()
-
 
 class ClearAllPartitionsAlarmMemoryButton(
     CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
@@ -239,59 +326,121 @@ class ClearAllPartitionsAlarmMemoryButton(
         )
 
     async def async_press(self) -> None:
-        partitions = await self.coordinator.client.get_partitions_status()
-
-        await clear_all_partitions_alarm_memory(
-            partitions = partitions,
-            client = self.coordinator.client,
+        # Only the partitions with an alarm memory are sent to the panel, followed by a single refresh.
+        await async_clear_partitions_alarm_memory(
+            coordinator = self.coordinator,
+            max_concurrent = get_max_concurrent_writes(self.coordinator.config_entry),
         )
 
-        await self.coordinator.async_request_refresh()
-
 
-class ZonesAlarmMemoryCountSensor(
-    CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
-    SensorEntity,
-):
+class ZonesAlarmMemoryCountSensor(AggregateCountSensor):
     _attr_name = "Zones Alarm Memory"
     _attr_icon = "mdi:alarm-light"
+    _aggregate_key = "alarm_memory"
+    _unique_id_suffix = "zones_alarm_memory_count"
+
+
+class ZonesAlarmCountSensor(AggregateCountSensor):
+    _attr_name = "Zones in Alarm"
+    _attr_icon = "mdi:motion-sensor"
+    _aggregate_key = ("state", ZoneState.ALARM)
+    _unique_id_suffix = "zones_alarm_count"
+
+
+class PartitionsAlarmMemoryCountSensor(AggregateCountSensor):
+    _attr_name = "Partitions Alarm Memory"
+    _attr_icon = "mdi:alarm-light"
+    _aggregate_key = "alarm_memory"
+    _unique_id_suffix = "partitions_alarm_memory_count"
+
+
+class ArmedPartitionsCountSensor(AggregateCountSensor):
+    _attr_name = "Armed Partitions"
+    _attr_icon = "mdi:shield-lock"
+    _aggregate_key = "armed"
+    _unique_id_suffix = "armed_partitions_count"
+
+
+class ScanIntervalSensor(SensorEntity):
+    """Effective scan interval of a coordinator, as currently used by the poll scheduler."""
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-sync-outline"
+    _attr_should_poll = False
 
     def __init__(
             self,
-            coordinator: InimPrimeZonesUpdateCoordinator,
+            poll_scheduler: InimPrimePollScheduler,
+            coordinator: DataUpdateCoordinator,
             entry: ConfigEntry,
+            key: str,
+            name: str,
     ):
-        super().__init__(coordinator)
+        self.poll_scheduler = poll_scheduler
+        self.coordinator = coordinator
 
-        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_zones_alarm_memory_count"
+        self._attr_name = f"{name} Scan Interval"
+        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_{key}_scan_interval"
         self._attr_device_info = create_panel_device_info(entry)
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.poll_scheduler.async_add_listener(self.async_write_ha_state)
+        )
+
     @property
-    def native_value(self) -> int | None:
-        if self.coordinator.data:
-            return sum(zone.alarm_memory for zone in self.coordinator.data.values())
-        return None
+    def native_value(self) -> float:
+        return self.poll_scheduler.get_interval(self.coordinator).total_seconds()
 
 
-class PartitionsAlarmMemoryCountSensor(
-    CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
-    SensorEntity,
-):
-    _attr_name = "Partitions Alarm Memory"
-    _attr_icon = "mdi:alarm-light"
+class ArmingProfileSelect(SelectEntity):
+    """Apply one of the arming profiles configured in the options."""
+    _attr_name = "Arming Profile"
+    _attr_icon = "mdi:shield-star"
+    _attr_should_poll = False
 
     def __init__(
             self,
-            coordinator: InimPrimePartitionsUpdateCoordinator,
+            zones_coordinator: InimPrimeZonesUpdateCoordinator,
+            partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
             entry: ConfigEntry,
+            profiles: dict[str, dict],
     ):
-        super().__init__(coordinator)
+        self.zones_coordinator = zones_coordinator
+        self.partitions_coordinator = partitions_coordinator
+        self.profiles = profiles
 
-        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_partitions_alarm_memory_count"
+        self._attr_options = list(profiles)
+        self._attr_current_option = None
+        self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_arming_profile"
         self._attr_device_info = create_panel_device_info(entry)
 
+        self._last_apply: dict | None = None
+
     @property
-    def native_value(self) -> int | None:
-        if self.coordinator.data:
-            return sum(partition.alarm_memory for partition in self.coordinator.data.values())
-        return None
+    def extra_state_attributes(self) -> dict | None:
+        return self._last_apply
+
+    async def async_select_option(self, option: str) -> None:
+        """Apply the profile, the current option is the last profile applied successfully."""
+        result = await async_apply_arming_profile(
+            zones_coordinator = self.zones_coordinator,
+            partitions_coordinator = self.partitions_coordinator,
+            profile = self.profiles[option],
+            max_concurrent = get_max_concurrent_writes(self.zones_coordinator.config_entry),
+        )
+
+        _LOGGER.debug(
+            "Arming profile %s applied in %.3f seconds",
+            option,
+            result.duration,
+        )
+
+        self._attr_current_option = option
+        self._last_apply = {
+            "apply_duration": round(result.duration, 3),
+            "commands": len(result.disarm.changed) + len(result.zones.changed) + len(result.arm.changed),
+        }
+        self.async_write_ha_state()
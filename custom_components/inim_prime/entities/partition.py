@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.select import SelectEntity
@@ -9,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..coordinators import InimPrimePartitionsUpdateCoordinator
 from ..const import INIM_PRIME_DEVICE_MANUFACTURER, CONF_SERIAL_NUMBER, DOMAIN
+from .common import ReportedStatusMixin, StaleAttributesMixin
 from inim_prime_api.models.partition import (
     SetPartitionModeRequest,
     PartitionMode,
@@ -34,6 +37,8 @@ def create_partition_device_info(
 
 
 class PartitionStateSensor(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
     SensorEntity,
 ):
@@ -48,7 +53,7 @@ class PartitionStateSensor(
             entry: ConfigEntry,
             partition: PartitionStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = partition.id)
 
         self.partition_id = partition.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_partition_{self.partition_id}_state"
@@ -68,6 +73,8 @@ class PartitionStateSensor(
 
 
 class PartitionModeSelect(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
     SelectEntity,
 ):
@@ -81,7 +88,7 @@ class PartitionModeSelect(
             entry: ConfigEntry,
             partition: PartitionStatus
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = partition.id)
 
         self.partition_id = partition.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_partition_{self.partition_id}_mode"
@@ -109,11 +116,20 @@ class PartitionModeSelect(
             mode = mode,
         )
 
-        await self.coordinator.client.set_partition_mode(request)
-        await self.coordinator.async_request_refresh()
+        partition = self.coordinator.data.get(self.partition_id)
+
+        # Shown at once, until the panel confirms the mode or the command times out.
+        await self.coordinator.async_command(
+            kind = "partition_mode",
+            status_id = self.partition_id,
+            optimistic_status = replace(partition, mode = mode) if partition else None,
+            is_confirmed = lambda status: status is not None and status.mode == mode,
+            send = lambda: self.coordinator.client.set_partition_mode(request),
+        )
 
 
 class ClearPartitionAlarmMemoryButton(
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
     ButtonEntity,
 ):
@@ -126,7 +142,7 @@ class ClearPartitionAlarmMemoryButton(
             entry: ConfigEntry,
             partition: PartitionStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = partition.id)
 
         self.partition_id = partition.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_partition_{self.partition_id}_clear_alarm_memory"
@@ -147,6 +163,8 @@ class ClearPartitionAlarmMemoryButton(
 
 
 class PartitionAlarmMemoryBinarySensor(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimePartitionsUpdateCoordinator],
     BinarySensorEntity,
 ):
@@ -161,7 +179,7 @@ class PartitionAlarmMemoryBinarySensor(
             entry: ConfigEntry,
             partition: PartitionStatus
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = partition.id)
 
         self.partition_id = partition.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_partition_{self.partition_id}_alarm_memory"
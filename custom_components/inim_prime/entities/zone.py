@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
@@ -8,6 +10,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..coordinators import InimPrimeZonesUpdateCoordinator
 from ..const import INIM_PRIME_DEVICE_MANUFACTURER, CONF_SERIAL_NUMBER, DOMAIN
+from .common import ReportedStatusMixin, StaleAttributesMixin
 from inim_prime_api.models.zone import ZoneState, ZoneStatus, ZoneExclusionSetRequest
 
 
@@ -27,6 +30,8 @@ def create_zone_device_info(
 
 
 class ZoneStateBinarySensor(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
     BinarySensorEntity,
 ):
@@ -38,7 +43,7 @@ class ZoneStateBinarySensor(
             entry: ConfigEntry,
             zone: ZoneStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = zone.id)
 
         self.zone_id = zone.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_zone_{self.zone_id}_triggered"
@@ -62,6 +67,8 @@ class ZoneStateBinarySensor(
 
 
 class ZoneStateSensor(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
     SensorEntity,
 ):
@@ -76,7 +83,7 @@ class ZoneStateSensor(
             entry: ConfigEntry,
             zone: ZoneStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = zone.id)
 
         self.zone_id = zone.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_zone_{self.zone_id}_state"
@@ -96,6 +103,8 @@ class ZoneStateSensor(
 
 
 class ZoneAlarmMemoryBinarySensor(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
     BinarySensorEntity,
 ):
@@ -110,7 +119,7 @@ class ZoneAlarmMemoryBinarySensor(
             entry: ConfigEntry,
             zone: ZoneStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = zone.id)
 
         self.zone_id = zone.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_zone_{self.zone_id}_alarm_memory"
@@ -130,6 +139,8 @@ class ZoneAlarmMemoryBinarySensor(
 
 
 class ZoneExclusionSwitch(
+    StaleAttributesMixin,
+    ReportedStatusMixin,
     CoordinatorEntity[InimPrimeZonesUpdateCoordinator],
     SwitchEntity,
 ):
@@ -143,7 +154,7 @@ class ZoneExclusionSwitch(
             entry: ConfigEntry,
             zone: ZoneStatus,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context = zone.id)
 
         self.zone_id = zone.id
         self._attr_unique_id = f"{entry.data[CONF_SERIAL_NUMBER]}_zone_{self.zone_id}_exclusion"
@@ -164,12 +175,21 @@ class ZoneExclusionSwitch(
 
     async def async_turn_on(self, **kwargs):
         """Set zone as excluded."""
-        request = ZoneExclusionSetRequest(zone_id = self.zone_id, exclude = True)
-        await self.coordinator.client.set_zone_exclusion(request)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_exclusion(True)
 
     async def async_turn_off(self, **kwargs):
         """Set zone as included."""
-        request = ZoneExclusionSetRequest(zone_id = self.zone_id, exclude = False)
-        await self.coordinator.client.set_zone_exclusion(request)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_exclusion(False)
+
+    async def _async_set_exclusion(self, exclude: bool) -> None:
+        zone = self.coordinator.data.get(self.zone_id)
+        request = ZoneExclusionSetRequest(zone_id = self.zone_id, exclude = exclude)
+
+        # Shown at once, until the panel confirms the exclusion or the command times out.
+        await self.coordinator.async_command(
+            kind = "zone_exclusion",
+            status_id = self.zone_id,
+            optimistic_status = replace(zone, excluded = exclude) if zone else None,
+            is_confirmed = lambda status: status is not None and status.excluded == exclude,
+            send = lambda: self.coordinator.client.set_zone_exclusion(request),
+        )
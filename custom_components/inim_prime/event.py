@@ -15,4 +15,4 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
 
     entities.append(panel_log_events_event)
 
-    async_add_entities(entities, update_before_add = True)
+    async_add_entities(entities)
@@ -0,0 +1,142 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
+
+from inim_prime_api.models.partition import PartitionMode
+from .bulk import BulkResult, async_set_zones_exclusions, async_set_partitions_modes
+from ..const import CONF_ARMING_PROFILES
+from ..coordinators import InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Example:
+#
+# night:
+#   excluded_zones: [10, 11, 12]
+#   included_zones: [1, 2]
+#   partitions:
+#     1: TOTAL
+#     2: PARTIAL
+#
+# Partition IDs become strings once the options are saved, they are coerced back to int.
+ARMING_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("excluded_zones", default = []): [vol.Coerce(int)],
+        vol.Optional("included_zones", default = []): [vol.Coerce(int)],
+        vol.Optional("partitions", default = {}): {
+            vol.Coerce(int): vol.In([mode.name for mode in PartitionMode]),
+        },
+    }
+)
+
+ARMING_PROFILES_SCHEMA = vol.Schema(
+    {
+        vol.Coerce(str): ARMING_PROFILE_SCHEMA,
+    }
+)
+
+
+@dataclass
+class ArmingProfileResult:
+    """Outcome of the application of an arming profile."""
+    disarm: BulkResult = field(default_factory = BulkResult)
+    zones: BulkResult = field(default_factory = BulkResult)
+    arm: BulkResult = field(default_factory = BulkResult)
+    duration: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "disarm": self.disarm.as_dict(),
+            "zones": self.zones.as_dict(),
+            "arm": self.arm.as_dict(),
+            "duration": round(self.duration, 3),
+        }
+
+
+def get_arming_profiles(entry: ConfigEntry) -> Dict[str, dict]:
+    """Return the validated arming profiles from options."""
+    try:
+        return ARMING_PROFILES_SCHEMA(entry.options.get(CONF_ARMING_PROFILES) or {})
+    except vol.Invalid as err:
+        _LOGGER.warning("Invalid arming profiles, ignored: %s", err)
+        return {}
+
+
+async def async_apply_arming_profile(
+        zones_coordinator: InimPrimeZonesUpdateCoordinator,
+        partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
+        profile: dict,
+        max_concurrent: int,
+) -> ArmingProfileResult:
+    """Apply an arming profile with the minimal set of commands.
+
+    The commands are sent in an order that never arms a partition over a zone that
+    is about to be excluded, nor includes a zone in a partition that is about to be
+    disarmed: the partitions are disarmed first, then the zone exclusions are set,
+    then the other partitions are armed. Each phase is skipped when the current
+    state already matches, and the sequence stops at the first failed phase.
+    """
+    start = time.monotonic()
+    result = ArmingProfileResult()
+
+    modes = {
+        partition_id: PartitionMode[mode]
+        for partition_id, mode in profile["partitions"].items()
+    }
+    exclusions = {
+        **{zone_id: False for zone_id in profile["included_zones"]},
+        **{zone_id: True for zone_id in profile["excluded_zones"]},
+    }
+
+    phases = (
+        (
+            "disarm",
+            lambda: async_set_partitions_modes(
+                coordinator = partitions_coordinator,
+                modes = {
+                    partition_id: mode
+                    for partition_id, mode in modes.items()
+                    if mode == PartitionMode.DISARMED
+                },
+                max_concurrent = max_concurrent,
+            ),
+        ),
+        (
+            "zones",
+            lambda: async_set_zones_exclusions(
+                coordinator = zones_coordinator,
+                exclusions = exclusions,
+                max_concurrent = max_concurrent,
+            ),
+        ),
+        (
+            "arm",
+            lambda: async_set_partitions_modes(
+                coordinator = partitions_coordinator,
+                modes = {
+                    partition_id: mode
+                    for partition_id, mode in modes.items()
+                    if mode != PartitionMode.DISARMED
+                },
+                max_concurrent = max_concurrent,
+            ),
+        ),
+    )
+
+    for phase, async_apply in phases:
+        phase_result = await async_apply()
+        setattr(result, phase, phase_result)
+
+        if phase_result.failed:
+            result.duration = time.monotonic() - start
+            raise HomeAssistantError(
+                f"Arming profile stopped, {len(phase_result.failed)} commands failed: {phase_result.failed}"
+            )
+
+    result.duration = time.monotonic() - start
+    return result
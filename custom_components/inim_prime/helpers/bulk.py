@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from homeassistant.config_entries import ConfigEntry
+
+from inim_prime_api.models.partition import PartitionMode, SetPartitionModeRequest, ClearPartitionAlarmMemoryRequest
+from inim_prime_api.models.zone import ZoneExclusionSetRequest
+from ..const import CONF_BULK_MAX_CONCURRENT_WRITES, CONF_BULK_MAX_CONCURRENT_WRITES_DEFAULT
+from ..coordinators import InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk operation."""
+    changed: List[int] = field(default_factory = list)
+    skipped: List[int] = field(default_factory = list)
+    failed: Dict[int, str] = field(default_factory = dict)
+    duration: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "changed": self.changed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "duration": round(self.duration, 3),
+        }
+
+
+def get_max_concurrent_writes(entry: ConfigEntry) -> int:
+    # Return the maximum concurrent writes of the bulk operations from options.
+    return entry.options.get("commands", {}).get(
+        CONF_BULK_MAX_CONCURRENT_WRITES,
+        CONF_BULK_MAX_CONCURRENT_WRITES_DEFAULT,
+    )
+
+
+async def async_run_bulk(
+        ids: Iterable[int],
+        write: Callable[[int], Awaitable],
+        max_concurrent: int,
+        result: BulkResult,
+) -> None:
+    """Send `write` for every ID, at most `max_concurrent` at the same time."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _async_write(item_id: int) -> None:
+        async with semaphore:
+            try:
+                await write(item_id)
+            except Exception as err:
+                result.failed[item_id] = str(err) or type(err).__name__
+            else:
+                result.changed.append(item_id)
+
+    await asyncio.gather(*(_async_write(item_id) for item_id in ids))
+
+
+async def async_apply_bulk(
+        coordinator: InimPrimeZonesUpdateCoordinator | InimPrimePartitionsUpdateCoordinator,
+        requested: Dict[int, Any],
+        is_applied: Callable[[Any, Any], bool],
+        write: Callable[[int], Awaitable],
+        max_concurrent: int,
+        description: str,
+) -> BulkResult:
+    """Write the requested value of every ID, skipping the IDs it is already applied to.
+
+    `is_applied` compares the cached status of an ID with its requested value. The
+    cached data is trusted unless it is stale, a single refresh is requested at the end.
+    """
+    start = time.monotonic()
+    result = BulkResult()
+
+    to_write = []
+    for item_id, value in requested.items():
+        status = coordinator.data.get(item_id)
+        if status and coordinator.stale_since is None and is_applied(status, value):
+            result.skipped.append(item_id)
+        else:
+            to_write.append(item_id)
+
+    await async_run_bulk(
+        ids = to_write,
+        write = write,
+        max_concurrent = max_concurrent,
+        result = result,
+    )
+
+    if to_write:
+        await coordinator.async_request_refresh()
+
+    result.duration = time.monotonic() - start
+    _LOGGER.debug(
+        "%s: %d changed, %d skipped, %d failed in %.3f seconds",
+        description,
+        len(result.changed),
+        len(result.skipped),
+        len(result.failed),
+        result.duration,
+    )
+
+    return result
+
+
+async def async_set_zones_exclusion(
+        coordinator: InimPrimeZonesUpdateCoordinator,
+        zone_ids: Iterable[int],
+        exclude: bool,
+        max_concurrent: int,
+) -> BulkResult:
+    """Exclude or include the zones, skipping the zones already in the requested state."""
+    return await async_set_zones_exclusions(
+        coordinator = coordinator,
+        exclusions = {zone_id: exclude for zone_id in zone_ids},
+        max_concurrent = max_concurrent,
+    )
+
+
+async def async_set_zones_exclusions(
+        coordinator: InimPrimeZonesUpdateCoordinator,
+        exclusions: Dict[int, bool],
+        max_concurrent: int,
+) -> BulkResult:
+    """Set the exclusion of every zone, skipping the zones already in the requested state."""
+    return await async_apply_bulk(
+        coordinator = coordinator,
+        requested = exclusions,
+        is_applied = lambda zone, exclude: zone.excluded == exclude,
+        write = lambda zone_id: coordinator.client.set_zone_exclusion(
+            ZoneExclusionSetRequest(zone_id = zone_id, exclude = exclusions[zone_id])
+        ),
+        max_concurrent = max_concurrent,
+        description = "Zones exclusion set",
+    )
+
+
+async def async_set_partitions_mode(
+        coordinator: InimPrimePartitionsUpdateCoordinator,
+        partition_ids: Iterable[int],
+        mode: PartitionMode,
+        max_concurrent: int,
+) -> BulkResult:
+    """Set the mode of the partitions, skipping the partitions already in the requested mode."""
+    return await async_set_partitions_modes(
+        coordinator = coordinator,
+        modes = {partition_id: mode for partition_id in partition_ids},
+        max_concurrent = max_concurrent,
+    )
+
+
+async def async_set_partitions_modes(
+        coordinator: InimPrimePartitionsUpdateCoordinator,
+        modes: Dict[int, PartitionMode],
+        max_concurrent: int,
+) -> BulkResult:
+    """Set the mode of every partition, skipping the partitions already in the requested mode."""
+    return await async_apply_bulk(
+        coordinator = coordinator,
+        requested = modes,
+        is_applied = lambda partition, mode: partition.mode == mode,
+        write = lambda partition_id: coordinator.client.set_partition_mode(
+            SetPartitionModeRequest(partition_id = partition_id, mode = modes[partition_id])
+        ),
+        max_concurrent = max_concurrent,
+        description = "Partitions mode set",
+    )
+
+
+async def async_clear_partitions_alarm_memory(
+        coordinator: InimPrimePartitionsUpdateCoordinator,
+        max_concurrent: int,
+) -> BulkResult:
+    """Clear the alarm memory of the partitions that have one."""
+    return await async_apply_bulk(
+        coordinator = coordinator,
+        requested = dict.fromkeys(coordinator.data),
+        is_applied = lambda partition, _: not partition.alarm_memory,
+        write = lambda partition_id: coordinator.client.clear_partition_alarm_memory(
+            ClearPartitionAlarmMemoryRequest(partition_id = partition_id)
+        ),
+        max_concurrent = max_concurrent,
+        description = "Partitions alarm memory cleared",
+    )
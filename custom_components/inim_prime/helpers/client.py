@@ -0,0 +1,349 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from inim_prime_api import InimPrimeClient
+from inim_prime_api.models.gsm import GSMSStatus
+from inim_prime_api.models.log_event import LogEvent
+from inim_prime_api.models.partition import PartitionStatus
+from inim_prime_api.models.system_faults import SystemFaultsStatus
+from inim_prime_api.models.zone import ZoneStatus
+
+# Reads answered by the panel are served from the cache for this long. Short enough to
+# never hide a change from the next scheduled poll, long enough to absorb the reads of
+# a button press or a refresh request issued right after a poll.
+CLIENT_CACHE_TTL = 1.0
+
+# Slots only usable by user commands, so a command never waits for a background read to complete.
+COMMAND_RESERVED_SLOTS = 1
+
+
+class RequestPriority(IntEnum):
+    """Priority of a panel request, lower values are sent first."""
+    COMMAND = 0
+    STATUS = 1
+    LOG_EVENTS = 2
+    BACKGROUND = 3
+
+
+@dataclass
+class QueueStats:
+    """Queue statistics of a single request priority."""
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        if self.requests:
+            return self.total_wait / self.requests
+        return 0.0
+
+
+class PriorityRequestQueue:
+    """Bound the requests in flight against the panel, granting the free slots by priority.
+
+    Waiting requests are started in priority order, then in arrival order. User
+    commands can also use `COMMAND_RESERVED_SLOTS` extra slots, so they are sent at
+    once even when every other slot is held by a background read.
+    """
+
+    def __init__(self, max_in_flight: int):
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self.stats: Dict[RequestPriority, QueueStats] = {
+            priority: QueueStats() for priority in RequestPriority
+        }
+
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """Change the maximum requests in flight, requests already sent are not interrupted."""
+        self._max_in_flight = max_in_flight
+        self._wake()
+
+    def _has_free_slot(self, priority: RequestPriority) -> bool:
+        limit = self._max_in_flight
+        if priority == RequestPriority.COMMAND:
+            limit += COMMAND_RESERVED_SLOTS
+        return self._in_flight < limit
+
+    @asynccontextmanager
+    async def acquire(self, priority: RequestPriority):
+        start = time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        self._wake()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Granted and cancelled at the same time: give the slot back.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+        wait = time.monotonic() - start
+        stats = self.stats[priority]
+        stats.requests += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # Grant the free slots to the waiting requests, in priority order.
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if not self._has_free_slot(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Return the queue statistics of every priority."""
+        return {
+            priority.name.lower(): {
+                "requests": stats.requests,
+                "average_wait": round(stats.average_wait, 3),
+                "max_wait": round(stats.max_wait, 3),
+            }
+            for priority, stats in self.stats.items()
+        }
+
+
+@dataclass
+class ClientStats:
+    """Read statistics of the coalescing client."""
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class RequestTiming:
+    """Duration of the requests of a single kind, from sending to the decoded answer."""
+    requests: int = 0
+    failures: int = 0
+    first_duration: Optional[float] = None
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @property
+    def average_duration(self) -> float:
+        if self.requests:
+            return self.total_duration / self.requests
+        return 0.0
+
+    def record(self, duration: float, failed: bool) -> None:
+        self.requests += 1
+        self.failures += failed
+        if self.first_duration is None:
+            # Usually includes opening the connection to the panel.
+            self.first_duration = duration
+        self.last_duration = duration
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+class InimPrimeCoalescingClient:
+    """Client wrapper shared by all the coordinators and entities of a config entry.
+
+    Concurrent identical reads are collapsed into a single in-flight request, and the
+    result is served to the following reads for `CLIENT_CACHE_TTL` seconds. Writes are
+    forwarded to the client and invalidate every cached and in-flight read, so a read
+    issued after a write always reaches the panel. A read with a `max_age` of 0 reaches the
+    panel as well, without dropping the other cached reads. Every request goes through the
+    request queue, writes first, and is timed by kind once it left the queue. Any other
+    attribute is forwarded to the wrapped client.
+    """
+
+    def __init__(
+            self,
+            client: InimPrimeClient,
+            request_queue: PriorityRequestQueue,
+            ttl: float = CLIENT_CACHE_TTL,
+    ):
+        self.client = client
+        self.request_queue = request_queue
+        self.stats = ClientStats()
+        self.timings: Dict[str, RequestTiming] = {}
+
+        self._ttl = ttl
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        # In-flight reads, with the time they were sent.
+        self._in_flight: Dict[Hashable, Tuple[float, asyncio.Task]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    # ───────────────
+    # Reads
+    # ───────────────
+    async def get_zones_status(self, max_age: float | None = None) -> Dict[int, ZoneStatus]:
+        return await self._async_read(
+            "zones",
+            self.client.get_zones_status,
+            RequestPriority.STATUS,
+            max_age,
+        )
+
+    async def get_partitions_status(self, max_age: float | None = None) -> Dict[int, PartitionStatus]:
+        return await self._async_read(
+            "partitions",
+            self.client.get_partitions_status,
+            RequestPriority.STATUS,
+            max_age,
+        )
+
+    async def get_system_faults_status(self, max_age: float | None = None) -> SystemFaultsStatus:
+        return await self._async_read(
+            "system_faults",
+            self.client.get_system_faults_status,
+            RequestPriority.BACKGROUND,
+            max_age,
+        )
+
+    async def get_gsm_status(self) -> GSMSStatus:
+        return await self._async_read(
+            "gsm",
+            self.client.get_gsm_status,
+            RequestPriority.BACKGROUND,
+        )
+
+    async def get_log_events(self, limit: int) -> List[LogEvent]:
+        return await self._async_read(
+            ("log_events", limit),
+            lambda: self.client.get_log_events(limit = limit),
+            RequestPriority.LOG_EVENTS,
+        )
+
+    # ───────────────
+    # Writes
+    # ───────────────
+    async def set_zone_exclusion(self, request) -> Any:
+        return await self._async_write(
+            "set_zone_exclusion",
+            lambda: self.client.set_zone_exclusion(request),
+        )
+
+    async def set_partition_mode(self, request) -> Any:
+        return await self._async_write(
+            "set_partition_mode",
+            lambda: self.client.set_partition_mode(request),
+        )
+
+    async def clear_partition_alarm_memory(self, request) -> Any:
+        return await self._async_write(
+            "clear_partition_alarm_memory",
+            lambda: self.client.clear_partition_alarm_memory(request),
+        )
+
+    async def _async_write(self, kind: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        self.invalidate()
+        try:
+            return await self._async_queued(kind, send, RequestPriority.COMMAND)
+        finally:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the cached results, reads already in flight are not shared anymore."""
+        self._cache.clear()
+        self._in_flight.clear()
+
+    async def _async_read(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[Any]],
+            priority: RequestPriority,
+            max_age: float | None = None,
+    ) -> Any:
+        # `max_age` overrides the TTL for callers polling faster than it, 0 reaches the
+        # panel with a read sent after the call.
+        max_age = self._ttl if max_age is None else max_age
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            self.stats.hits += 1
+            return cached[1]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and time.monotonic() - in_flight[0] < max_age:
+            self.stats.coalesced += 1
+            # Shielded, so a cancelled caller does not cancel the read of the others.
+            return await asyncio.shield(in_flight[1])
+
+        self.stats.requests += 1
+        kind = key[0] if isinstance(key, tuple) else key
+        task = asyncio.get_running_loop().create_task(self._async_queued(kind, fetch, priority))
+        # Retrieve the exception even if every caller has been cancelled.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._in_flight[key] = (time.monotonic(), task)
+
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            # Only if not invalidated by a write, or replaced by a fresher read, in the meantime.
+            if self._in_flight.get(key, (None, None))[1] is task:
+                del self._in_flight[key]
+
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    self._cache[key] = (time.monotonic(), task.result())
+
+        return result
+
+    async def _async_queued(
+            self,
+            kind: str,
+            fetch: Callable[[], Awaitable[Any]],
+            priority: RequestPriority,
+    ) -> Any:
+        async with self.request_queue.acquire(priority):
+            timing = self.timings.setdefault(kind, RequestTiming())
+            start = time.monotonic()
+            try:
+                result = await fetch()
+            except Exception:
+                timing.record(time.monotonic() - start, failed = True)
+                raise
+            timing.record(time.monotonic() - start, failed = False)
+            return result
+
+    def get_stats(self) -> dict:
+        """Return the read and queue statistics."""
+        return {
+            "requests": self.stats.requests,
+            "hits": self.stats.hits,
+            "coalesced": self.stats.coalesced,
+            "queue": self.request_queue.get_stats(),
+            "timings": {
+                kind: {
+                    "requests": timing.requests,
+                    "failures": timing.failures,
+                    "first_duration": None if timing.first_duration is None else round(timing.first_duration, 3),
+                    "last_duration": round(timing.last_duration, 3),
+                    "average_duration": round(timing.average_duration, 3),
+                    "max_duration": round(timing.max_duration, 3),
+                }
+                for kind, timing in self.timings.items()
+            },
+        }
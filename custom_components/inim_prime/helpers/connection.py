@@ -0,0 +1,116 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.event import async_call_later
+
+from inim_prime_api import InimPrimeClient
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Clients connected by the config flow, waiting to be taken by the setup of the entry.
+DATA_FLOW_CLIENTS = f"{DOMAIN}_flow_clients"
+
+# A client not taken by then (flow abandoned) is closed.
+FLOW_CLIENT_HANDOVER_TIMEOUT = 120
+
+_ClientKey = Tuple[str, str, bool]
+
+
+@dataclass
+class ConnectionStats:
+    """How the client of a config entry has been connected."""
+    handed_over: bool = False
+    create_duration: float = 0.0
+    connect_duration: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "handed_over": self.handed_over,
+            "create_duration": round(self.create_duration, 3),
+            "connect_duration": round(self.connect_duration, 3),
+        }
+
+
+@callback
+def async_hand_over_client(
+        hass: HomeAssistant,
+        client: InimPrimeClient,
+        host: str,
+        api_key: str,
+        use_https: bool,
+) -> None:
+    """Keep a connected client for the setup of the entry, instead of closing it.
+
+    The connection (and its TLS session) opened to validate the input is then reused
+    by the entry. The client is closed if no setup takes it in time.
+    """
+    flow_clients: Dict[_ClientKey, Tuple[InimPrimeClient, CALLBACK_TYPE]] = hass.data.setdefault(
+        DATA_FLOW_CLIENTS, {}
+    )
+    key = (host, api_key, use_https)
+
+    previous = flow_clients.pop(key, None)
+    if previous:
+        previous[1]()
+        hass.async_create_background_task(previous[0].close(), name = f"{DOMAIN} - close flow client")
+
+    @callback
+    def async_expire(_now) -> None:
+        if flow_clients.get(key, (None,))[0] is client:
+            del flow_clients[key]
+            _LOGGER.debug("Closing the client of %s, not taken by any setup", host)
+            hass.async_create_background_task(client.close(), name = f"{DOMAIN} - close flow client")
+
+    flow_clients[key] = (client, async_call_later(hass, FLOW_CLIENT_HANDOVER_TIMEOUT, async_expire))
+
+
+@callback
+def async_take_flow_client(
+        hass: HomeAssistant,
+        host: str,
+        api_key: str,
+        use_https: bool,
+) -> Optional[InimPrimeClient]:
+    """Return the client handed over by the config flow for this panel, if any."""
+    handed_over = hass.data.get(DATA_FLOW_CLIENTS, {}).pop((host, api_key, use_https), None)
+    if handed_over is None:
+        return None
+
+    client, cancel_expire = handed_over
+    cancel_expire()
+    return client
+
+
+async def async_create_client(
+        hass: HomeAssistant,
+        host: str,
+        api_key: str,
+        use_https: bool,
+        stats: ConnectionStats | None = None,
+) -> InimPrimeClient:
+    """Return a connected client, reusing the one handed over by the config flow if any.
+
+    A new client is created on the event loop, which owns the connections it opens.
+    How long its creation took is kept in `stats`, to spot a constructor blocking
+    the loop.
+    """
+    stats = stats or ConnectionStats()
+
+    client = async_take_flow_client(hass, host, api_key, use_https)
+    if client is not None:
+        stats.handed_over = True
+        return client
+
+    start = time.monotonic()
+    client = InimPrimeClient(host = host, api_key = api_key, use_https = use_https)
+    stats.create_duration = time.monotonic() - start
+
+    start = time.monotonic()
+    await client.connect()
+    stats.connect_duration = time.monotonic() - start
+
+    return client
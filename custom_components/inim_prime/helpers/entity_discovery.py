@@ -0,0 +1,251 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from ..const import ZONES_COORDINATOR, PARTITIONS_COORDINATOR
+from ..coordinators import InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator, InimPrimePollScheduler
+from ..entities.partition import create_partition_device_info
+from ..entities.zone import create_zone_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+# Creates the entities of a platform for a single zone or partition status.
+EntityFactory = Callable[[Any], Iterable[Entity]]
+
+# A zone or partition no longer reported by the panel is retired (its device removed,
+# with its entities and their customizations) only once missing from this many
+# consecutive fresh fetches, and for this many seconds. Until then its entities are
+# unavailable, so a partial answer of the panel does not lose anything.
+DISCOVERY_RETIRE_AFTER_FETCHES = 5
+DISCOVERY_RETIRE_AFTER = 600
+
+_DEVICE_INFO_FACTORIES = {
+    ZONES_COORDINATOR: create_zone_device_info,
+    PARTITIONS_COORDINATOR: create_partition_device_info,
+}
+
+
+@dataclass
+class DiscoveryStats:
+    """Changes of the zones and partitions found on the panel after the setup."""
+    added: int = 0
+    missed: int = 0
+    retired: int = 0
+    renamed: int = 0
+
+
+class InimPrimeEntityDiscovery:
+    """Add, retire and rename the zone and partition entities as the panel changes.
+
+    Each platform registers with `async_add_platform` how to create its entities
+    for a single zone or partition. The entities of the IDs found by a later fetch
+    are then added to every platform, the devices of the IDs no longer reported are
+    removed with their entities, and renamed statuses rename their devices, without
+    reloading the entry.
+
+    Only fresh data is compared: stale or restored data, and an empty answer, are
+    never taken as the zones or partitions being gone. A missing ID is only retired
+    after `DISCOVERY_RETIRE_AFTER_FETCHES` fresh fetches and `DISCOVERY_RETIRE_AFTER`
+    seconds, its entities are unavailable meanwhile.
+    """
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            poll_scheduler: InimPrimePollScheduler,
+            zones_coordinator: InimPrimeZonesUpdateCoordinator,
+            partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
+    ):
+        self.hass = hass
+        self.entry = entry
+        self.poll_scheduler = poll_scheduler
+        self.coordinators = {
+            ZONES_COORDINATOR: zones_coordinator,
+            PARTITIONS_COORDINATOR: partitions_coordinator,
+        }
+        self.stats: Dict[str, DiscoveryStats] = {
+            coordinator_key: DiscoveryStats() for coordinator_key in self.coordinators
+        }
+
+        # Names of the statuses the entities have been created for, by ID.
+        self._names: Dict[str, Dict[int, str]] = {
+            coordinator_key: {
+                status_id: status.name
+                for status_id, status in (coordinator.data or {}).items()
+            }
+            for coordinator_key, coordinator in self.coordinators.items()
+        }
+        self._platforms: Dict[str, List[Tuple[AddEntitiesCallback, EntityFactory]]] = {
+            coordinator_key: [] for coordinator_key in self.coordinators
+        }
+
+        # IDs missing from the fresh data, with the time they went missing and the
+        # number of fresh fetches they were missing from.
+        self._missing: Dict[str, Dict[int, Tuple[float, int]]] = {
+            coordinator_key: {} for coordinator_key in self.coordinators
+        }
+        # Fresh fetch of each coordinator the missing IDs have been counted for.
+        self._counted_fetches: Dict[str, int] = {
+            coordinator_key: 0 for coordinator_key in self.coordinators
+        }
+
+    @callback
+    def async_add_platform(
+            self,
+            coordinator_key: str,
+            async_add_entities: AddEntitiesCallback,
+            create_entities: EntityFactory,
+    ) -> None:
+        """Add the entities of every known status now, and of the statuses discovered later."""
+        self._platforms[coordinator_key].append((async_add_entities, create_entities))
+
+        statuses = self.coordinators[coordinator_key].data or {}
+        async_add_entities(
+            [
+                entity
+                for status_id in self._names[coordinator_key]
+                if (status := statuses.get(status_id)) is not None
+                for entity in create_entities(status)
+            ]
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start following the coordinators, return the callback to stop."""
+        unsubscribes = [
+            coordinator.async_add_listener(
+                lambda coordinator_key = coordinator_key: self._async_sync(coordinator_key)
+            )
+            for coordinator_key, coordinator in self.coordinators.items()
+        ]
+
+        # The coordinators only call their listeners when something changed, the
+        # scheduled refreshes count the fetches an ID keeps missing from.
+        @callback
+        def async_tick(refreshed_coordinator) -> None:
+            for coordinator_key, coordinator in self.coordinators.items():
+                if coordinator is refreshed_coordinator:
+                    self._async_sync(coordinator_key)
+
+        unsubscribes.append(self.poll_scheduler.async_add_tick_listener(async_tick))
+
+        # The data may have changed while the platforms were set up.
+        for coordinator_key in self.coordinators:
+            self._async_sync(coordinator_key)
+
+        @callback
+        def async_stop() -> None:
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+
+        return async_stop
+
+    @callback
+    def _async_sync(self, coordinator_key: str) -> None:
+        """Compare the IDs and names of the fetched statuses with the known ones."""
+        coordinator = self.coordinators[coordinator_key]
+        statuses = coordinator.data
+
+        if not coordinator.last_update_success or coordinator.stale_since is not None or not statuses:
+            return
+
+        names = self._names[coordinator_key]
+        missing = self._missing[coordinator_key]
+        stats = self.stats[coordinator_key]
+
+        added_ids = statuses.keys() - names.keys()
+        renamed_ids = [
+            status_id
+            for status_id in statuses.keys() & names.keys()
+            if statuses[status_id].name != names[status_id]
+        ]
+
+        # Reported again, its entities are available again.
+        for status_id in missing.keys() & statuses.keys():
+            del missing[status_id]
+
+        retired_ids = []
+        if coordinator.fresh_fetches != self._counted_fetches[coordinator_key]:
+            self._counted_fetches[coordinator_key] = coordinator.fresh_fetches
+            now = time.monotonic()
+
+            for status_id in names.keys() - statuses.keys():
+                missing_since, missed_fetches = missing.get(status_id, (now, 0))
+                if not missed_fetches:
+                    stats.missed += 1
+                    _LOGGER.debug("%s %s not reported by the panel", coordinator.name, status_id)
+
+                missed_fetches += 1
+                if missed_fetches >= DISCOVERY_RETIRE_AFTER_FETCHES and now - missing_since >= DISCOVERY_RETIRE_AFTER:
+                    del missing[status_id]
+                    retired_ids.append(status_id)
+                else:
+                    missing[status_id] = (missing_since, missed_fetches)
+
+        if not (added_ids or retired_ids or renamed_ids):
+            return
+
+        device_registry = dr.async_get(self.hass)
+        create_device_info = _DEVICE_INFO_FACTORIES[coordinator_key]
+
+        for status_id in retired_ids:
+            name = names.pop(status_id)
+            device = device_registry.async_get_device(
+                identifiers = create_device_info(self.entry, status_id, name)["identifiers"]
+            )
+            if device is not None:
+                # Removing the device from the entry removes its entities as well.
+                device_registry.async_update_device(device.id, remove_config_entry_id = self.entry.entry_id)
+            stats.retired += 1
+
+        for status_id in renamed_ids:
+            name = names[status_id] = statuses[status_id].name
+            device_info = create_device_info(self.entry, status_id, name)
+            device = device_registry.async_get_device(identifiers = device_info["identifiers"])
+            if device is not None:
+                device_registry.async_update_device(device.id, name = device_info["name"])
+            stats.renamed += 1
+
+        if added_ids:
+            for status_id in added_ids:
+                names[status_id] = statuses[status_id].name
+            stats.added += len(added_ids)
+
+            for async_add_entities, create_entities in self._platforms[coordinator_key]:
+                async_add_entities(
+                    [
+                        entity
+                        for status_id in sorted(added_ids)
+                        for entity in create_entities(statuses[status_id])
+                    ]
+                )
+
+        _LOGGER.debug(
+            "%s changed on the panel: added %s, retired %s, renamed %s",
+            coordinator.name,
+            sorted(added_ids),
+            sorted(retired_ids),
+            renamed_ids,
+        )
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Return the discovery statistics by coordinator."""
+        return {
+            coordinator_key: {
+                "known": len(self._names[coordinator_key]),
+                "missing": sorted(self._missing[coordinator_key]),
+                "added": stats.added,
+                "missed": stats.missed,
+                "retired": stats.retired,
+                "renamed": stats.renamed,
+            }
+            for coordinator_key, stats in self.stats.items()
+        }
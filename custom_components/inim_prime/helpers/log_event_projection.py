@@ -0,0 +1,141 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from inim_prime_api.models.log_event import LogEvent
+from inim_prime_api.models.partition import PartitionMode
+from ..coordinators import InimPrimeZonesUpdateCoordinator, InimPrimePartitionsUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Projection rules, checked in order against the lowercase event type: the first rule
+# whose keywords all match (any keyword of each group) gives the target and the fields.
+# Types are free text in the language of the panel, so both English and Italian are matched.
+ZONE = "zone"
+PARTITION = "partition"
+
+# Whole words of the type, "end" must not match "pending".
+_RESTORE = {"restore", "restored", "end", "fine", "ripristino"}
+
+PROJECTION_RULES: Tuple[Tuple[Tuple[Tuple[str, ...], ...], str, Dict[str, Any]], ...] = (
+    # Disarm first: "disarm" contains "arm".
+    ((("disarm", "disinser"),), PARTITION, {"mode": PartitionMode.DISARMED}),
+    ((("arm", "inser"), ("total", "totale")), PARTITION, {"mode": PartitionMode.TOTAL}),
+    ((("arm", "inser"), ("partial", "parziale")), PARTITION, {"mode": PartitionMode.PARTIAL}),
+    ((("arm", "inser"), ("instant", "istantane")), PARTITION, {"mode": PartitionMode.INSTANT}),
+    ((("memor",), ("clear", "reset", "cancell")), PARTITION, {"alarm_memory": False}),
+    ((("exclu", "esclus", "bypass"),), ZONE, {"excluded": True}),
+    ((("inclu",),), ZONE, {"excluded": False}),
+    ((("alarm", "allarme"),), ZONE, {"alarm_memory": True}),
+)
+
+
+@dataclass
+class ProjectorStats:
+    """Matching statistics of the log event projector."""
+    events: int = 0
+    projected: int = 0
+    not_projectable: int = 0
+    unknown_location: int = 0
+
+
+def _normalize(name: Any) -> str:
+    return " ".join(str(name or "").split()).casefold()
+
+
+def match_projection_rule(event: LogEvent) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return the target and the fields projected by the event, None if not projectable."""
+    event_type = str(event.type or "").lower()
+
+    # Restores (end of an alarm, of a fault...) do not change the projected fields.
+    if _RESTORE.intersection(re.findall(r"\w+", event_type)):
+        return None
+
+    for keyword_groups, target, changes in PROJECTION_RULES:
+        if all(any(keyword in event_type for keyword in group) for group in keyword_groups):
+            return target, changes
+    return None
+
+
+class InimPrimeLogEventProjector:
+    """Apply the zone and partition changes reported by the log events between polls.
+
+    The location (or the agent) of an event is mapped to a zone or partition ID through
+    an index of the names, rebuilt only when a name is not found. The projected fields
+    are shown until the next fetch, which confirms or overrides them.
+    """
+
+    def __init__(
+            self,
+            zones_coordinator: InimPrimeZonesUpdateCoordinator,
+            partitions_coordinator: InimPrimePartitionsUpdateCoordinator,
+    ):
+        self.zones_coordinator = zones_coordinator
+        self.partitions_coordinator = partitions_coordinator
+        self.stats = ProjectorStats()
+
+        self._indexes: Dict[str, Dict[str, int]] = {ZONE: {}, PARTITION: {}}
+
+    @property
+    def _coordinators(self) -> Dict[str, Any]:
+        return {
+            ZONE: self.zones_coordinator,
+            PARTITION: self.partitions_coordinator,
+        }
+
+    def _rebuild_index(self, target: str) -> None:
+        self._indexes[target] = {
+            _normalize(status.name): status_id
+            for status_id, status in (self._coordinators[target].data or {}).items()
+        }
+
+    def _lookup(self, target: str, event: LogEvent) -> Optional[int]:
+        names = [_normalize(event.location), _normalize(event.agent)]
+
+        for rebuilt in (False, True):
+            if rebuilt:
+                self._rebuild_index(target)
+            index = self._indexes[target]
+            for name in names:
+                if name and name in index:
+                    return index[name]
+        return None
+
+    def project(self, events: List[LogEvent]) -> int:
+        """Project the events oldest first, return the number of statuses changed."""
+        projected = 0
+
+        for event in sorted(events, key = lambda event: (event.timestamp, event.id)):
+            self.stats.events += 1
+
+            rule = match_projection_rule(event)
+            if rule is None:
+                self.stats.not_projectable += 1
+                continue
+
+            target, changes = rule
+            status_id = self._lookup(target, event)
+            if status_id is None:
+                self.stats.unknown_location += 1
+                continue
+
+            if self._coordinators[target].async_project(status_id, changes):
+                projected += 1
+
+        self.stats.projected += projected
+        if projected:
+            _LOGGER.debug("Projected %d status changes from %d log events", projected, len(events))
+
+        return projected
+
+    def get_stats(self) -> dict:
+        """Return the matching and reconciliation statistics."""
+        return {
+            "events": self.stats.events,
+            "projected": self.stats.projected,
+            "not_projectable": self.stats.not_projectable,
+            "unknown_location": self.stats.unknown_location,
+            "zones": self.zones_coordinator.get_projection_stats(),
+            "partitions": self.partitions_coordinator.get_projection_stats(),
+        }
@@ -0,0 +1,221 @@
+import logging
+from datetime import timedelta
+from typing import Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from ..const import (
+    DOMAIN,
+
+    # --- Coordinators ---
+    PANEL_LOG_EVENTS_COORDINATOR,
+    ZONES_COORDINATOR,
+    PARTITIONS_COORDINATOR,
+    GSM_COORDINATOR,
+    SYSTEM_FAULTS_COORDINATOR,
+
+    # --- Panel log events ---
+    CONF_PANEL_LOG_EVENTS_FETCH_LIMIT,
+
+    # --- Scan intervals ---
+    CONF_ZONES_SCAN_INTERVAL,
+    CONF_PARTITIONS_SCAN_INTERVAL,
+    CONF_GSM_SCAN_INTERVAL,
+    CONF_SYSTEM_FAULTS_SCAN_INTERVAL,
+    CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL,
+    CONF_ZONES_SCAN_INTERVAL_DEFAULT,
+    CONF_PARTITIONS_SCAN_INTERVAL_DEFAULT,
+    CONF_GSM_SCAN_INTERVAL_DEFAULT,
+    CONF_SYSTEM_FAULTS_SCAN_INTERVAL_DEFAULT,
+    CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL_DEFAULT,
+    CONF_SCAN_INTERVAL_MAX,
+
+    # --- Polling ---
+    CONF_POLL_REQUESTS_PER_SECOND,
+    CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+    CONF_POLL_MAX_IN_FLIGHT,
+    CONF_POLL_MAX_IN_FLIGHT_DEFAULT,
+    CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+    CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+    CONF_ADAPTIVE_QUIET_PERIOD,
+    CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+    CONF_ALARM_WATCH_INTERVAL,
+    CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+    CONF_LOG_EVENT_REFRESH,
+    CONF_LOG_EVENT_REFRESH_DEFAULT,
+    CONF_LOG_EVENT_REFRESH_STRETCH,
+    CONF_LOG_EVENT_REFRESH_STRETCH_DEFAULT,
+
+    # --- Commands ---
+    CONF_BULK_MAX_CONCURRENT_WRITES,
+
+    # --- Resilience ---
+    CONF_STALE_MAX_FAILURES,
+    CONF_STALE_MAX_AGE,
+    CONF_CIRCUIT_BREAKER_THRESHOLD,
+    CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Options applied to the running entry, any other change reloads the entry.
+# The fetch limit, stale tolerance, setup and bulk concurrency are
+# read from the options whenever they are used, so they need nothing more.
+LIVE_OPTIONS = {
+    CONF_PANEL_LOG_EVENTS_FETCH_LIMIT,
+    # Nested by the options flow, flat when created by the config flow
+    "scan_intervals",
+    CONF_ZONES_SCAN_INTERVAL,
+    CONF_PARTITIONS_SCAN_INTERVAL,
+    CONF_GSM_SCAN_INTERVAL,
+    CONF_SYSTEM_FAULTS_SCAN_INTERVAL,
+    CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL,
+}
+# Live options of each section, by section.
+LIVE_SECTION_OPTIONS = {
+    "polling": {
+        CONF_POLL_REQUESTS_PER_SECOND,
+        CONF_POLL_MAX_IN_FLIGHT,
+        CONF_SETUP_MAX_CONCURRENT_REFRESHES,
+        CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+        CONF_ADAPTIVE_QUIET_PERIOD,
+        CONF_ALARM_WATCH_INTERVAL,
+        CONF_LOG_EVENT_REFRESH_STRETCH,
+    },
+    "resilience": {
+        CONF_STALE_MAX_FAILURES,
+        CONF_STALE_MAX_AGE,
+        CONF_CIRCUIT_BREAKER_THRESHOLD,
+    },
+    "commands": {
+        CONF_BULK_MAX_CONCURRENT_WRITES,
+    },
+    "experimental": set(),
+}
+
+
+def get_scan_intervals(entry: ConfigEntry) -> Dict[str, int]:
+    """Return the scan interval of every coordinator, by coordinator key."""
+    scan_intervals = entry.options.get("scan_intervals", {})
+    polling = entry.options.get("polling", {})
+
+    intervals = {
+        ZONES_COORDINATOR: scan_intervals.get(
+            CONF_ZONES_SCAN_INTERVAL,
+            CONF_ZONES_SCAN_INTERVAL_DEFAULT,
+        ),
+        PARTITIONS_COORDINATOR: scan_intervals.get(
+            CONF_PARTITIONS_SCAN_INTERVAL,
+            CONF_PARTITIONS_SCAN_INTERVAL_DEFAULT,
+        ),
+        SYSTEM_FAULTS_COORDINATOR: scan_intervals.get(
+            CONF_SYSTEM_FAULTS_SCAN_INTERVAL,
+            CONF_SYSTEM_FAULTS_SCAN_INTERVAL_DEFAULT,
+        ),
+        PANEL_LOG_EVENTS_COORDINATOR: scan_intervals.get(
+            CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL,
+            CONF_PANEL_LOG_EVENTS_SCAN_INTERVAL_DEFAULT,
+        ),
+        GSM_COORDINATOR: scan_intervals.get(
+            CONF_GSM_SCAN_INTERVAL,
+            CONF_GSM_SCAN_INTERVAL_DEFAULT,
+        ),
+    }
+
+    # With the event-driven refresh, zones, partitions and system faults are refreshed
+    # as soon as a log event affects them, so their scheduled polls can be much rarer.
+    if polling.get(CONF_LOG_EVENT_REFRESH, CONF_LOG_EVENT_REFRESH_DEFAULT):
+        stretch = polling.get(
+            CONF_LOG_EVENT_REFRESH_STRETCH,
+            CONF_LOG_EVENT_REFRESH_STRETCH_DEFAULT,
+        )
+        for coordinator_key in (ZONES_COORDINATOR, PARTITIONS_COORDINATOR, SYSTEM_FAULTS_COORDINATOR):
+            scan_interval = intervals[coordinator_key]
+            intervals[coordinator_key] = min(scan_interval * stretch, max(CONF_SCAN_INTERVAL_MAX, scan_interval))
+
+    return intervals
+
+
+def _changed_keys(previous: dict, current: dict) -> set:
+    return {
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key) != current.get(key)
+    }
+
+
+def requires_reload(previous_data: dict, previous_options: dict, entry: ConfigEntry) -> bool:
+    """Return True if the entry changed beyond the options applied in place."""
+    if previous_data != dict(entry.data):
+        return True
+
+    changed = _changed_keys(previous_options, dict(entry.options))
+    if changed - LIVE_OPTIONS - LIVE_SECTION_OPTIONS.keys():
+        return True
+
+    return any(
+        _changed_keys(
+            previous_options.get(section_key, {}),
+            entry.options.get(section_key, {}),
+        ) - live_options
+        for section_key, live_options in LIVE_SECTION_OPTIONS.items()
+    )
+
+
+@callback
+def async_apply_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the live options to the running entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    polling = entry.options.get("polling", {})
+
+    coordinators = data["coordinators"]
+    poll_scheduler = data["poll_scheduler"]
+    adaptive_polling = data.get("adaptive_polling")
+    alarm_watch = data.get("alarm_watch")
+
+    poll_scheduler.budget.configure(
+        requests_per_second = polling.get(
+            CONF_POLL_REQUESTS_PER_SECOND,
+            CONF_POLL_REQUESTS_PER_SECOND_DEFAULT,
+        ),
+    )
+    data["client"].request_queue.set_max_in_flight(
+        polling.get(CONF_POLL_MAX_IN_FLIGHT, CONF_POLL_MAX_IN_FLIGHT_DEFAULT),
+    )
+
+    poll_scheduler.breaker_threshold = entry.options.get("resilience", {}).get(
+        CONF_CIRCUIT_BREAKER_THRESHOLD,
+        CONF_CIRCUIT_BREAKER_THRESHOLD_DEFAULT,
+    )
+
+    scan_intervals = get_scan_intervals(entry)
+
+    if adaptive_polling:
+        adaptive_polling.armed_scan_interval = polling.get(
+            CONF_ADAPTIVE_ARMED_SCAN_INTERVAL,
+            CONF_ADAPTIVE_ARMED_SCAN_INTERVAL_DEFAULT,
+        )
+        adaptive_polling.quiet_period = polling.get(
+            CONF_ADAPTIVE_QUIET_PERIOD,
+            CONF_ADAPTIVE_QUIET_PERIOD_DEFAULT,
+        )
+
+    for coordinator_key, scan_interval in scan_intervals.items():
+        coordinator = coordinators[coordinator_key]
+
+        if adaptive_polling and coordinator in adaptive_polling.scan_intervals:
+            # The adaptive polling owns these intervals, it only needs the new baseline.
+            adaptive_polling.scan_intervals[coordinator] = scan_interval
+        else:
+            poll_scheduler.async_set_interval(coordinator, timedelta(seconds = scan_interval))
+
+    if adaptive_polling:
+        adaptive_polling.async_evaluate()
+
+    if alarm_watch:
+        alarm_watch.interval = polling.get(
+            CONF_ALARM_WATCH_INTERVAL,
+            CONF_ALARM_WATCH_INTERVAL_DEFAULT,
+        )
@@ -1,9 +1,50 @@
+import math
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from homeassistant.helpers.storage import Store
 
 from inim_prime_api import InimPrimeClient
-from inim_prime_api.helpers.log_events import filter_new_log_events
 from inim_prime_api.models.log_event import LogEvent
+from ..const import (
+    CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX,
+    CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_TRIGGER,
+    ZONES_COORDINATOR,
+    PARTITIONS_COORDINATOR,
+    SYSTEM_FAULTS_COORDINATOR,
+)
+
+# The dedupe ring must cover the largest window fetched from the panel, so that every
+# already ingested event of a fetched window is still known.
+PANEL_LOG_EVENTS_RECENT_IDS_MAX = CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX
+
+# Weight of the older polls in the event rate estimate, every quiet poll shrinks it by this factor.
+PANEL_LOG_EVENTS_RATE_DECAY = 0.7
+# Margin applied to the estimated number of new events when sizing the fetch window.
+PANEL_LOG_EVENTS_WINDOW_HEADROOM = 1.5
+
+# Events recovered at startup are replayed in batches of this size.
+PANEL_LOG_EVENTS_REPLAY_BATCH_SIZE = 20
+
+# Delay used to coalesce the watermark writes, pending writes are flushed on unload and HA stop.
+PANEL_LOG_EVENTS_SAVE_DELAY = 30
+
+# The panel reports the event type as free text, in the language set on the panel.
+# An event affects a coordinator when its type contains one of these keywords (lowercase),
+# an event matching no keyword affects all of them.
+PANEL_LOG_EVENT_TYPE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    ZONES_COORDINATOR: (
+        "zone", "zona", "alarm", "allarme", "bypass", "exclu", "esclus", "inclu",
+    ),
+    PARTITIONS_COORDINATOR: (
+        "partition", "area", "arm", "inserim", "disinser", "alarm", "allarme", "memor",
+    ),
+    SYSTEM_FAULTS_COORDINATOR: (
+        "fault", "guasto", "tamper", "manomission", "battery", "batteria", "mains", "supply", "alimentaz",
+    ),
+}
 
 
 # ───────────────
@@ -39,8 +80,180 @@ def deserialize_panel_log_events(data: list[dict]) -> List[LogEvent]:
     return [deserialize_panel_log_event(d) for d in data]
 
 
+def compress_ids(ids: List[int]) -> List[List[int]]:
+    """Encode IDs as [first, count] runs of consecutive IDs, the panel IDs are mostly consecutive."""
+    runs: List[List[int]] = []
+    for event_id in ids:
+        if runs and runs[-1][0] + runs[-1][1] == event_id:
+            runs[-1][1] += 1
+        else:
+            runs.append([event_id, 1])
+    return runs
+
+
+def expand_ids(runs: List[List[int]]) -> List[int]:
+    return [first + offset for first, count in runs for offset in range(count)]
+
+
+# ───────────────
+# Event classification
+# ───────────────
+def classify_panel_log_event(event: LogEvent) -> Set[str]:
+    """Return the keys of the coordinators affected by the event, empty when unknown."""
+    event_type = str(event.type or "").lower()
+    return {
+        coordinator_key
+        for coordinator_key, keywords in PANEL_LOG_EVENT_TYPE_KEYWORDS.items()
+        if any(keyword in event_type for keyword in keywords)
+    }
+
+
+# ───────────────
+# High-water mark
+# ───────────────
+class PanelLogEventsWatermark:
+    """High-water mark of the ingested panel log events.
+
+    Keeps the ID and timestamp of the newest ingested event, plus a bounded ring of the
+    most recently ingested IDs for O(1) membership checks. Events older than the
+    watermark, or already in the ring, are not new.
+    """
+
+    def __init__(self, max_recent_ids: int = PANEL_LOG_EVENTS_RECENT_IDS_MAX):
+        self.last_id: Optional[int] = None
+        self.last_timestamp: Optional[datetime] = None
+
+        self._recent_ids: Deque[int] = deque(maxlen = max_recent_ids)
+        self._recent_ids_set: Set[int] = set()
+
+    def is_new(self, event: LogEvent) -> bool:
+        if self.last_timestamp is not None and event.timestamp < self.last_timestamp:
+            return False
+        return event.id not in self._recent_ids_set
+
+    def filter_new(self, events: List[LogEvent]) -> List[LogEvent]:
+        """Return the events not ingested yet, in the order provided."""
+        return [event for event in events if self.is_new(event)]
+
+    def add(self, events: List[LogEvent]) -> None:
+        """Mark the events as ingested and move the watermark forward."""
+        for event in events:
+            if event.id in self._recent_ids_set:
+                continue
+
+            self._remember(event.id)
+
+            if self.last_timestamp is None or event.timestamp >= self.last_timestamp:
+                self.last_id = event.id
+                self.last_timestamp = event.timestamp
+
+    def _remember(self, event_id: int) -> None:
+        # The deque drops its oldest ID when full, the set must drop it too.
+        if len(self._recent_ids) == self._recent_ids.maxlen:
+            self._recent_ids_set.discard(self._recent_ids[0])
+        self._recent_ids.append(event_id)
+        self._recent_ids_set.add(event_id)
+
+    def as_dict(self) -> dict:
+        return {
+            "last_id": self.last_id,
+            "last_timestamp": self.last_timestamp.isoformat() if self.last_timestamp else None,
+            "recent_ids": list(self._recent_ids),
+        }
+
+    def as_storage(self) -> dict:
+        """Return the compact on-disk representation."""
+        return {
+            "id": self.last_id,
+            "ts": self.last_timestamp.isoformat() if self.last_timestamp else None,
+            "recent": compress_ids(list(self._recent_ids)),
+        }
+
+    @classmethod
+    def from_storage(cls, data: dict) -> "PanelLogEventsWatermark":
+        watermark = cls()
+        watermark.last_id = data.get("id")
+        if data.get("ts"):
+            watermark.last_timestamp = datetime.fromisoformat(data["ts"])
+        for event_id in expand_ids(data.get("recent", [])):
+            watermark._remember(event_id)
+        return watermark
+
+    @classmethod
+    def from_panel_log_events(cls, events: List[LogEvent]) -> "PanelLogEventsWatermark":
+        """Build the watermark from a window of already ingested events, oldest first."""
+        watermark = cls()
+        watermark.add(sorted(events, key = lambda event: event.timestamp))
+        return watermark
+
+
+class PanelLogEventsStore(Store[dict]):
+    """Store of the panel log events watermark, in the compact layout of `as_storage`."""
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        if old_major_version == 1:
+            # First layout: the full window of the last fetched events.
+            watermark = PanelLogEventsWatermark.from_panel_log_events(
+                deserialize_panel_log_events(old_data.get("logs", []))
+            )
+            return watermark.as_storage()
+        return old_data
+
+
+# ───────────────
+# Fetch window sizing
+# ───────────────
+@dataclass
+class PanelLogEventsFetchStats:
+    """Fetch statistics of the panel log events coordinator."""
+    polls: int = 0
+    requests: int = 0
+    saturations: int = 0
+    last_window: int = 0
+    backfill_recovered: int = 0
+    # None when unknown, or when the backfill has not run
+    backfill_unrecovered: Optional[int] = None
+    # Refreshes triggered by the new events, by coordinator key
+    event_refreshes: Dict[str, int] = field(default_factory = dict)
+    unclassified_events: int = 0
+
+    @property
+    def requests_per_poll(self) -> float:
+        if self.polls:
+            return self.requests / self.polls
+        return 0.0
+
+
+class PanelLogEventsWindowEstimator:
+    """Size the log events fetch window from the recently observed event rate.
+
+    The estimate jumps to the number of new events of a busy poll and decays on the
+    quiet ones, so a burst is covered by a single request at the next poll while a
+    quiet panel goes back to the trigger window. The window always leaves room for
+    at least one already known event: a window filled with new events is saturated.
+    """
+
+    def __init__(self):
+        self.events_per_poll = 0.0
+
+    def window(self, limit: int) -> int:
+        """Return the fetch window for the next poll, between the trigger window and `limit`."""
+        expected = math.ceil(self.events_per_poll * PANEL_LOG_EVENTS_WINDOW_HEADROOM)
+        return max(
+            CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_TRIGGER,
+            min(limit, expected + CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_TRIGGER),
+        )
+
+    def observe(self, new_events: int) -> None:
+        """Record the number of new events found by a poll."""
+        self.events_per_poll = max(
+            float(new_events),
+            self.events_per_poll * PANEL_LOG_EVENTS_RATE_DECAY,
+        )
+
+
 async def async_fetch_panel_log_events(
-        last_panel_log_events: List[LogEvent],
+        watermark: PanelLogEventsWatermark,
         client: InimPrimeClient,
         limit: int,
 ) -> tuple[Optional[List[LogEvent]], Optional[List[LogEvent]]]:
@@ -50,10 +263,35 @@ async def async_fetch_panel_log_events(
         # Return None in case of issues with the client
         return None, None
 
-    # Compare with last saved logs
-    current_panel_log_events_filtered = filter_new_log_events(
-        last_log_events = last_panel_log_events,
-        current_log_events = current_panel_log_events,
-    )
+    # Keep only the events above the watermark
+    current_panel_log_events_filtered = watermark.filter_new(current_panel_log_events)
 
     return current_panel_log_events, current_panel_log_events_filtered
+
+
+async def async_backfill_panel_log_events(
+        watermark: PanelLogEventsWatermark,
+        client: InimPrimeClient,
+) -> tuple[List[LogEvent], Optional[int]]:
+    """Recover the events added since the watermark, with a single fetch of the maximum window.
+
+    The panel only returns its most recent events, so no more can be recovered than
+    the maximum window. Return the new events in chronological order, and the number
+    of events that could not be recovered (None when unknown). Client errors are raised.
+    """
+    events = await client.get_log_events(limit = CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX)
+    new_events = watermark.filter_new(events)
+
+    # A known event in the window, or a panel log shorter than the window: nothing is missing.
+    if len(new_events) < len(events) or len(events) < CONF_PANEL_LOG_EVENTS_FETCH_LIMIT_MAX:
+        unrecovered = 0
+    else:
+        # Estimate the gap from the event IDs, which the panel assigns incrementally.
+        oldest_id = min(event.id for event in new_events) if new_events else None
+        if isinstance(oldest_id, int) and isinstance(watermark.last_id, int):
+            unrecovered = max(0, oldest_id - watermark.last_id - 1)
+        else:
+            unrecovered = None
+
+    new_events = sorted(new_events, key = lambda event: (event.timestamp, event.id))
+    return new_events, unrecovered
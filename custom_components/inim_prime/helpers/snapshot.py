@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from inim_prime_api.models.gsm import GSMSStatus
+from inim_prime_api.models.partition import PartitionStatus, PartitionState, PartitionMode
+from inim_prime_api.models.system_faults import SystemFaultsStatus, SystemFault
+from inim_prime_api.models.zone import ZoneStatus, ZoneState
+from ..const import (
+    DOMAIN,
+    CONF_SERIAL_NUMBER,
+    STORAGE_KEY_PANEL_SNAPSHOT,
+    ZONES_COORDINATOR,
+    PARTITIONS_COORDINATOR,
+    SYSTEM_FAULTS_COORDINATOR,
+    GSM_COORDINATOR,
+)
+
+# Delay used to coalesce the snapshot writes, the snapshot only needs to be
+# reasonably recent to create the entities at the next startup. The delay is not
+# restarted by the updates received meanwhile, so a snapshot is written at least
+# this often while the coordinators keep updating.
+SNAPSHOT_SAVE_DELAY = 60
+
+SNAPSHOT_COORDINATORS = (
+    ZONES_COORDINATOR,
+    PARTITIONS_COORDINATOR,
+    SYSTEM_FAULTS_COORDINATOR,
+    GSM_COORDINATOR,
+)
+
+
+# ───────────────
+# Serialization helpers
+# ───────────────
+def serialize_zone_status(zone: ZoneStatus) -> dict:
+    return {
+        "id": zone.id,
+        "name": zone.name,
+        "state": zone.state.name,
+        "excluded": zone.excluded,
+        "alarm_memory": zone.alarm_memory,
+    }
+
+
+def deserialize_zone_status(data: dict) -> ZoneStatus:
+    return ZoneStatus(
+        id = data["id"],
+        name = data["name"],
+        state = ZoneState[data["state"]],
+        excluded = data["excluded"],
+        alarm_memory = data["alarm_memory"],
+    )
+
+
+def serialize_partition_status(partition: PartitionStatus) -> dict:
+    return {
+        "id": partition.id,
+        "name": partition.name,
+        "state": partition.state.name,
+        "mode": partition.mode.name,
+        "alarm_memory": partition.alarm_memory,
+    }
+
+
+def deserialize_partition_status(data: dict) -> PartitionStatus:
+    return PartitionStatus(
+        id = data["id"],
+        name = data["name"],
+        state = PartitionState[data["state"]],
+        mode = PartitionMode[data["mode"]],
+        alarm_memory = data["alarm_memory"],
+    )
+
+
+def serialize_system_faults_status(system_faults: SystemFaultsStatus) -> dict:
+    return {
+        "supply_voltage": system_faults.supply_voltage,
+        "faults": [fault.name for fault in system_faults.faults],
+    }
+
+
+def deserialize_system_faults_status(data: dict) -> SystemFaultsStatus:
+    return SystemFaultsStatus(
+        supply_voltage = data.get("supply_voltage"),
+        faults = frozenset(SystemFault[fault] for fault in data.get("faults", [])),
+    )
+
+
+def serialize_gsm_status(gsm: GSMSStatus) -> dict:
+    return {
+        "supply_voltage": gsm.supply_voltage,
+        "firmware_version": gsm.firmware_version,
+        "operator": gsm.operator,
+        "signal_strength": gsm.signal_strength,
+        "credit": gsm.credit,
+    }
+
+
+def deserialize_gsm_status(data: dict) -> GSMSStatus:
+    return GSMSStatus(
+        supply_voltage = data.get("supply_voltage"),
+        firmware_version = data.get("firmware_version"),
+        operator = data.get("operator"),
+        signal_strength = data.get("signal_strength"),
+        credit = data.get("credit"),
+    )
+
+
+class InimPrimeSnapshotStore:
+    """Persist the last good zones, partitions, system faults and GSM data.
+
+    The snapshot is restored into the coordinators at startup, so the entities can
+    be created before the panel answers. Restored coordinators are flagged with
+    `stale_since` until their first successful refresh.
+
+    Only the statuses reported by the panel are saved, never the optimistic statuses
+    of the commands or the ones projected from log events.
+    """
+    STORAGE_VERSION = 1
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            coordinators: Dict[str, DataUpdateCoordinator],
+    ):
+        self.hass = hass
+        self.coordinators = coordinators
+
+        self.store = Store(
+            hass,
+            self.STORAGE_VERSION,
+            f"{DOMAIN}_{entry.data[CONF_SERIAL_NUMBER]}_{STORAGE_KEY_PANEL_SNAPSHOT}",
+        )
+
+        # Set while a delayed save is scheduled.
+        self._save_pending = False
+
+    async def async_restore(self) -> bool:
+        """Restore the last snapshot into the coordinators, return True if restored."""
+        stored_data = await self.store.async_load()
+        if not stored_data or not stored_data.get("zones") or not stored_data.get("partitions"):
+            return False
+
+        try:
+            zones = {
+                zone.id: zone
+                for zone in (deserialize_zone_status(d) for d in stored_data["zones"])
+            }
+            partitions = {
+                partition.id: partition
+                for partition in (deserialize_partition_status(d) for d in stored_data["partitions"])
+            }
+            system_faults = deserialize_system_faults_status(stored_data["system_faults"])
+            gsm = deserialize_gsm_status(stored_data["gsm"])
+            saved_at = datetime.fromisoformat(stored_data["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            # An unreadable snapshot is not an error, the integration just starts cold.
+            return False
+
+        for key, data in zip(
+                SNAPSHOT_COORDINATORS,
+                (zones, partitions, system_faults, gsm),
+        ):
+            coordinator = self.coordinators[key]
+            coordinator.data = data
+            coordinator.stale_since = saved_at
+
+        return True
+
+    @callback
+    def async_track_coordinators(self) -> CALLBACK_TYPE:
+        """Save a new snapshot whenever a coordinator refreshes successfully."""
+        unsubs = [
+            self.coordinators[key].async_add_listener(
+                self._handle_coordinator_update
+            )
+            for key in SNAPSHOT_COORDINATORS
+        ]
+
+        @callback
+        def async_untrack() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return async_untrack
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._save_pending:
+            return
+
+        # Never persist a snapshot that still contains restored (stale) data.
+        if all(
+                self.coordinators[key].last_update_success and
+                self.coordinators[key].stale_since is None
+                for key in SNAPSHOT_COORDINATORS
+        ):
+            self._save_pending = True
+            self.store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        self._save_pending = False
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "zones": [
+                serialize_zone_status(zone)
+                for zone in self.coordinators[ZONES_COORDINATOR].fetched_data.values()
+            ],
+            "partitions": [
+                serialize_partition_status(partition)
+                for partition in self.coordinators[PARTITIONS_COORDINATOR].fetched_data.values()
+            ],
+            "system_faults": serialize_system_faults_status(
+                self.coordinators[SYSTEM_FAULTS_COORDINATOR].data
+            ),
+            "gsm": serialize_gsm_status(
+                self.coordinators[GSM_COORDINATOR].data
+            ),
+        }
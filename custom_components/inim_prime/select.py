@@ -1,16 +1,29 @@
-from .coordinators import InimPrimePartitionsUpdateCoordinator
-from .const import DOMAIN, PARTITIONS_COORDINATOR
+from .coordinators import InimPrimePartitionsUpdateCoordinator, InimPrimeZonesUpdateCoordinator
+from .const import DOMAIN, PARTITIONS_COORDINATOR, ZONES_COORDINATOR
+from .entities.panel import ArmingProfileSelect
 from .entities.partition import PartitionModeSelect
+from .helpers.arming_profiles import get_arming_profiles
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinators = hass.data[DOMAIN][entry.entry_id]["coordinators"]
 
     partitions_coordinator: InimPrimePartitionsUpdateCoordinator = coordinators[PARTITIONS_COORDINATOR]
+    zones_coordinator: InimPrimeZonesUpdateCoordinator = coordinators[ZONES_COORDINATOR]
+    entity_discovery: InimPrimeEntityDiscovery = hass.data[DOMAIN][entry.entry_id]["entity_discovery"]
+
+    # Also added for the partitions found later
+    entity_discovery.async_add_platform(
+        PARTITIONS_COORDINATOR,
+        async_add_entities,
+        lambda partition: [PartitionModeSelect(partitions_coordinator, entry, partition)],
+    )
 
     entities = []
 
-    for partition in partitions_coordinator.data.values():
-        entities.append(PartitionModeSelect(partitions_coordinator, entry, partition))
+    arming_profiles = get_arming_profiles(entry)
+    if arming_profiles:
+        entities.append(ArmingProfileSelect(zones_coordinator, partitions_coordinator, entry, arming_profiles))
 
-    async_add_entities(entities, update_before_add = True)
+    async_add_entities(entities)
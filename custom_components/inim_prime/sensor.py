@@ -4,37 +4,61 @@ from .coordinators import (
     InimPrimeGSMUpdateCoordinator,
     InimPrimeSystemFaultsUpdateCoordinator,
 )
-from .const import DOMAIN, ZONES_COORDINATOR, PARTITIONS_COORDINATOR, GSM_COORDINATOR, SYSTEM_FAULTS_COORDINATOR
+from .const import DOMAIN, ZONES_COORDINATOR, PARTITIONS_COORDINATOR, GSM_COORDINATOR, SYSTEM_FAULTS_COORDINATOR, \
+    PANEL_LOG_EVENTS_COORDINATOR
 from .entities.gsm import GSMSupplyVoltageSensor, GSMOperatorSensor, GSMSignalStrengthSensor, GSMCreditSensor
 from .entities.panel import PanelSupplyVoltageSensor, ExcludedZonesCountSensor, ZonesAlarmMemoryCountSensor, \
-    PartitionsAlarmMemoryCountSensor
+    PartitionsAlarmMemoryCountSensor, ZonesAlarmCountSensor, ArmedPartitionsCountSensor, ScanIntervalSensor
 from .entities.partition import PartitionStateSensor
 from .entities.zone import ZoneStateSensor
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
+
+SCAN_INTERVAL_SENSORS = {
+    ZONES_COORDINATOR: ("zones", "Zones"),
+    PARTITIONS_COORDINATOR: ("partitions", "Partitions"),
+    SYSTEM_FAULTS_COORDINATOR: ("system_faults", "System Faults"),
+    GSM_COORDINATOR: ("gsm", "GSM"),
+    PANEL_LOG_EVENTS_COORDINATOR: ("panel_log_events", "Panel Log Events"),
+}
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinators = hass.data[DOMAIN][entry.entry_id]["coordinators"]
+    poll_scheduler = hass.data[DOMAIN][entry.entry_id]["poll_scheduler"]
 
     zones_coordinator: InimPrimeZonesUpdateCoordinator = coordinators[ZONES_COORDINATOR]
     partitions_coordinator: InimPrimePartitionsUpdateCoordinator = coordinators[PARTITIONS_COORDINATOR]
     gsm_coordinator: InimPrimeGSMUpdateCoordinator = coordinators[GSM_COORDINATOR]
     system_faults_coordinator: InimPrimeSystemFaultsUpdateCoordinator = coordinators[SYSTEM_FAULTS_COORDINATOR]
+    entity_discovery: InimPrimeEntityDiscovery = hass.data[DOMAIN][entry.entry_id]["entity_discovery"]
 
-    entities = []
-
-    # Zone sensors
-    for zone in zones_coordinator.data.values():
-        entities.append(ZoneStateSensor(zones_coordinator, entry, zone))
+    # Zone and partition sensors, also added for the zones and partitions found later
+    entity_discovery.async_add_platform(
+        ZONES_COORDINATOR,
+        async_add_entities,
+        lambda zone: [ZoneStateSensor(zones_coordinator, entry, zone)],
+    )
+    entity_discovery.async_add_platform(
+        PARTITIONS_COORDINATOR,
+        async_add_entities,
+        lambda partition: [PartitionStateSensor(partitions_coordinator, entry, partition)],
+    )
 
-    # Partition sensors
-    for partition in partitions_coordinator.data.values():
-        entities.append(PartitionStateSensor(partitions_coordinator, entry, partition))
+    entities = []
 
     # Panel sensors
     entities.append(PanelSupplyVoltageSensor(system_faults_coordinator, entry))
     entities.append(ExcludedZonesCountSensor(zones_coordinator, entry))
     entities.append(ZonesAlarmMemoryCountSensor(zones_coordinator, entry))
     entities.append(PartitionsAlarmMemoryCountSensor(partitions_coordinator, entry))
+    entities.append(ZonesAlarmCountSensor(zones_coordinator, entry))
+    entities.append(ArmedPartitionsCountSensor(partitions_coordinator, entry))
+
+    # Poll scheduler sensors
+    for coordinator_key, (key, name) in SCAN_INTERVAL_SENSORS.items():
+        entities.append(
+            ScanIntervalSensor(poll_scheduler, coordinators[coordinator_key], entry, key, name)
+        )
 
     # GSM sensors
     entities.append(GSMSupplyVoltageSensor(gsm_coordinator, entry))
@@ -42,4 +66,4 @@ async def async_setup_entry(hass, entry, async_add_entities):
     entities.append(GSMSignalStrengthSensor(gsm_coordinator, entry))
     entities.append(GSMCreditSensor(gsm_coordinator, entry))
 
-    async_add_entities(entities, update_before_add = True)
+    async_add_entities(entities)
@@ -0,0 +1,124 @@
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from inim_prime_api.models.partition import PartitionMode
+from .const import (
+    DOMAIN,
+    ZONES_COORDINATOR,
+    PARTITIONS_COORDINATOR,
+    SERVICE_SET_ZONES_EXCLUSION,
+    SERVICE_SET_PARTITIONS_MODE,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ZONE_IDS,
+    ATTR_PARTITION_IDS,
+    ATTR_EXCLUDE,
+    ATTR_MODE,
+)
+from .helpers.bulk import (
+    BulkResult,
+    async_set_zones_exclusion,
+    async_set_partitions_mode,
+    get_max_concurrent_writes,
+)
+
+SET_ZONES_EXCLUSION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ZONE_IDS): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Required(ATTR_EXCLUDE): cv.boolean,
+    }
+)
+
+SET_PARTITIONS_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARTITION_IDS): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Required(ATTR_MODE): vol.In([mode.name for mode in PartitionMode]),
+    }
+)
+
+
+def _get_entry(hass: HomeAssistant, call: ServiceCall) -> ConfigEntry:
+    """Return the loaded config entry targeted by the call."""
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+        if not entries:
+            raise ServiceValidationError(f"Panel {entry_id} is not loaded")
+    elif len(entries) != 1:
+        raise ServiceValidationError("A panel must be specified when more than one panel is configured")
+
+    return entries[0]
+
+
+def _check_ids(ids: list[int], known_ids, kind: str) -> None:
+    unknown_ids = [item_id for item_id in ids if item_id not in known_ids]
+    if unknown_ids:
+        raise ServiceValidationError(f"Unknown {kind} IDs: {unknown_ids}")
+
+
+def _response(call: ServiceCall, result: BulkResult, kind: str) -> ServiceResponse:
+    """Return the result of the bulk operation, failures included.
+
+    A call without response raises on failures, with the whole result in the error.
+    """
+    if result.failed and not call.return_response:
+        raise HomeAssistantError(
+            f"Failed to set {len(result.failed)} {kind}: {result.as_dict()}"
+        )
+    return result.as_dict()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the INIM Prime services."""
+
+    async def async_handle_set_zones_exclusion(call: ServiceCall) -> ServiceResponse:
+        entry = _get_entry(hass, call)
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinators"][ZONES_COORDINATOR]
+        _check_ids(call.data[ATTR_ZONE_IDS], coordinator.data, "zone")
+
+        result = await async_set_zones_exclusion(
+            coordinator = coordinator,
+            zone_ids = call.data[ATTR_ZONE_IDS],
+            exclude = call.data[ATTR_EXCLUDE],
+            max_concurrent = get_max_concurrent_writes(entry),
+        )
+        return _response(call, result, "zones")
+
+    async def async_handle_set_partitions_mode(call: ServiceCall) -> ServiceResponse:
+        entry = _get_entry(hass, call)
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinators"][PARTITIONS_COORDINATOR]
+        _check_ids(call.data[ATTR_PARTITION_IDS], coordinator.data, "partition")
+
+        result = await async_set_partitions_mode(
+            coordinator = coordinator,
+            partition_ids = call.data[ATTR_PARTITION_IDS],
+            mode = PartitionMode[call.data[ATTR_MODE]],
+            max_concurrent = get_max_concurrent_writes(entry),
+        )
+        return _response(call, result, "partitions")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ZONES_EXCLUSION,
+        async_handle_set_zones_exclusion,
+        schema = SET_ZONES_EXCLUSION_SCHEMA,
+        supports_response = SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PARTITIONS_MODE,
+        async_handle_set_partitions_mode,
+        schema = SET_PARTITIONS_MODE_SCHEMA,
+        supports_response = SupportsResponse.OPTIONAL,
+    )
@@ -1,16 +1,18 @@
 from .coordinators import InimPrimeZonesUpdateCoordinator
 from .const import DOMAIN, ZONES_COORDINATOR
 from .entities.zone import ZoneExclusionSwitch
+from .helpers.entity_discovery import InimPrimeEntityDiscovery
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinators = hass.data[DOMAIN][entry.entry_id]["coordinators"]
 
     zones_coordinator: InimPrimeZonesUpdateCoordinator = coordinators[ZONES_COORDINATOR]
+    entity_discovery: InimPrimeEntityDiscovery = hass.data[DOMAIN][entry.entry_id]["entity_discovery"]
 
-    entities = []
-
-    for zone in zones_coordinator.data.values():
-        entities.append(ZoneExclusionSwitch(zones_coordinator, entry, zone))
-
-    async_add_entities(entities, update_before_add = True)
+    # Also added for the zones found later
+    entity_discovery.async_add_platform(
+        ZONES_COORDINATOR,
+        async_add_entities,
+        lambda zone: [ZoneExclusionSwitch(zones_coordinator, entry, zone)],
+    )